@@ -0,0 +1 @@
+"""Reproducible load benchmarks: ``python -m benchmarks.generate`` then ``python -m benchmarks.run``."""
@@ -0,0 +1,93 @@
+"""Minimal in-process ASGI client: no sockets, no HTTP parsing."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Iterable, NamedTuple, Optional
+from urllib.parse import urlencode
+
+
+class Response(NamedTuple):
+    status: int
+    headers: list[tuple[bytes, bytes]]
+    body: bytes
+
+
+class ASGIClient:
+    def __init__(self, app: Any) -> None:
+        self._app = app
+        self._lifespan: Optional[asyncio.Task] = None
+        self._lifespan_queue: "asyncio.Queue[dict]" = asyncio.Queue()
+        self._lifespan_events: "asyncio.Queue[dict]" = asyncio.Queue()
+
+    async def startup(self) -> None:
+        scope = {"type": "lifespan", "asgi": {"version": "3.0"}, "state": {}}
+        self._lifespan = asyncio.create_task(
+            self._app(scope, self._lifespan_queue.get, self._lifespan_events.put)
+        )
+        await self._lifespan_queue.put({"type": "lifespan.startup"})
+        message = await self._lifespan_events.get()
+        if message["type"] != "lifespan.startup.complete":
+            raise RuntimeError(f"startup failed: {message}")
+
+    async def shutdown(self) -> None:
+        if self._lifespan is None:
+            return
+        await self._lifespan_queue.put({"type": "lifespan.shutdown"})
+        await self._lifespan_events.get()
+        await self._lifespan
+        self._lifespan = None
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Optional[dict[str, Any]] = None,
+        headers: Iterable[tuple[str, str]] = (),
+        body: bytes = b"",
+    ) -> Response:
+        raw_headers = [(k.lower().encode("latin-1"), v.encode("latin-1")) for k, v in headers]
+        if body:
+            raw_headers.append((b"content-length", str(len(body)).encode()))
+        scope = {
+            "type": "http",
+            # 2.4 lets streaming responses skip the disconnect listener.
+            "asgi": {"version": "3.0", "spec_version": "2.4"},
+            "http_version": "1.1",
+            "method": method,
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": urlencode(params or {}, doseq=True).encode(),
+            "root_path": "",
+            "headers": [(b"host", b"bench")] + raw_headers,
+            "client": ("127.0.0.1", 50000),
+            "server": ("bench", 80),
+            "state": {},
+        }
+        sent = False
+
+        async def receive() -> dict:
+            nonlocal sent
+            if not sent:
+                sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            # Only reached when the app waits for a disconnect (streaming).
+            await asyncio.Event().wait()
+            return {"type": "http.disconnect"}
+
+        status = 0
+        response_headers: list[tuple[bytes, bytes]] = []
+        chunks: list[bytes] = []
+
+        async def send(message: dict) -> None:
+            nonlocal status, response_headers
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                response_headers = list(message.get("headers", []))
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        await self._app(scope, receive, send)
+        return Response(status, response_headers, b"".join(chunks))
@@ -0,0 +1,210 @@
+"""Generate a synthetic catalog, reviews and likes in a standalone SQLite file.
+
+Usage::
+
+    python -m benchmarks.generate --db /tmp/bench.sqlite --titles 50000 --reviews 10000000
+
+The output is deterministic for a given ``--seed``. ``WEBTOON_DB_PATH`` is
+pointed at ``--db`` before the application modules are imported, so the
+schema, migrations, search index, rating stats, histograms and hot scores are
+produced by the same code the server runs.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import sqlite3
+import time
+from typing import Iterator, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger("benchmarks.generate")
+
+DAYS = ("MON", "TUE", "WED", "THR", "FRI", "SAT", "SUN")
+TAGS = ("액션", "로맨스", "개그", "무협", "스릴러", "일상", "판타지", "드라마", "학원", "스포츠")
+WORDS = (
+    "나", "혼자만", "레벨업", "전지적", "독자", "시점", "외모지상주의", "신의", "탑",
+    "무림", "학사", "회귀", "귀환", "마법사", "검", "왕", "기사", "아카데미", "천재", "소녀",
+)
+REVIEW_PERIOD_SECONDS = 365 * 24 * 3600
+REVIEW_EPOCH = 1_700_000_000
+INSERT_CHUNK = 100_000
+
+
+def webtoon_id(index: int) -> str:
+    return f"bench_{index}"
+
+
+def _catalog_rows(rng: np.random.Generator, titles: int) -> Iterator[tuple]:
+    word_picks = rng.integers(0, len(WORDS), size=(titles, 3))
+    day_picks = rng.integers(0, len(DAYS), size=(titles, 2))
+    two_days = rng.random(titles) < 0.1
+    tag_picks = rng.integers(0, len(TAGS), size=(titles, 3))
+    for i in range(titles):
+        title = " ".join(WORDS[w] for w in word_picks[i]) + f" {i}"
+        days = DAYS[day_picks[i, 0]]
+        if two_days[i]:
+            days += "," + DAYS[day_picks[i, 1]]
+        tags = ",".join(dict.fromkeys(TAGS[t] for t in tag_picks[i]))
+        yield (
+            webtoon_id(i),
+            f"https://example.invalid/{i}.png",
+            title,
+            days,
+            f"작가{i % 997}",
+            f"{title}의 줄거리 이야기 {i}",
+            tags,
+        )
+
+
+def _review_targets(rng: np.random.Generator, titles: int, reviews: int) -> np.ndarray:
+    # Zipf-like popularity: a few titles collect most reviews, like the real catalog.
+    weights = 1.0 / np.arange(1, titles + 1) ** 0.8
+    weights /= weights.sum()
+    order = rng.permutation(titles)
+    return order[rng.choice(titles, size=reviews, p=weights)]
+
+
+def _chunks(rows: Iterator[tuple], size: int) -> Iterator[list[tuple]]:
+    chunk: list[tuple] = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def generate(
+    db_path: str,
+    *,
+    titles: int,
+    reviews: int,
+    likes: int,
+    seed: int,
+) -> dict[str, int]:
+    if os.path.exists(db_path):
+        raise SystemExit(f"{db_path} already exists; remove it or pick another --db")
+
+    os.environ["WEBTOON_DB_PATH"] = db_path
+    # Imported late so every module binds to the benchmark database.
+    from webtoon.database import get_db
+    from webtoon.db import init_db
+    from webtoon.db.session import new_write_session
+    from webtoon.services.catalog import ensure_catalog_indexes, ensure_catalog_revision
+    from webtoon.services.review_service import ReviewService
+    from webtoon.services.search_index import ensure_search_index
+
+    rng = np.random.default_rng(seed)
+
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "CREATE TABLE normalized_webtoon "
+        "(id TEXT, thumbnail TEXT, title TEXT, updateDays TEXT, authors TEXT, synopsis TEXT, tags TEXT)"
+    )
+    for chunk in _chunks(_catalog_rows(rng, titles), INSERT_CHUNK):
+        conn.executemany("INSERT INTO normalized_webtoon VALUES (?, ?, ?, ?, ?, ?, ?)", chunk)
+    conn.commit()
+    conn.close()
+    logger.info("Inserted %d titles", titles)
+
+    init_db()
+
+    conn = sqlite3.connect(db_path)
+    # init_db already switched the file to WAL; durability is irrelevant here.
+    conn.execute("PRAGMA synchronous = OFF")
+
+    targets = _review_targets(rng, titles, reviews)
+    liked = rng.integers(0, reviews, size=likes) if reviews else np.empty(0, dtype=np.int64)
+    like_counts = np.bincount(liked, minlength=reviews)
+    ratings = rng.integers(0, 11, size=reviews) / 2
+    created = REVIEW_EPOCH + np.sort(rng.integers(0, REVIEW_PERIOD_SECONDS, size=reviews))
+
+    started = time.perf_counter()
+    for start in range(0, reviews, INSERT_CHUNK):
+        stop = min(start + INSERT_CHUNK, reviews)
+        stamps = [
+            time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(int(ts)))
+            for ts in created[start:stop]
+        ]
+        conn.executemany(
+            "INSERT INTO reviews "
+            "(id, webtoon_id, content, rating, likes, anonymous_user_id, created_at, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                (
+                    i + 1,
+                    webtoon_id(int(targets[i])),
+                    f"synthetic review {i}",
+                    float(ratings[i]),
+                    int(like_counts[i]),
+                    f"bench-{i:09d}",
+                    stamps[i - start],
+                    stamps[i - start],
+                )
+                for i in range(start, stop)
+            ),
+        )
+        conn.commit()
+        logger.info("Inserted %d/%d reviews (%.0fs)", stop, reviews, time.perf_counter() - started)
+
+    for start in range(0, likes, INSERT_CHUNK):
+        stop = min(start + INSERT_CHUNK, likes)
+        conn.executemany(
+            "INSERT INTO review_likes (review_id, anonymous_user_id) VALUES (?, ?)",
+            ((int(liked[j]) + 1, f"liker-{j:09d}") for j in range(start, stop)),
+        )
+        conn.commit()
+    logger.info("Inserted %d likes", likes)
+
+    conn.execute("ANALYZE")
+    conn.close()
+
+    db = new_write_session()
+    try:
+        service = ReviewService(db)
+        service.rebuild_rating_stats()
+        service.rebuild_rating_histograms()
+        # Raw inserts leave every hot_score at its default of 0.
+        service.refresh_hot_scores(since=None)
+    finally:
+        db.close()
+
+    conn, _ = get_db()
+    try:
+        ensure_search_index(conn)
+        ensure_catalog_revision(conn)
+        ensure_catalog_indexes(conn)
+    finally:
+        conn.close()
+
+    return {"titles": titles, "reviews": reviews, "likes": likes, "seed": seed}
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.generate")
+    parser.add_argument("--db", required=True, help="SQLite file to create.")
+    parser.add_argument("--titles", type=int, default=50_000)
+    parser.add_argument("--reviews", type=int, default=1_000_000)
+    parser.add_argument("--likes", type=int, default=None, help="Defaults to reviews / 2.")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
+    summary = generate(
+        args.db,
+        titles=args.titles,
+        reviews=args.reviews,
+        likes=args.reviews // 2 if args.likes is None else args.likes,
+        seed=args.seed,
+    )
+    print(json.dumps(summary))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+"""Drive every endpoint in-process and report latency, throughput and memory as JSON.
+
+Usage::
+
+    python -m benchmarks.run --db /tmp/bench.sqlite --requests 2000 --concurrency 16
+
+Requests go straight into the ASGI app (no sockets), so the numbers reflect
+the application, ``ReviewService`` and SQLite rather than the network stack.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import resource
+import sqlite3
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Any, Optional, Sequence
+
+import numpy as np
+
+from benchmarks.asgi import ASGIClient
+from benchmarks.scenarios import SCENARIOS, Context, Scenario
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def current_rss_bytes() -> int:
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * _PAGE_SIZE
+    except OSError:
+        # ru_maxrss is KiB on Linux and bytes on macOS; only the peak is available.
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+class RSSSampler:
+    """Track the peak resident set size while a scenario runs."""
+
+    def __init__(self, interval: float = 0.005) -> None:
+        self._interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.peak = 0
+
+    def __enter__(self) -> "RSSSampler":
+        self.peak = current_rss_bytes()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, current_rss_bytes())
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            self.peak = max(self.peak, current_rss_bytes())
+
+
+async def run_scenario(
+    client: ASGIClient,
+    ctx: Context,
+    scenario: Scenario,
+    *,
+    requests: int,
+    concurrency: int,
+    warmup: int,
+    accept_encoding: str,
+) -> dict[str, Any]:
+    extra_headers = (("accept-encoding", accept_encoding),) if accept_encoding else ()
+    for i in range(warmup):
+        request = scenario.build(ctx, -1 - i)
+        await client.request(
+            request.method, request.path,
+            params=request.params, headers=request.headers + extra_headers, body=request.body,
+        )
+
+    latencies = np.zeros(requests, dtype=np.float64)
+    statuses: Counter[int] = Counter()
+    encodings: Counter[str] = Counter()
+    response_bytes = 0
+    counter = iter(range(requests))
+
+    async def worker() -> None:
+        nonlocal response_bytes
+        for i in counter:
+            request = scenario.build(ctx, i)
+            started = time.perf_counter()
+            try:
+                response = await client.request(
+                    request.method, request.path,
+                    params=request.params, headers=request.headers + extra_headers, body=request.body,
+                )
+            except Exception:
+                statuses[0] += 1
+            else:
+                statuses[response.status] += 1
+                encodings[_content_encoding(response.headers)] += 1
+                response_bytes += len(response.body)
+            latencies[i] = time.perf_counter() - started
+
+    with RSSSampler() as rss:
+        started = time.perf_counter()
+        cpu_started = time.process_time()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        cpu = time.process_time() - cpu_started
+        elapsed = time.perf_counter() - started
+
+    p50, p95, p99 = np.percentile(latencies * 1000, [50, 95, 99])
+    return {
+        "endpoint": scenario.name,
+        "requests": requests,
+        "concurrency": concurrency,
+        "status_codes": {str(code): count for code, count in sorted(statuses.items())},
+        "errors": sum(count for code, count in statuses.items() if code == 0 or code >= 500),
+        "p50_ms": round(float(p50), 3),
+        "p95_ms": round(float(p95), 3),
+        "p99_ms": round(float(p99), 3),
+        "mean_ms": round(float(latencies.mean() * 1000), 3),
+        "rps": round(requests / elapsed, 1),
+        # Bytes as sent by the app, i.e. after compression when it applies.
+        "avg_response_bytes": round(response_bytes / requests, 1),
+        "content_encodings": dict(sorted(encodings.items())),
+        # Process CPU (all threads) per request: routing, SQL, JSON encoding, compression.
+        "cpu_ms_per_request": round(cpu * 1000 / requests, 3),
+        "peak_rss_mb": round(rss.peak / 2**20, 1),
+    }
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    from webtoon.main import app
+    from webtoon.responses import JSON_ENCODER
+
+    ctx = Context.load(args.db)
+    scenarios = [
+        scenario
+        for scenario in SCENARIOS
+        if (not args.only or any(part in scenario.name for part in args.only))
+        and not (args.skip_writes and scenario.writes)
+    ]
+
+    client = ASGIClient(app)
+    await client.startup()
+    try:
+        results = []
+        for scenario in scenarios:
+            result = await run_scenario(
+                client, ctx, scenario,
+                requests=args.requests, concurrency=args.concurrency, warmup=args.warmup,
+                accept_encoding=args.accept_encoding,
+            )
+            print(
+                f"{result['endpoint']:<40} p50={result['p50_ms']:>8}ms "
+                f"p99={result['p99_ms']:>8}ms rps={result['rps']:>9} "
+                f"bytes={result['avg_response_bytes']:>10} cpu={result['cpu_ms_per_request']:>7}ms",
+                file=sys.stderr,
+            )
+            results.append(result)
+    finally:
+        await client.shutdown()
+
+    return {
+        "meta": {
+            "db": args.db,
+            "titles": _count(args.db, "normalized_webtoon"),
+            "reviews": _count(args.db, "reviews"),
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "json_encoder": JSON_ENCODER,
+            "accept_encoding": args.accept_encoding,
+            "platform": platform.platform(),
+            "env": {k: v for k, v in sorted(os.environ.items()) if k.startswith("WEBTOON_")},
+        },
+        "endpoints": results,
+    }
+
+
+def _content_encoding(headers: list[tuple[bytes, bytes]]) -> str:
+    for name, value in headers:
+        if name == b"content-encoding":
+            return value.decode("latin-1")
+    return "identity"
+
+
+def _count(db_path: str, table: str) -> int:
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run")
+    parser.add_argument("--db", required=True, help="Database created by benchmarks.generate.")
+    parser.add_argument("--requests", type=int, default=1000, help="Measured requests per endpoint.")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument(
+        "--only", action="append", help="Run endpoints whose name contains this (repeatable)."
+    )
+    parser.add_argument(
+        "--accept-encoding",
+        default="gzip, br",
+        help="Accept-Encoding sent with every request (use 'identity' to measure uncompressed bytes).",
+    )
+    parser.add_argument("--skip-writes", action="store_true", help="Skip POST/PUT scenarios.")
+    parser.add_argument("--output", help="Write the JSON report here instead of stdout.")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.db):
+        raise SystemExit(f"{args.db} does not exist; run python -m benchmarks.generate first")
+    # Must be set before any webtoon module is imported.
+    os.environ["WEBTOON_DB_PATH"] = args.db
+    # Every scenario comes from one client address; measure the endpoints, not the limiter.
+    os.environ.setdefault("WEBTOON_RATE_LIMIT", "0")
+
+    report = asyncio.run(run(args))
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            fh.write(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,242 @@
+"""One scenario per endpoint in ``webtoon/routers``.
+
+Each scenario turns a request counter into a request, using ids sampled from
+the benchmark database so lookups hit real rows. Write scenarios use a fresh
+anonymous id per request so they never collide with earlier runs.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import sqlite3
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Callable, NamedTuple, Optional
+
+DAYS = ("MON", "TUE", "WED", "THR", "FRI", "SAT", "SUN")
+SEARCH_TERMS = ("레벨업", "혼자만", "마법사", "아카데미", "개그", "작가1")
+SUGGEST_TERMS = ("나", "나 혼", "레벨", "ㄴㅎㅈ", "ㅅㅇ", "작가")
+
+
+class Request(NamedTuple):
+    method: str
+    path: str
+    params: Optional[dict[str, Any]] = None
+    headers: tuple[tuple[str, str], ...] = ()
+    body: bytes = b""
+
+
+@dataclass
+class Context:
+    """Ids sampled once from the database before the run."""
+
+    webtoon_ids: list[str]
+    reviewed_webtoon_ids: list[str]
+    review_ids: list[int]
+    authors: list[tuple[str, str]]
+    run_id: str = field(default_factory=lambda: uuid.uuid4().hex[:8])
+    rng: random.Random = field(default_factory=lambda: random.Random(7))
+
+    @classmethod
+    def load(cls, db_path: str, sample: int = 1000) -> "Context":
+        conn = sqlite3.connect(db_path)
+        try:
+            webtoon_ids = [r[0] for r in conn.execute(
+                "SELECT id FROM normalized_webtoon ORDER BY random() LIMIT ?", (sample,)
+            )]
+            reviewed = [r[0] for r in conn.execute(
+                "SELECT webtoon_id FROM webtoon_rating_stats WHERE review_count > 0 "
+                "ORDER BY random() LIMIT ?",
+                (sample,),
+            )]
+            review_ids = [r[0] for r in conn.execute(
+                "SELECT id FROM reviews ORDER BY random() LIMIT ?", (sample,)
+            )]
+            authors = [(r[0], r[1]) for r in conn.execute(
+                "SELECT webtoon_id, anonymous_user_id FROM reviews ORDER BY random() LIMIT ?",
+                (sample,),
+            )]
+        finally:
+            conn.close()
+        return cls(webtoon_ids, reviewed, review_ids, authors)
+
+    def pick(self, values: list) -> Any:
+        return self.rng.choice(values)
+
+    def anon(self, kind: str, i: int) -> tuple[tuple[str, str], ...]:
+        return (("cookie", f"anon_id=bench-{kind}-{self.run_id}-{i}"),)
+
+
+JSON_HEADERS: tuple[tuple[str, str], ...] = (("content-type", "application/json"),)
+
+
+def _review_body(i: int) -> bytes:
+    return json.dumps({"content": f"benchmark review {i}", "rating": (i % 11) / 2}).encode()
+
+
+class Scenario(NamedTuple):
+    name: str
+    build: Callable[[Context, int], Request]
+    writes: bool = False
+
+
+SCENARIOS: list[Scenario] = [
+    Scenario("GET /", lambda ctx, i: Request("GET", "/")),
+    Scenario(
+        "GET /webtoons",
+        lambda ctx, i: Request("GET", "/webtoons", {"page": 1 + i % 50}),
+    ),
+    Scenario(
+        "GET /webtoons?webtoon_id",
+        lambda ctx, i: Request("GET", "/webtoons", {"webtoon_id": ctx.pick(ctx.webtoon_ids)}),
+    ),
+    Scenario(
+        "GET /webtoons?tags&days",
+        lambda ctx, i: Request(
+            "GET",
+            "/webtoons",
+            {
+                "tags": ("액션", "로맨스,일상", "학원", "판타지,액션")[i % 4],
+                "days": ",".join((DAYS[i % 7], DAYS[(i + 3) % 7])),
+                "match": ("all", "any")[i % 2],
+                "page": 1 + i % 3,
+            },
+        ),
+    ),
+    Scenario(
+        "GET /webtoons/top",
+        lambda ctx, i: Request(
+            "GET", "/webtoons/top", {"by": ("rating", "reviews", "recent")[i % 3], "limit": 20}
+        ),
+    ),
+    Scenario(
+        "POST /webtoons/batch",
+        lambda ctx, i: Request(
+            "POST",
+            "/webtoons/batch",
+            headers=JSON_HEADERS,
+            body=json.dumps({"ids": ctx.rng.sample(ctx.webtoon_ids, 40)}).encode(),
+        ),
+    ),
+    Scenario("GET /webtoons_title", lambda ctx, i: Request("GET", "/webtoons_title")),
+    Scenario(
+        "GET /webtoons/day/{day}",
+        lambda ctx, i: Request("GET", f"/webtoons/day/{DAYS[i % 7]}"),
+    ),
+    Scenario(
+        "GET /webtoons/sample",
+        lambda ctx, i: Request("GET", "/webtoons/sample", {"limit": 20}),
+    ),
+    Scenario(
+        "GET /webtoons_title/day/{day}",
+        lambda ctx, i: Request("GET", f"/webtoons_title/day/{DAYS[i % 7]}"),
+    ),
+    Scenario(
+        "GET /search",
+        lambda ctx, i: Request("GET", "/search", {"q": SEARCH_TERMS[i % len(SEARCH_TERMS)]}),
+    ),
+    Scenario(
+        "GET /search?day",
+        lambda ctx, i: Request(
+            "GET", "/search", {"q": SEARCH_TERMS[i % len(SEARCH_TERMS)], "day": DAYS[i % 7]}
+        ),
+    ),
+    Scenario(
+        "GET /search/suggest",
+        lambda ctx, i: Request(
+            "GET", "/search/suggest", {"q": SUGGEST_TERMS[i % len(SUGGEST_TERMS)]}
+        ),
+    ),
+    Scenario(
+        "GET /{webtoon_id}",
+        lambda ctx, i: Request("GET", f"/{ctx.pick(ctx.webtoon_ids)}"),
+    ),
+    Scenario(
+        "GET /webtoons/{id}/similar",
+        lambda ctx, i: Request("GET", f"/webtoons/{ctx.pick(ctx.webtoon_ids)}/similar"),
+    ),
+    Scenario(
+        "GET /webtoons/{id}/reviews",
+        lambda ctx, i: Request(
+            "GET", f"/webtoons/{ctx.pick(ctx.reviewed_webtoon_ids)}/reviews", {"limit": 20}
+        ),
+    ),
+    Scenario(
+        "GET /webtoons/{id}/reviews?page=5",
+        lambda ctx, i: Request(
+            "GET",
+            f"/webtoons/{ctx.pick(ctx.reviewed_webtoon_ids)}/reviews",
+            {"limit": 20, "page": 5},
+        ),
+    ),
+    Scenario(
+        "GET /webtoons/{id}/reviews?sort=likes",
+        lambda ctx, i: Request(
+            "GET",
+            f"/webtoons/{ctx.pick(ctx.reviewed_webtoon_ids)}/reviews",
+            {"limit": 20, "sort": "likes"},
+        ),
+    ),
+    Scenario(
+        "GET /webtoons/{id}/reviews?sort=hot",
+        lambda ctx, i: Request(
+            "GET",
+            f"/webtoons/{ctx.pick(ctx.reviewed_webtoon_ids)}/reviews",
+            {"limit": 20, "sort": "hot"},
+        ),
+    ),
+    Scenario(
+        "GET /webtoons/{id}/ratings/histogram",
+        lambda ctx, i: Request(
+            "GET", f"/webtoons/{ctx.pick(ctx.reviewed_webtoon_ids)}/ratings/histogram"
+        ),
+    ),
+    Scenario(
+        "GET /webtoons/{id}/reviews/export",
+        lambda ctx, i: Request(
+            "GET", f"/webtoons/{ctx.pick(ctx.reviewed_webtoon_ids)}/reviews/export"
+        ),
+    ),
+    Scenario("GET /metrics", lambda ctx, i: Request("GET", "/metrics")),
+    Scenario("GET /healthz", lambda ctx, i: Request("GET", "/healthz")),
+    Scenario("GET /readyz", lambda ctx, i: Request("GET", "/readyz")),
+    Scenario(
+        "GET /auth/anonymous",
+        lambda ctx, i: Request("GET", "/auth/anonymous"),
+    ),
+    Scenario(
+        "POST /webtoons/review/",
+        lambda ctx, i: Request(
+            "POST",
+            "/webtoons/review/",
+            {"webtoon_id": ctx.pick(ctx.webtoon_ids)},
+            ctx.anon("writer", i) + JSON_HEADERS,
+            _review_body(i),
+        ),
+        writes=True,
+    ),
+    Scenario(
+        "PUT /webtoons/{id}/reviews",
+        lambda ctx, i: _update_review(ctx, i),
+        writes=True,
+    ),
+    Scenario(
+        "POST /reviews/{id}/like",
+        lambda ctx, i: Request(
+            "POST", f"/reviews/{ctx.pick(ctx.review_ids)}/like", None, ctx.anon("liker", i)
+        ),
+        writes=True,
+    ),
+]
+
+
+def _update_review(ctx: Context, i: int) -> Request:
+    webtoon_id, author = ctx.authors[i % len(ctx.authors)]
+    return Request(
+        "PUT",
+        f"/webtoons/{webtoon_id}/reviews",
+        None,
+        (("cookie", f"anon_id={author}"),) + JSON_HEADERS,
+        _review_body(i),
+    )
@@ -0,0 +1,60 @@
+"""Shared fixtures: every test session runs against a throwaway SQLite file.
+
+``webtoon.database`` reads ``WEBTOON_DB_PATH`` at import time, so the
+environment is set here before any ``webtoon`` module is imported.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import tempfile
+
+_TMP_DIR = tempfile.mkdtemp(prefix="webtoon-tests-")
+os.environ["WEBTOON_DB_PATH"] = os.path.join(_TMP_DIR, "webtoon.sqlite")
+os.environ.setdefault("WEBTOON_SIMILAR_FILE", os.path.join(_TMP_DIR, "similar.npz"))
+os.environ.setdefault("WEBTOON_RATE_LIMIT", "0")
+os.environ.setdefault("WEBTOON_RATE_LIMIT_BACKEND", "memory")
+os.environ.setdefault("WEBTOON_PREWARM", "0")
+os.environ.setdefault("WEBTOON_SIMILAR_AUTO_BUILD", "0")
+os.environ.setdefault("WEBTOON_HOT_REFRESH_SECONDS", "3600")
+
+import pytest  # noqa: E402
+
+WEBTOONS = [
+    ("kakao_1", "https://example.invalid/1.png", "나 혼자만 레벨업", "MON", "작가A", "레벨업하는 헌터 이야기", "액션,판타지"),
+    ("kakao_2", "https://example.invalid/2.png", "전지적 독자 시점", "TUE", "작가B", "소설 속 세계의 독자 이야기", "판타지,액션"),
+    ("naver_3", "https://example.invalid/3.png", "여신강림", "WED,SAT", "작가C", "화장으로 달라진 학교 생활", "로맨스,일상"),
+]
+
+
+def _create_catalog(path: str) -> None:
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS normalized_webtoon "
+        "(id TEXT, thumbnail TEXT, title TEXT, updateDays TEXT, authors TEXT, synopsis TEXT, tags TEXT)"
+    )
+    if not conn.execute("SELECT 1 FROM normalized_webtoon LIMIT 1").fetchone():
+        conn.executemany("INSERT INTO normalized_webtoon VALUES (?, ?, ?, ?, ?, ?, ?)", WEBTOONS)
+    conn.commit()
+    conn.close()
+
+
+@pytest.fixture(scope="session")
+def db_path() -> str:
+    path = os.environ["WEBTOON_DB_PATH"]
+    _create_catalog(path)
+    from webtoon.db import init_db
+
+    init_db()
+    return path
+
+
+@pytest.fixture()
+def client(db_path: str):
+    from fastapi.testclient import TestClient
+
+    from webtoon.main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import sqlite3
+import time
+
+from webtoon.services.catalog import CatalogSnapshot, ResponseCache, build_catalog_data
+from tests.conftest import WEBTOONS
+
+
+def test_response_cache_evicts_least_recently_used() -> None:
+    cache = ResponseCache(2)
+    builds = []
+
+    def build(key: str):
+        def inner() -> bytes:
+            builds.append(key)
+            return key.encode()
+
+        return inner
+
+    cache.get_or_build("a", build("a"))
+    cache.get_or_build("b", build("b"))
+    cache.get_or_build("a", build("a"))  # hit, "a" becomes most recent
+    cache.get_or_build("c", build("c"))  # evicts "b"
+    cache.get_or_build("a", build("a"))
+    cache.get_or_build("b", build("b"))
+    assert builds == ["a", "b", "c", "b"]
+    assert len(cache) == 2
+
+
+def test_snapshot_memo_keeps_caching_after_junk_keys(monkeypatch) -> None:
+    monkeypatch.setattr("webtoon.services.catalog.MAX_CACHED_RESPONSES", 8)
+    snapshot = CatalogSnapshot(build_catalog_data(list(WEBTOONS)), loaded_at=time.time())
+    for i in range(100):
+        snapshot.encoded(("junk", i), lambda: b"{}")
+
+    calls = []
+    snapshot.encoded(("day", "MON"), lambda: calls.append(1) or b"[]")
+    snapshot.encoded(("day", "MON"), lambda: calls.append(1) or b"[]")
+    assert calls == [1]
+
+
+def test_free_text_keys_do_not_evict_other_bodies(monkeypatch) -> None:
+    monkeypatch.setattr("webtoon.services.catalog.MAX_CACHED_RESPONSES", 4)
+    monkeypatch.setattr("webtoon.services.catalog.MAX_QUERY_RESPONSES", 2)
+    snapshot = CatalogSnapshot(build_catalog_data(list(WEBTOONS)), loaded_at=time.time())
+    calls = []
+    snapshot.encoded(("day", "MON"), lambda: calls.append(1) or b"[]")
+    for i in range(50):
+        snapshot.encoded(("suggest", f"q{i}", 10), lambda: b"{}", free_text=True)
+    snapshot.encoded(("day", "MON"), lambda: calls.append(1) or b"[]")
+    assert calls == [1]
+
+
+def test_catalog_indexes_come_back_after_the_table_is_replaced(tmp_path) -> None:
+    from webtoon.services.catalog import ensure_catalog_indexes
+
+    conn = sqlite3.connect(tmp_path / "catalog.sqlite")
+    conn.execute("CREATE TABLE normalized_webtoon (id TEXT, updateDays TEXT)")
+    ensure_catalog_indexes(conn)
+    # A catalog import swaps the table, which drops its indexes.
+    conn.execute("DROP TABLE normalized_webtoon")
+    conn.execute("CREATE TABLE normalized_webtoon (id TEXT, updateDays TEXT)")
+    ensure_catalog_indexes(conn)
+
+    names = {
+        row[0]
+        for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+    }
+    assert {"ix_normalized_webtoon_id", "ix_normalized_webtoon_update_days_id"} <= names
+    conn.close()
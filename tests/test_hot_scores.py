@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from webtoon.services.hot_scores import HotScoreRefresher
+
+
+def test_only_one_refresher_leads(tmp_path) -> None:
+    lock_path = str(tmp_path / "hot-scores.lock")
+    first = HotScoreRefresher(interval=3600, lock_path=lock_path)
+    second = HotScoreRefresher(interval=3600, lock_path=lock_path)
+
+    first.start()
+    second.start()
+    try:
+        assert first.is_leader()
+        assert not second.is_leader()
+
+        # The lock is released when the leader stops, so another one takes over.
+        first.stop()
+        assert second.is_leader()
+    finally:
+        first.stop()
+        second.stop()
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+from fastapi import HTTPException
+
+from webtoon.services.like_buffer import LikeBuffer
+
+
+@pytest.fixture()
+def gated_buffer(db_path):
+    """A buffer whose flush waits until the test opens ``gate``."""
+
+    from webtoon.db.session import SessionLocal
+
+    gate = threading.Event()
+
+    def session_factory():
+        gate.wait(5)
+        return SessionLocal()
+
+    buffer = LikeBuffer(session_factory, flush_interval_ms=1)
+    buffer.start()
+    yield buffer, gate
+    gate.set()
+    buffer.stop()
+
+
+def test_like_answers_503_when_flush_is_late(gated_buffer) -> None:
+    buffer, _ = gated_buffer
+    with pytest.raises(HTTPException) as raised:
+        buffer.like(review_id=999_999, anonymous_user_id="late", timeout=0.05)
+    assert raised.value.status_code == 503
+    assert raised.value.headers["Retry-After"] == "1"
+
+
+def test_cancelled_like_does_not_strand_its_batch(gated_buffer) -> None:
+    buffer, gate = gated_buffer
+    abandoned = buffer.submit(review_id=999_998, anonymous_user_id="gone")
+    waiting = buffer.submit(review_id=999_999, anonymous_user_id="waiting")
+    assert abandoned.cancel()
+    gate.set()
+
+    with pytest.raises(HTTPException) as raised:
+        waiting.result(timeout=5)
+    assert raised.value.status_code == 404
+
+
+def test_like_async_times_out_without_touching_the_batch(gated_buffer) -> None:
+    buffer, gate = gated_buffer
+
+    async def like_then_queue_another():
+        with pytest.raises(HTTPException) as raised:
+            await buffer.like_async(review_id=999_997, anonymous_user_id="slow", timeout=0.05)
+        return raised.value, buffer.submit(review_id=999_999, anonymous_user_id="after")
+
+    error, waiting = asyncio.run(like_then_queue_another())
+    assert error.status_code == 503
+    gate.set()
+    with pytest.raises(HTTPException) as raised:
+        waiting.result(timeout=5)
+    assert raised.value.status_code == 404
+
+
+def test_like_async_returns_the_flush_result(gated_buffer) -> None:
+    buffer, gate = gated_buffer
+    gate.set()
+
+    async def like():
+        return await buffer.like_async(review_id=999_999, anonymous_user_id="ok", timeout=5)
+
+    with pytest.raises(HTTPException) as raised:
+        asyncio.run(like())
+    assert raised.value.status_code == 404
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import base64
+import json
+
+import pytest
+from fastapi import HTTPException
+
+from webtoon.pagination import (
+    cursor_float,
+    cursor_int,
+    cursor_str,
+    cursor_timestamp,
+    decode_cursor,
+    encode_cursor,
+)
+from webtoon.services.review_service import review_page_statement
+
+
+def raw_cursor(value: object) -> str:
+    return base64.urlsafe_b64encode(json.dumps(value).encode()).rstrip(b"=").decode()
+
+
+def test_round_trip() -> None:
+    token = encode_cursor("2025-11-12 18:40:00", 15)
+    assert decode_cursor(token, 2) == ["2025-11-12 18:40:00", 15]
+
+
+@pytest.mark.parametrize(
+    "token",
+    ["", "!!!", raw_cursor({"a": 1}), raw_cursor([1, 2, 3]), raw_cursor("x"), "bm90IGpzb24"],
+)
+def test_malformed_tokens_are_rejected(token: str) -> None:
+    with pytest.raises(HTTPException) as exc:
+        decode_cursor(token, 2)
+    assert exc.value.status_code == 400
+
+
+@pytest.mark.parametrize("value", [None, 1, [1, 2], {"a": 1}])
+def test_cursor_str_rejects_non_strings(value: object) -> None:
+    with pytest.raises(HTTPException):
+        cursor_str(value)
+
+
+@pytest.mark.parametrize("value", [True, False, "1", 1.0, None, 2**63, -(2**63) - 1])
+def test_cursor_int_rejects_bools_and_out_of_range(value: object) -> None:
+    with pytest.raises(HTTPException):
+        cursor_int(value)
+
+
+def test_cursor_int_accepts_sqlite_range() -> None:
+    assert cursor_int(2**63 - 1) == 2**63 - 1
+
+
+@pytest.mark.parametrize("value", ["abc", "", 5, None, "2025-13-01"])
+def test_cursor_timestamp_rejects_non_iso(value: object) -> None:
+    with pytest.raises(HTTPException):
+        cursor_timestamp(value)
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        raw_cursor(["x", "abc"]),
+        raw_cursor(["x", None]),
+        raw_cursor(["2025-11-12 18:40:00", "abc"]),
+        raw_cursor(["2025-11-12 18:40:00", 10**30]),
+        raw_cursor([["2025"], 1]),
+    ],
+)
+def test_recent_review_cursor_rejects_bad_values(cursor: str) -> None:
+    with pytest.raises(HTTPException) as exc:
+        review_page_statement(webtoon_id="kakao_1", page=1, limit=10, cursor=cursor)
+    assert exc.value.status_code == 400
+
+
+def test_recent_review_cursor_accepts_encoded_cursor() -> None:
+    cursor = encode_cursor("2025-11-12 18:40:00.123456", 15)
+    review_page_statement(webtoon_id="kakao_1", page=1, limit=10, cursor=cursor)
+
+
+def test_catalog_cursor_must_hold_an_id(client) -> None:
+    assert client.get("/webtoons", params={"cursor": raw_cursor([[1, 2]])}).status_code == 400
+    assert client.get("/webtoons", params={"cursor": raw_cursor([None])}).status_code == 400
+    first = client.get("/webtoons").json()
+    assert client.get("/webtoons", params={"cursor": encode_cursor("kakao_1")}).status_code == 200
+    assert first["total"] == 3
+
+
+@pytest.mark.parametrize(
+    ("sort", "value"),
+    [
+        ("likes", 10**30),
+        ("likes", True),
+        ("likes", 1.5),
+        ("likes", "3"),
+        ("hot", False),
+        ("hot", 10**30),
+        ("hot", "0.5"),
+        ("hot", None),
+    ],
+)
+def test_sorted_review_cursor_rejects_bad_values(sort: str, value: object) -> None:
+    cursor = raw_cursor([sort, value, 1])
+    with pytest.raises(HTTPException) as exc:
+        review_page_statement(webtoon_id="kakao_1", page=1, limit=10, cursor=cursor, sort=sort)
+    assert exc.value.status_code == 400
+
+
+def test_sorted_review_cursor_rejects_other_sort() -> None:
+    with pytest.raises(HTTPException):
+        review_page_statement(
+            webtoon_id="kakao_1", page=1, limit=10, cursor=encode_cursor("likes", 3, 1), sort="hot"
+        )
+
+
+@pytest.mark.parametrize(("sort", "value"), [("likes", 3), ("hot", 0.25), ("hot", 2)])
+def test_sorted_review_cursor_accepts_valid_values(sort: str, value: object) -> None:
+    cursor = encode_cursor(sort, value, 1)
+    review_page_statement(webtoon_id="kakao_1", page=1, limit=10, cursor=cursor, sort=sort)
+
+
+def test_float_cursor_rejects_non_finite() -> None:
+    for value in (float("inf"), float("nan")):
+        with pytest.raises(HTTPException):
+            cursor_float(value)
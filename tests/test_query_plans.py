@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import shutil
+import sqlite3
+
+import pytest
+
+from webtoon.db.query_plans import check_query_plans
+from webtoon.sql_functions import register_functions
+
+DAYS = ("MON", "TUE", "WED", "THU", "FRI", "SAT", "SUN")
+
+
+@pytest.mark.parametrize("analyzed", [False, True])
+def test_hot_queries_use_their_indexes(client, db_path, tmp_path, analyzed) -> None:
+    # The client fixture has run the startup schema steps on the seeded DB.
+    path = tmp_path / "plans.sqlite"
+    source = sqlite3.connect(db_path)
+    target = sqlite3.connect(path)
+    source.backup(target)
+    source.close()
+    register_functions(target)
+    # Enough catalog rows that the planner's costs resemble a real catalog;
+    # the FTS triggers index them as they are inserted.
+    with target:
+        target.executemany(
+            "INSERT INTO normalized_webtoon VALUES (?, '', ?, ?, '', '', '')",
+            [(f"seed_{i}", f"제목 {i}", DAYS[i % len(DAYS)]) for i in range(2000)],
+        )
+    if analyzed:
+        target.execute("ANALYZE")
+
+    failures = {
+        result.name: (result.problems, result.plan)
+        for result in check_query_plans(target)
+        if not result.ok
+    }
+    target.close()
+    assert failures == {}
+
+
+def test_missing_objects_are_reported_not_raised() -> None:
+    conn = sqlite3.connect(":memory:")
+    register_functions(conn)
+    results = check_query_plans(conn)
+    conn.close()
+    assert results and not any(result.ok for result in results)
+    assert all(result.problems[0].startswith("cannot plan:") for result in results)
+
+
+def test_cli_prepares_the_schema_before_checking_plans(db_path, caplog) -> None:
+    from webtoon import cli
+
+    with caplog.at_level("INFO", logger="webtoon.cli"):
+        cli.main(["check-query-plans"])
+    assert "FAIL" not in caplog.text
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from webtoon.dependencies import rate_limit
+from webtoon.dependencies.rate_limit import MemoryBuckets, RateLimit, RateLimiter, SharedBuckets
+
+
+def _request(ip: str = "10.0.0.1") -> Request:
+    return Request({"type": "http", "method": "POST", "path": "/", "headers": [], "client": (ip, 1234)})
+
+
+def _allowed(limiter: RateLimiter, anon_id: str) -> bool:
+    try:
+        asyncio.run(limiter(_request(), anonymous_user_id=anon_id))
+    except HTTPException as exc:
+        assert exc.status_code == 429
+        return False
+    return True
+
+
+@pytest.mark.parametrize("backend", ["memory", "shared"])
+def test_anon_rejection_does_not_spend_ip_tokens(monkeypatch, tmp_path, backend) -> None:
+    monkeypatch.setattr(rate_limit, "RATE_LIMIT_ENABLED", True)
+    buckets = MemoryBuckets() if backend == "memory" else SharedBuckets(str(tmp_path / "buckets"), 64)
+    limiter = RateLimiter(
+        "test",
+        per_anon=RateLimit(1, 3600),
+        per_ip=RateLimit(3, 3600),
+        backend=buckets,
+    )
+
+    assert _allowed(limiter, "noisy")
+    assert not any(_allowed(limiter, "noisy") for _ in range(5))
+    # The IP bucket still holds the two tokens the rejected requests did not use.
+    assert _allowed(limiter, "quiet-1")
+    assert _allowed(limiter, "quiet-2")
+    assert not _allowed(limiter, "quiet-3")
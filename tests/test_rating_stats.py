@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import sqlite3
+import uuid
+
+import pytest
+from sqlalchemy import create_engine
+
+from webtoon.db.migrations import MigrationError, _add_review_indexes
+
+
+def _stats(db_path: str, webtoon_id: str) -> tuple[int, int, dict[int, int]]:
+    conn = sqlite3.connect(db_path)
+    try:
+        row = conn.execute(
+            "SELECT rating_sum, review_count FROM webtoon_rating_stats WHERE webtoon_id = ?",
+            (webtoon_id,),
+        ).fetchone() or (0, 0)
+        buckets = dict(
+            conn.execute(
+                "SELECT bucket, review_count FROM webtoon_rating_buckets "
+                "WHERE webtoon_id = ? AND review_count > 0",
+                (webtoon_id,),
+            )
+        )
+    finally:
+        conn.close()
+    return row[0], row[1], buckets
+
+
+def _write(client, method: str, webtoon_id: str, anon_id: str, rating: float):
+    client.cookies.set("anon_id", anon_id)
+    try:
+        if method == "POST":
+            return client.post(
+                "/webtoons/review/",
+                params={"webtoon_id": webtoon_id},
+                json={"content": "테스트 리뷰", "rating": rating},
+            )
+        return client.put(
+            f"/webtoons/{webtoon_id}/reviews", json={"content": "수정한 리뷰", "rating": rating}
+        )
+    finally:
+        client.cookies.clear()
+
+
+def test_create_update_and_delete_keep_sum_and_buckets(client, db_path) -> None:
+    webtoon_id = "naver_3"
+    anon_id = f"stats-{uuid.uuid4()}"
+    rating_sum, count, buckets = _stats(db_path, webtoon_id)
+
+    assert _write(client, "POST", webtoon_id, anon_id, 4.5).status_code == 201
+    after_create = _stats(db_path, webtoon_id)
+    assert after_create[:2] == (rating_sum + 450, count + 1)
+    assert after_create[2].get(9, 0) == buckets.get(9, 0) + 1
+
+    assert _write(client, "PUT", webtoon_id, anon_id, 2.0).status_code == 200
+    assert _write(client, "PUT", webtoon_id, anon_id, 3.26).status_code == 200
+    after_update = _stats(db_path, webtoon_id)
+    assert after_update[:2] == (rating_sum + 326, count + 1)
+    assert after_update[2].get(9, 0) == buckets.get(9, 0)
+    assert after_update[2].get(4, 0) == buckets.get(4, 0)
+    assert after_update[2].get(7, 0) == buckets.get(7, 0) + 1
+
+    conn = sqlite3.connect(db_path)
+    with conn:
+        conn.execute(
+            "DELETE FROM reviews WHERE webtoon_id = ? AND anonymous_user_id = ?",
+            (webtoon_id, anon_id),
+        )
+    conn.close()
+    assert _stats(db_path, webtoon_id) == (rating_sum, count, buckets)
+
+
+def test_rating_delta_is_computed_by_the_update(client, db_path) -> None:
+    """Any UPDATE of reviews.rating moves rating_sum, whoever issues it."""
+
+    webtoon_id = "kakao_2"
+    anon_id = f"stats-{uuid.uuid4()}"
+    assert _write(client, "POST", webtoon_id, anon_id, 1.0).status_code == 201
+    rating_sum, count, _ = _stats(db_path, webtoon_id)
+
+    # Another writer changes the rating behind the service's back.
+    conn = sqlite3.connect(db_path)
+    with conn:
+        conn.execute(
+            "UPDATE reviews SET rating = 5.0 WHERE webtoon_id = ? AND anonymous_user_id = ?",
+            (webtoon_id, anon_id),
+        )
+    conn.close()
+    assert _stats(db_path, webtoon_id)[:2] == (rating_sum + 400, count)
+
+    assert _write(client, "PUT", webtoon_id, anon_id, 3.0).status_code == 200
+    assert _stats(db_path, webtoon_id)[:2] == (rating_sum + 200, count)
+
+
+def test_review_index_migration_refuses_duplicates(tmp_path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'dupes.sqlite'}")
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            "CREATE TABLE reviews (id INTEGER PRIMARY KEY, webtoon_id TEXT, anonymous_user_id TEXT)"
+        )
+        conn.exec_driver_sql(
+            "INSERT INTO reviews (webtoon_id, anonymous_user_id) "
+            "VALUES ('kakao_1', 'u1'), ('kakao_1', 'u1'), ('kakao_1', 'u2')"
+        )
+
+    with pytest.raises(MigrationError, match="kakao_1/u1 x2"):
+        with engine.begin() as conn:
+            _add_review_indexes(conn)
+    engine.dispose()
+
+
+@pytest.mark.parametrize("rating", [4.555, 0.001, 5.01])
+def test_ratings_finer_than_stored_precision_are_rejected(client, rating) -> None:
+    response = _write(client, "POST", "kakao_1", f"stats-{uuid.uuid4()}", rating)
+    assert response.status_code == 422
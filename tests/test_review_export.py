@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import json
+import uuid
+
+
+def test_export_does_not_leak_author_ids(client) -> None:
+    anon_id = f"export-{uuid.uuid4()}"
+    client.cookies.set("anon_id", anon_id)
+    try:
+        created = client.post(
+            "/webtoons/review/", params={"webtoon_id": "naver_3"}, json={"content": "내보내기", "rating": 4.0}
+        )
+    finally:
+        client.cookies.clear()
+    assert created.status_code == 201
+
+    response = client.get("/webtoons/naver_3/reviews/export")
+    assert response.status_code == 200
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert any(row["id"] == created.json()["id"] for row in rows)
+    assert all("anonymous_user_id" not in row for row in rows)
+    assert anon_id not in response.text
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import uuid
+
+from webtoon.services.review_import import ReviewImporter
+
+
+def test_unparseable_created_at_and_fine_ratings_are_invalid(db_path, tmp_path) -> None:
+    from webtoon.db.session import SessionLocal
+
+    prefix = f"import-{uuid.uuid4().hex[:8]}"
+    path = tmp_path / "reviews.csv"
+    path.write_text(
+        "webtoon_id,anonymous_user_id,content,rating,created_at\n"
+        f"kakao_1,{prefix}-a,좋아요,4.5,2024-03-01 12:00:00\n"
+        f"kakao_1,{prefix}-b,좋아요,4.5,\n"
+        f"kakao_1,{prefix}-c,좋아요,4.5,어제\n"
+        f"kakao_1,{prefix}-d,좋아요,4.555,2024-03-01T12:00:00Z\n",
+        encoding="utf-8",
+    )
+
+    db = SessionLocal()
+    try:
+        report = ReviewImporter(db).import_file(str(path), dry_run=True)
+    finally:
+        db.close()
+    assert (report.read, report.inserted, report.invalid) == (4, 2, 2)
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+
+def test_search_reports_more_results(client) -> None:
+    body = client.get("/search", params={"q": "이야기", "limit": 1}).json()
+    assert body["count"] == 1 and body["has_more"] is True
+
+    body = client.get("/search", params={"q": "이야기", "limit": 1, "offset": 1}).json()
+    assert body["count"] == 1 and body["has_more"] is False
+
+
+def test_search_matches_ids_in_default_mode(client) -> None:
+    body = client.get("/search", params={"q": "naver_3"}).json()
+    assert body["mode"] == "fts"
+    assert [item["id"] for item in body["webtoons"]] == ["naver_3"]
+    assert body["has_more"] is False
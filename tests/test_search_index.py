@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import sqlite3
+
+import pytest
+
+from webtoon.services.search_index import FTS_COLUMNS, FTS_TABLE, ensure_search_index, search_catalog
+from tests.conftest import WEBTOONS
+
+
+@pytest.fixture()
+def catalog_conn() -> sqlite3.Connection:
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    conn.execute(
+        "CREATE TABLE normalized_webtoon "
+        "(id TEXT, thumbnail TEXT, title TEXT, updateDays TEXT, authors TEXT, synopsis TEXT, tags TEXT)"
+    )
+    conn.executemany("INSERT INTO normalized_webtoon VALUES (?, ?, ?, ?, ?, ?, ?)", WEBTOONS)
+    ensure_search_index(conn)
+    return conn
+
+
+def _ids(conn: sqlite3.Connection, q: str, mode: str) -> tuple[str, list[str]]:
+    used, rows = search_catalog(conn.cursor(), q=q, day=None, limit=50, offset=0, mode=mode)
+    return used, sorted(row["id"] for row in rows)
+
+
+def test_fts_matches_ids_like_the_like_scan(catalog_conn: sqlite3.Connection) -> None:
+    assert _ids(catalog_conn, "kakao_1", "fts") == ("fts", ["kakao_1"])
+    assert _ids(catalog_conn, "kakao", "fts")[1] == _ids(catalog_conn, "kakao", "like")[1]
+
+
+def test_triggers_keep_the_index_in_sync(catalog_conn: sqlite3.Connection) -> None:
+    catalog_conn.execute("UPDATE normalized_webtoon SET id = 'kakao_99' WHERE id = 'kakao_2'")
+    assert _ids(catalog_conn, "kakao_99", "fts")[1] == ["kakao_99"]
+    catalog_conn.execute("DELETE FROM normalized_webtoon WHERE id = 'kakao_99'")
+    assert _ids(catalog_conn, "kakao_99", "fts")[1] == []
+
+
+def test_index_with_old_columns_is_rebuilt(catalog_conn: sqlite3.Connection) -> None:
+    for name in ("ai", "ad", "au"):
+        catalog_conn.execute(f"DROP TRIGGER {FTS_TABLE}_{name}")
+    catalog_conn.execute(f"DROP TABLE {FTS_TABLE}")
+    catalog_conn.execute(
+        f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(title, authors, synopsis, tags, "
+        "content='normalized_webtoon', content_rowid='rowid', tokenize='trigram')"
+    )
+    ensure_search_index(catalog_conn)
+    columns = [row[0] for row in catalog_conn.execute(f"SELECT name FROM pragma_table_info('{FTS_TABLE}')")]
+    assert tuple(columns) == FTS_COLUMNS
+    assert _ids(catalog_conn, "naver_3", "fts") == ("fts", ["naver_3"])
+
+
+def test_index_is_rebuilt_after_vacuum_renumbers_rowids(tmp_path) -> None:
+    conn = sqlite3.connect(tmp_path / "catalog.sqlite")
+    conn.row_factory = sqlite3.Row
+    conn.execute(
+        "CREATE TABLE normalized_webtoon "
+        "(id TEXT, thumbnail TEXT, title TEXT, updateDays TEXT, authors TEXT, synopsis TEXT, tags TEXT)"
+    )
+    conn.executemany("INSERT INTO normalized_webtoon VALUES (?, ?, ?, ?, ?, ?, ?)", WEBTOONS)
+    ensure_search_index(conn)
+    conn.execute("DELETE FROM normalized_webtoon WHERE id = 'kakao_1'")
+    conn.commit()
+    cookie = conn.execute("PRAGMA schema_version").fetchone()[0]
+    conn.execute("VACUUM")
+
+    assert conn.execute("PRAGMA schema_version").fetchone()[0] != cookie
+    ensure_search_index(conn)
+    assert _ids(conn, "naver_3", "fts") == ("fts", ["naver_3"])
+    assert _ids(conn, "전지적", "fts") == ("fts", ["kakao_2"])
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+
+def test_similar_is_unavailable_until_the_lists_exist(client) -> None:
+    response = client.get("/webtoons/kakao_1/similar")
+    assert response.status_code == 503
+    assert response.headers["cache-control"] == "no-store"
+    assert int(response.headers["retry-after"]) >= 1
+
+
+def test_similar_unknown_webtoon_is_404(client) -> None:
+    assert client.get("/webtoons/missing/similar").status_code == 404
+
+
+def test_similar_serves_built_lists(client, monkeypatch, tmp_path) -> None:
+    from webtoon.routers import webtoons
+    from webtoon.services.catalog import get_catalog
+    from webtoon.services.similar import SimilarStore, build_similar_file
+
+    path = str(tmp_path / "similar.npz")
+    build_similar_file(path, get_catalog())
+    monkeypatch.setattr(webtoons, "similar_store", SimilarStore(path, auto_build=False, check_interval=0))
+
+    response = client.get("/webtoons/kakao_1/similar")
+    assert response.status_code == 200
+    assert [item["id"] for item in response.json()["webtoons"]][:1] == ["kakao_2"]
@@ -0,0 +1,217 @@
+"""Maintenance commands: ``python -m webtoon.cli <command>``."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import time
+from typing import Callable, Optional, Sequence
+
+from webtoon.database import connect_readonly
+from webtoon.db.query_plans import check_query_plans
+from webtoon.db.session import new_write_session
+from webtoon.services.catalog import CATALOG_FILE_PATH
+from webtoon.services.catalog_file import build_catalog_file, build_lock
+from webtoon.services.hot_scores import HOT_REFRESH_BATCH, HOT_WINDOW_DAYS, window_start
+from webtoon.services.review_import import DEFAULT_CHUNK_SIZE, ReviewImporter
+from webtoon.services.review_service import HISTOGRAM_REBUILD_BATCH, ReviewService
+from webtoon.services.similar import (
+    SIMILAR_CHUNK_SIZE,
+    SIMILAR_FILE_PATH,
+    SIMILAR_TOP_K,
+    build_similar_from_db,
+)
+from webtoon.startup import ensure_schema
+
+logger = logging.getLogger("webtoon.cli")
+
+
+def _rebuild_rating_stats(args: argparse.Namespace) -> None:
+    db = new_write_session()
+    try:
+        rebuilt = ReviewService(db).rebuild_rating_stats(args.webtoon_id or None)
+    finally:
+        db.close()
+    logger.info("Rebuilt rating stats for %d webtoons", rebuilt)
+
+
+def _rebuild_rating_histograms(args: argparse.Namespace) -> None:
+    db = new_write_session()
+    try:
+        rebuilt = ReviewService(db).rebuild_rating_histograms(
+            args.webtoon_id or None, batch_size=args.batch_size
+        )
+    finally:
+        db.close()
+    logger.info("Rebuilt rating histograms for %d webtoons", rebuilt)
+
+
+def _import_reviews(args: argparse.Namespace) -> None:
+    db = new_write_session()
+    try:
+        importer = ReviewImporter(db, chunk_size=args.chunk_size)
+        report = importer.import_file(args.path, args.format, dry_run=args.dry_run)
+    finally:
+        db.close()
+    print(json.dumps(report.as_dict()))
+
+
+def _refresh_hot_scores(args: argparse.Namespace) -> None:
+    since = None if args.full else window_start(time.time(), args.window_days)
+    db = new_write_session()
+    try:
+        refreshed = ReviewService(db).refresh_hot_scores(since=since, batch_size=args.batch_size)
+    finally:
+        db.close()
+    logger.info("Refreshed %d hot scores", refreshed)
+
+
+def _build_catalog_file(args: argparse.Namespace) -> None:
+    if not args.output:
+        raise SystemExit("Set WEBTOON_CATALOG_FILE or pass --output.")
+    conn = connect_readonly()
+    try:
+        with build_lock(args.output):
+            header = build_catalog_file(conn, args.output)
+    finally:
+        conn.close()
+    logger.info("Catalog snapshot %s written to %s", header["version"][:12], args.output)
+
+
+def _build_similar_webtoons(args: argparse.Namespace) -> None:
+    conn = connect_readonly()
+    try:
+        with build_lock(args.output):
+            built = build_similar_from_db(
+                conn, args.output, top_k=args.top_k, chunk_size=args.chunk_size
+            )
+    finally:
+        conn.close()
+    logger.info("Similar webtoons for %d titles written to %s", built, args.output)
+
+
+def _check_query_plans(args: argparse.Namespace) -> None:
+    conn = connect_readonly()
+    try:
+        results = check_query_plans(conn)
+    finally:
+        conn.close()
+
+    for result in results:
+        logger.info("%s %s", "ok  " if result.ok else "FAIL", result.name)
+        if args.verbose or not result.ok:
+            for line in result.plan:
+                logger.info("       %s", line)
+        for problem in result.problems:
+            logger.error("       %s", problem)
+    if not all(result.ok for result in results):
+        raise SystemExit(1)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m webtoon.cli")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    rebuild = subparsers.add_parser(
+        "rebuild-rating-stats",
+        help="Recompute webtoon_rating_stats from reviews in a single GROUP BY pass.",
+    )
+    rebuild.add_argument(
+        "--webtoon-id",
+        action="append",
+        help="Limit the rebuild to this webtoon (repeatable).",
+    )
+    rebuild.set_defaults(handler=_rebuild_rating_stats)
+
+    histograms = subparsers.add_parser(
+        "rebuild-rating-histograms",
+        help="Recompute webtoon_rating_buckets from reviews in one NumPy pass.",
+    )
+    histograms.add_argument(
+        "--webtoon-id",
+        action="append",
+        help="Limit the rebuild to this webtoon (repeatable).",
+    )
+    histograms.add_argument("--batch-size", type=int, default=HISTOGRAM_REBUILD_BATCH)
+    histograms.set_defaults(handler=_rebuild_rating_histograms)
+
+    importer = subparsers.add_parser(
+        "import-reviews",
+        help="Bulk-load reviews from a CSV or NDJSON file.",
+    )
+    importer.add_argument("path", help="CSV or NDJSON file to import.")
+    importer.add_argument(
+        "--format",
+        choices=("csv", "ndjson"),
+        help="Input format (defaults to the file extension).",
+    )
+    importer.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    importer.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Validate and de-duplicate without writing anything.",
+    )
+    importer.set_defaults(handler=_import_reviews)
+
+    hot = subparsers.add_parser(
+        "refresh-hot-scores",
+        help="Recompute the time-decayed reviews.hot_score column in batches.",
+    )
+    hot.add_argument(
+        "--full",
+        action="store_true",
+        help="Refresh every review instead of only the decay window (e.g. after changing WEBTOON_HOT_GRAVITY).",
+    )
+    hot.add_argument("--window-days", type=float, default=HOT_WINDOW_DAYS)
+    hot.add_argument("--batch-size", type=int, default=HOT_REFRESH_BATCH)
+    hot.set_defaults(handler=_refresh_hot_scores)
+
+    catalog_file = subparsers.add_parser(
+        "build-catalog-file",
+        help="Compile the catalog into the memory-mapped snapshot file the workers share.",
+    )
+    catalog_file.add_argument(
+        "--output",
+        default=CATALOG_FILE_PATH,
+        help="Snapshot file path (defaults to WEBTOON_CATALOG_FILE).",
+    )
+    catalog_file.set_defaults(handler=_build_catalog_file)
+
+    similar = subparsers.add_parser(
+        "build-similar-webtoons",
+        help="Precompute the top-k similar webtoons of every title (TF-IDF, NumPy).",
+    )
+    similar.add_argument(
+        "--output",
+        default=SIMILAR_FILE_PATH,
+        help="Artifact path (defaults to WEBTOON_SIMILAR_FILE).",
+    )
+    similar.add_argument("--top-k", type=int, default=SIMILAR_TOP_K, help="Neighbours kept per title.")
+    similar.add_argument(
+        "--chunk-size", type=int, default=SIMILAR_CHUNK_SIZE, help="Query rows per matrix product."
+    )
+    similar.set_defaults(handler=_build_similar_webtoons)
+
+    plans = subparsers.add_parser(
+        "check-query-plans",
+        help="Fail if a hot query stops using its index (EXPLAIN QUERY PLAN).",
+    )
+    plans.add_argument("--verbose", action="store_true", help="Print every plan.")
+    plans.set_defaults(handler=_check_query_plans)
+
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
+    args = build_parser().parse_args(argv)
+    # Same schema steps as a worker start: tables, migrations, the FTS index,
+    # the revision triggers and the catalog indexes.
+    ensure_schema()
+    handler: Callable[[argparse.Namespace], None] = args.handler
+    handler(args)
+
+
+if __name__ == "__main__":
+    main()
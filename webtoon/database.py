@@ -1,11 +1,135 @@
-import sqlite3
 import os
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Generator, Iterator
+from urllib.request import pathname2url
+
+from webtoon.metrics import METRICS_ENABLED, record_query
+from webtoon.sql_functions import register_functions
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-DB_PATH = os.path.join(BASE_DIR, "webtoon_database.sqlite")
+# 벤치마크 등에서 다른 DB 파일을 쓰도록 환경 변수로 덮어쓸 수 있다.
+DB_PATH = os.getenv("WEBTOON_DB_PATH", os.path.join(BASE_DIR, "webtoon_database.sqlite"))
 DATABASE_URL = "sqlite:///./webtoon/webtoon_database.salite"
 
+# 읽기 전용 커넥션 튜닝 값 (환경 변수로 조정 가능)
+READ_POOL_SIZE = int(os.getenv("WEBTOON_READ_POOL_SIZE", "64"))
+READ_MMAP_SIZE = int(os.getenv("WEBTOON_SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+READ_CACHE_SIZE_KIB = int(os.getenv("WEBTOON_SQLITE_CACHE_SIZE_KIB", "16384"))
+STATEMENT_CACHE_SIZE = 256
+
+
+class InstrumentedCursor(sqlite3.Cursor):
+    """Cursor that reports every statement to ``webtoon.metrics``."""
+
+    def execute(self, sql: str, parameters: Any = ()) -> "InstrumentedCursor":
+        started = time.perf_counter()
+        try:
+            return super().execute(sql, parameters)
+        finally:
+            record_query("sqlite3", sql, parameters, time.perf_counter() - started)
+
+    def executemany(self, sql: str, seq_of_parameters: Any) -> "InstrumentedCursor":
+        started = time.perf_counter()
+        try:
+            return super().executemany(sql, seq_of_parameters)
+        finally:
+            record_query("sqlite3", sql, None, time.perf_counter() - started)
+
+
+class InstrumentedConnection(sqlite3.Connection):
+    """Connection whose cursors (including ``execute`` shortcuts) are instrumented."""
+
+    def cursor(self, factory: Any = InstrumentedCursor) -> sqlite3.Cursor:
+        return super().cursor(factory)
+
+    # The C shortcuts bypass cursor(), so route them through it explicitly.
+    def execute(self, sql: str, parameters: Any = ()) -> sqlite3.Cursor:
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql: str, seq_of_parameters: Any) -> sqlite3.Cursor:
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+
+CONNECTION_FACTORY = InstrumentedConnection if METRICS_ENABLED else sqlite3.Connection
+
+
 def get_db():
-    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+    """Open a read-write connection (used for DDL and maintenance tasks)."""
+
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False, factory=CONNECTION_FACTORY)
+    conn.row_factory = sqlite3.Row
+    register_functions(conn)
+    return conn, conn.cursor()
+
+
+def connect_readonly(path: str = DB_PATH) -> sqlite3.Connection:
+    """Open a tuned, read-only connection to the SQLite database."""
+
+    conn = sqlite3.connect(
+        f"file:{pathname2url(path)}?mode=ro",
+        uri=True,
+        check_same_thread=False,
+        cached_statements=STATEMENT_CACHE_SIZE,
+        factory=CONNECTION_FACTORY,
+    )
     conn.row_factory = sqlite3.Row
-    return conn, conn.cursor()
\ No newline at end of file
+    register_functions(conn)
+    conn.execute(f"PRAGMA mmap_size = {READ_MMAP_SIZE}")
+    # 음수 값은 KiB 단위를 의미한다.
+    conn.execute(f"PRAGMA cache_size = -{READ_CACHE_SIZE_KIB}")
+    conn.execute("PRAGMA query_only = ON")
+    return conn
+
+
+class ReadConnectionPool:
+    """Checkout/return pool of read-only SQLite connections.
+
+    Each checkout owns its connection exclusively until it is returned, so
+    concurrent requests never share a cursor. Connections are opened lazily
+    and at most ``max_size`` are checked out at once.
+    """
+
+    def __init__(self, path: str = DB_PATH, max_size: int = READ_POOL_SIZE) -> None:
+        self._path = path
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(max_size)
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        self._slots.acquire()
+        try:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                conn = connect_readonly(self._path)
+            try:
+                yield conn
+            finally:
+                self._idle.put(conn)
+        finally:
+            self._slots.release()
+
+    def close_all(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+read_pool = ReadConnectionPool()
+
+
+def get_read_db() -> Generator[sqlite3.Cursor, None, None]:
+    """FastAPI dependency yielding a cursor on a pooled read-only connection."""
+
+    with read_pool.connection() as conn:
+        cursor = conn.cursor()
+        try:
+            yield cursor
+        finally:
+            cursor.close()
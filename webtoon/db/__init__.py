@@ -2,16 +2,26 @@
 
 from __future__ import annotations
 
-from webtoon.db.session import Base, engine, get_session
+from webtoon.db.migrations import run_migrations
+from webtoon.db.session import Base, engine, get_session, get_write_session
 
 
 def init_db() -> None:
-    """Create all ORM tables registered on the declarative base."""
+    """Create ORM tables and indexes, then apply pending schema migrations."""
 
     # Import models so they are registered with SQLAlchemy's metadata.
     from webtoon import models  # noqa: F401
 
     Base.metadata.create_all(bind=engine)
 
+    # Migrations run first so they can validate data before constrained
+    # indexes are created on existing tables.
+    run_migrations(engine)
 
-__all__ = ["Base", "engine", "get_session", "init_db"]
+    # create_all skips indexes on tables that already exist, so add new ones here.
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
+
+__all__ = ["Base", "engine", "get_session", "get_write_session", "init_db"]
@@ -0,0 +1,55 @@
+"""Async SQLAlchemy session helpers (aiosqlite) for the review endpoints."""
+
+from __future__ import annotations
+
+from typing import AsyncGenerator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from webtoon.database import DB_PATH
+from webtoon.db.session import _configure_sqlite_connection, instrument_engine
+
+ASYNC_DATABASE_URL = f"sqlite+aiosqlite:///{DB_PATH}"
+
+_async_engine: Optional[AsyncEngine] = None
+_async_session_factory: Optional[async_sessionmaker[AsyncSession]] = None
+
+
+def get_async_engine() -> AsyncEngine:
+    """Create the aiosqlite engine on first use so sync deployments never import the driver."""
+
+    global _async_engine, _async_session_factory
+    if _async_engine is None:
+        _async_engine = create_async_engine(ASYNC_DATABASE_URL)
+        event.listen(_async_engine.sync_engine, "connect", _configure_sqlite_connection)
+        instrument_engine(_async_engine.sync_engine)
+        _async_session_factory = async_sessionmaker(
+            bind=_async_engine, autoflush=False, expire_on_commit=False
+        )
+    return _async_engine
+
+
+def new_async_session() -> AsyncSession:
+    get_async_engine()
+    return _async_session_factory()
+
+
+async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
+    """Yield an async database session that is cleaned up after the request."""
+
+    async with new_async_session() as db:
+        yield db
+
+
+async def dispose_async_engine() -> None:
+    global _async_engine, _async_session_factory
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
+        _async_session_factory = None
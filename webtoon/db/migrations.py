@@ -0,0 +1,260 @@
+"""Versioned schema migrations for tables that already exist in deployed DBs."""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Callable, NamedTuple
+
+from sqlalchemy import Connection, Engine, inspect, text
+
+from webtoon.sql_functions import register_functions
+
+logger = logging.getLogger(__name__)
+
+
+class MigrationError(RuntimeError):
+    """Raised when existing data prevents a migration from being applied."""
+
+
+class Migration(NamedTuple):
+    version: int
+    name: str
+    apply: Callable[[Connection], None]
+
+
+def _has_column(conn: Connection, table: str, column: str) -> bool:
+    return any(c["name"] == column for c in inspect(conn).get_columns(table))
+
+
+def _add_rating_sum(conn: Connection) -> None:
+    if not _has_column(conn, "webtoon_rating_stats", "rating_sum"):
+        conn.execute(
+            text(
+                "ALTER TABLE webtoon_rating_stats "
+                "ADD COLUMN rating_sum INTEGER NOT NULL DEFAULT 0"
+            )
+        )
+    # Backfill from the reviews themselves rather than the drifted averages.
+    _backfill_rating_sum(conn)
+
+
+def _backfill_rating_sum(conn: Connection) -> None:
+    conn.execute(
+        text(
+            """
+            UPDATE webtoon_rating_stats
+            SET rating_sum = COALESCE(
+                (
+                    SELECT SUM(CAST(ROUND(r.rating * 100) AS INTEGER))
+                    FROM reviews AS r
+                    WHERE r.webtoon_id = webtoon_rating_stats.webtoon_id
+                ),
+                0
+            ),
+            review_count = (
+                SELECT COUNT(*)
+                FROM reviews AS r
+                WHERE r.webtoon_id = webtoon_rating_stats.webtoon_id
+            )
+            """
+        )
+    )
+
+
+def _add_review_indexes(conn: Connection) -> None:
+    duplicates = conn.execute(
+        text(
+            """
+            SELECT webtoon_id, anonymous_user_id, COUNT(*) AS copies
+            FROM reviews
+            GROUP BY webtoon_id, anonymous_user_id
+            HAVING COUNT(*) > 1
+            ORDER BY copies DESC
+            LIMIT 5
+            """
+        )
+    ).all()
+    if duplicates:
+        sample = ", ".join(f"{w}/{u} x{n}" for w, u, n in duplicates)
+        raise MigrationError(
+            "reviews has several rows per (webtoon_id, anonymous_user_id); "
+            f"remove the extra rows before migrating (e.g. {sample})"
+        )
+
+    # Both are prefixes of the new indexes below.
+    conn.execute(text("DROP INDEX IF EXISTS ix_reviews_webtoon_id"))
+    conn.execute(text("DROP INDEX IF EXISTS ix_reviews_webtoon_created_id"))
+    conn.execute(
+        text(
+            "CREATE UNIQUE INDEX IF NOT EXISTS uq_reviews_webtoon_anonymous_user "
+            "ON reviews (webtoon_id, anonymous_user_id)"
+        )
+    )
+    conn.execute(
+        text(
+            "CREATE INDEX IF NOT EXISTS ix_reviews_webtoon_created_desc_id "
+            "ON reviews (webtoon_id, created_at DESC, id DESC)"
+        )
+    )
+
+    # The normalized_webtoon indexes are re-created at startup by
+    # ensure_catalog_indexes(), since a catalog import drops them with the table.
+    conn.execute(text("ANALYZE"))
+
+
+def _add_review_created_index(conn: Connection) -> None:
+    # Lets the leaderboard read the recent-review window without a table scan.
+    conn.execute(
+        text("CREATE INDEX IF NOT EXISTS ix_reviews_created_at ON reviews (created_at)")
+    )
+
+
+def _add_hot_score(conn: Connection) -> None:
+    if not _has_column(conn, "reviews", "hot_score"):
+        conn.execute(
+            text("ALTER TABLE reviews ADD COLUMN hot_score FLOAT NOT NULL DEFAULT 0")
+        )
+    # The migration may run on an engine without the app's connect hook.
+    register_functions(conn.connection.dbapi_connection)
+    conn.execute(
+        text("UPDATE reviews SET hot_score = hot_score(likes, created_at, :now)"),
+        {"now": time.time()},
+    )
+    conn.execute(
+        text(
+            "CREATE INDEX IF NOT EXISTS ix_reviews_webtoon_likes_id "
+            "ON reviews (webtoon_id, likes DESC, id DESC)"
+        )
+    )
+    conn.execute(
+        text(
+            "CREATE INDEX IF NOT EXISTS ix_reviews_webtoon_hot_id "
+            "ON reviews (webtoon_id, hot_score DESC, id DESC)"
+        )
+    )
+    # Without fresh statistics the planner may serve the recent listing from
+    # one of the new indexes and sort in a temp B-tree.
+    conn.execute(text("ANALYZE reviews"))
+
+
+def _backfill_rating_buckets(conn: Connection) -> None:
+    # create_all has already created the (empty) table. Buckets are half-star
+    # wide and rounded to the nearest half, matching to_rating_bucket().
+    conn.execute(text("DELETE FROM webtoon_rating_buckets"))
+    conn.execute(
+        text(
+            """
+            INSERT INTO webtoon_rating_buckets (webtoon_id, bucket, review_count)
+            SELECT webtoon_id, (CAST(ROUND(rating * 100) AS INTEGER) + 25) / 50 AS bucket, COUNT(*)
+            FROM reviews
+            GROUP BY webtoon_id, bucket
+            """
+        )
+    )
+
+
+# Rating points and half-star bucket of a row, as to_rating_points() and
+# to_rating_bucket() compute them.
+_POINTS = "CAST(ROUND({row}.rating * 100) AS INTEGER)"
+_BUCKET = "(" + _POINTS + " + 25) / 50"
+
+REVIEW_RATING_TRIGGERS: dict[str, str] = {
+    "reviews_rating_au": f"""
+        CREATE TRIGGER IF NOT EXISTS reviews_rating_au
+        AFTER UPDATE OF rating ON reviews
+        WHEN {_POINTS.format(row="old")} != {_POINTS.format(row="new")}
+        BEGIN
+            UPDATE webtoon_rating_stats
+            SET rating_sum = rating_sum + {_POINTS.format(row="new")} - {_POINTS.format(row="old")},
+                updated_at = CURRENT_TIMESTAMP
+            WHERE webtoon_id = new.webtoon_id;
+            UPDATE webtoon_rating_buckets
+            SET review_count = review_count - 1
+            WHERE webtoon_id = old.webtoon_id
+              AND bucket = {_BUCKET.format(row="old")}
+              AND review_count > 0;
+            INSERT INTO webtoon_rating_buckets (webtoon_id, bucket, review_count)
+            VALUES (new.webtoon_id, {_BUCKET.format(row="new")}, 1)
+            ON CONFLICT (webtoon_id, bucket) DO UPDATE SET review_count = review_count + 1;
+        END
+    """,
+    "reviews_rating_ad": f"""
+        CREATE TRIGGER IF NOT EXISTS reviews_rating_ad
+        AFTER DELETE ON reviews
+        BEGIN
+            UPDATE webtoon_rating_stats
+            SET rating_sum = rating_sum - {_POINTS.format(row="old")},
+                review_count = review_count - 1,
+                updated_at = CURRENT_TIMESTAMP
+            WHERE webtoon_id = old.webtoon_id AND review_count > 0;
+            UPDATE webtoon_rating_buckets
+            SET review_count = review_count - 1
+            WHERE webtoon_id = old.webtoon_id
+              AND bucket = {_BUCKET.format(row="old")}
+              AND review_count > 0;
+        END
+    """,
+}
+
+
+def _add_rating_triggers(conn: Connection) -> None:
+    # The old rating is read by SQLite inside the UPDATE itself, so two
+    # concurrent edits of one review can no longer apply a stale delta.
+    for ddl in REVIEW_RATING_TRIGGERS.values():
+        conn.execute(text(ddl))
+    # Repair whatever drift the application-side deltas left behind.
+    _backfill_rating_sum(conn)
+    _backfill_rating_buckets(conn)
+
+
+MIGRATIONS: list[Migration] = [
+    Migration(1, "webtoon_rating_stats.rating_sum", _add_rating_sum),
+    Migration(2, "reviews unique author and listing indexes", _add_review_indexes),
+    Migration(3, "reviews.created_at index", _add_review_created_index),
+    Migration(4, "reviews.hot_score and likes/hot listing indexes", _add_hot_score),
+    Migration(5, "webtoon_rating_buckets backfill", _backfill_rating_buckets),
+    Migration(6, "reviews rating_sum and bucket triggers", _add_rating_triggers),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1].version
+
+
+def _ensure_version_table(conn: Connection) -> None:
+    conn.execute(
+        text(
+            """
+            CREATE TABLE IF NOT EXISTS schema_migrations (
+                version INTEGER PRIMARY KEY,
+                name TEXT NOT NULL,
+                applied_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+            )
+            """
+        )
+    )
+
+
+def current_version(conn: Connection) -> int:
+    _ensure_version_table(conn)
+    return conn.execute(text("SELECT COALESCE(MAX(version), 0) FROM schema_migrations")).scalar_one()
+
+
+def run_migrations(bind: Engine) -> list[int]:
+    """Apply pending migrations in order, each in its own transaction."""
+
+    applied: list[int] = []
+    with bind.begin() as conn:
+        version = current_version(conn)
+
+    for migration in MIGRATIONS:
+        if migration.version <= version:
+            continue
+        with bind.begin() as conn:
+            logger.info("Applying migration %d (%s)", migration.version, migration.name)
+            migration.apply(conn)
+            conn.execute(
+                text("INSERT INTO schema_migrations (version, name) VALUES (:version, :name)"),
+                {"version": migration.version, "name": migration.name},
+            )
+        applied.append(migration.version)
+    return applied
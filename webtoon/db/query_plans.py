@@ -0,0 +1,173 @@
+"""``EXPLAIN QUERY PLAN`` regression checks for the hot queries.
+
+Each check compiles the statement the application actually runs and asserts
+that SQLite answers it through the expected index without falling back to a
+full table scan or (where the index provides the order) a temp B-tree sort.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from typing import Any, Callable, NamedTuple, Sequence, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.sql import ClauseElement
+
+from webtoon.models import WebtoonRatingStats
+from webtoon.pagination import encode_cursor
+from webtoon.services.review_service import (
+    like_increment_statement,
+    like_insert_statement,
+    own_review_statement,
+    review_page_statement,
+    webtoon_exists_statement,
+)
+from webtoon.services.leaderboard import RECENT_REVIEWS_QUERY
+from webtoon.services.search_index import fts_query, like_query
+
+Statement = Tuple[str, Sequence[Any]]
+
+_DIALECT = sqlite.dialect()
+_SAMPLE_WEBTOON = "kakao_1000"
+_SAMPLE_USER = "00000000-0000-0000-0000-000000000000"
+
+
+class PlanCheck(NamedTuple):
+    name: str
+    build: Callable[[], Statement]
+    # Every fragment must appear in the plan...
+    expect: Tuple[str, ...]
+    # ...and none of these may.
+    forbid: Tuple[str, ...] = ("USE TEMP B-TREE",)
+
+
+class PlanResult(NamedTuple):
+    name: str
+    plan: list[str]
+    problems: list[str]
+
+    @property
+    def ok(self) -> bool:
+        return not self.problems
+
+
+def compile_statement(stmt: ClauseElement) -> Statement:
+    compiled = stmt.compile(dialect=_DIALECT)
+    params = compiled.params
+    return str(compiled), [params[name] for name in compiled.positiontup or ()]
+
+
+PLAN_CHECKS: list[PlanCheck] = [
+    PlanCheck(
+        "reviews page (offset)",
+        lambda: compile_statement(
+            review_page_statement(webtoon_id=_SAMPLE_WEBTOON, page=3, limit=10, cursor=None)
+        ),
+        ("USING INDEX ix_reviews_webtoon_created_desc_id",),
+    ),
+    PlanCheck(
+        "reviews page (cursor)",
+        lambda: compile_statement(
+            review_page_statement(
+                webtoon_id=_SAMPLE_WEBTOON,
+                page=1,
+                limit=10,
+                cursor=encode_cursor("2025-01-01 00:00:00", 100),
+            )
+        ),
+        ("USING INDEX ix_reviews_webtoon_created_desc_id", "created_at<?"),
+    ),
+    PlanCheck(
+        "reviews page (likes cursor)",
+        lambda: compile_statement(
+            review_page_statement(
+                webtoon_id=_SAMPLE_WEBTOON,
+                page=1,
+                limit=10,
+                cursor=encode_cursor("likes", 5, 100),
+                sort="likes",
+            )
+        ),
+        ("USING INDEX ix_reviews_webtoon_likes_id",),
+    ),
+    PlanCheck(
+        "reviews page (hot)",
+        lambda: compile_statement(
+            review_page_statement(
+                webtoon_id=_SAMPLE_WEBTOON, page=2, limit=10, cursor=None, sort="hot"
+            )
+        ),
+        ("USING INDEX ix_reviews_webtoon_hot_id",),
+    ),
+    PlanCheck(
+        "own review lookup",
+        lambda: compile_statement(own_review_statement(_SAMPLE_WEBTOON, _SAMPLE_USER)),
+        ("USING INDEX uq_reviews_webtoon_anonymous_user",),
+    ),
+    PlanCheck(
+        "rating stats lookup",
+        lambda: compile_statement(
+            select(WebtoonRatingStats).where(WebtoonRatingStats.webtoon_id == _SAMPLE_WEBTOON)
+        ),
+        ("USING INDEX sqlite_autoindex_webtoon_rating_stats_1",),
+    ),
+    PlanCheck(
+        "like insert",
+        lambda: compile_statement(like_insert_statement(1, _SAMPLE_USER)),
+        ("USING INTEGER PRIMARY KEY",),
+        ("SCAN reviews",),
+    ),
+    PlanCheck(
+        "like increment",
+        lambda: compile_statement(like_increment_statement(1)),
+        ("USING INTEGER PRIMARY KEY",),
+    ),
+    PlanCheck(
+        "webtoon exists",
+        lambda: compile_statement(webtoon_exists_statement(_SAMPLE_WEBTOON)),
+        ("USING COVERING INDEX ix_normalized_webtoon_id",),
+    ),
+    PlanCheck(
+        "search fts (day)",
+        lambda: fts_query(q="sample", day="MON", limit=50, offset=0),
+        ("VIRTUAL TABLE INDEX", "USING INTEGER PRIMARY KEY"),
+        # bm25 ordering always needs a sort; only guard the join.
+        ("SCAN w",),
+    ),
+    PlanCheck(
+        "search like (day)",
+        lambda: like_query(q="sample", day="MON", limit=50, offset=0),
+        ("USING INDEX ix_normalized_webtoon_update_days_id",),
+        ("SCAN w", "USE TEMP B-TREE"),
+    ),
+    PlanCheck(
+        "leaderboard recent window",
+        lambda: (RECENT_REVIEWS_QUERY, ["2025-01-01 00:00:00"]),
+        ("USING INDEX ix_reviews_created_at",),
+    ),
+]
+
+
+def explain(conn: sqlite3.Connection, sql: str, params: Sequence[Any]) -> list[str]:
+    """Return the ``detail`` column of ``EXPLAIN QUERY PLAN`` for the statement."""
+
+    return [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", list(params))]
+
+
+def check_query_plans(
+    conn: sqlite3.Connection, checks: Sequence[PlanCheck] = PLAN_CHECKS
+) -> list[PlanResult]:
+    results: list[PlanResult] = []
+    for check in checks:
+        try:
+            plan = explain(conn, *check.build())
+        except sqlite3.OperationalError as exc:
+            # e.g. the FTS table of a database the app has not started against yet
+            results.append(PlanResult(check.name, [], [f"cannot plan: {exc}"]))
+            continue
+        text = "\n".join(plan)
+        problems = [f"missing '{fragment}'" for fragment in check.expect if fragment not in text]
+        problems += [f"unexpected '{fragment}'" for fragment in check.forbid if fragment in text]
+        results.append(PlanResult(check.name, plan, problems))
+    return results
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
-from typing import Generator
+import os
+import time
+from typing import Any, Generator
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 
-from webtoon.database import DB_PATH
+from webtoon.database import DB_PATH, READ_CACHE_SIZE_KIB, READ_MMAP_SIZE
+from webtoon.metrics import METRICS_ENABLED, record_query
+from webtoon.sql_functions import register_functions
 
 
 class Base(DeclarativeBase):
@@ -16,13 +21,87 @@ class Base(DeclarativeBase):
 
 DATABASE_URL = f"sqlite:///{DB_PATH}"
 
+BUSY_TIMEOUT_MS = int(os.getenv("WEBTOON_SQLITE_BUSY_TIMEOUT_MS", "5000"))
+# When enabled, every write request queues for the single writer connection.
+SERIALIZE_WRITES = os.getenv("WEBTOON_SERIALIZE_WRITES", "0") == "1"
+WRITER_QUEUE_TIMEOUT = float(os.getenv("WEBTOON_WRITER_QUEUE_TIMEOUT", "30"))
 
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False},
-)
+
+def _configure_sqlite_connection(dbapi_connection: Any, connection_record: Any) -> None:
+    """Apply WAL journaling, tuning pragmas and app SQL functions to every new connection."""
+
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("PRAGMA journal_mode = WAL")
+        cursor.execute("PRAGMA synchronous = NORMAL")
+        cursor.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+        cursor.execute(f"PRAGMA mmap_size = {READ_MMAP_SIZE}")
+        cursor.execute(f"PRAGMA cache_size = -{READ_CACHE_SIZE_KIB}")
+        cursor.execute("PRAGMA temp_store = MEMORY")
+    finally:
+        cursor.close()
+    register_functions(dbapi_connection)
+
+
+def _disable_driver_transactions(dbapi_connection: Any, connection_record: Any) -> None:
+    # Let SQLAlchemy's "begin" hook issue BEGIN instead of pysqlite's implicit one.
+    dbapi_connection.isolation_level = None
+
+
+def _begin_immediate(conn: Any) -> None:
+    # Take the write lock up front so the transaction never has to upgrade
+    # from a read snapshot (which fails with SQLITE_BUSY_SNAPSHOT under WAL).
+    conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+
+def _before_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+) -> None:
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+) -> None:
+    started = conn.info["query_started"].pop()
+    record_query("sqlalchemy", statement, parameters, time.perf_counter() - started)
+
+
+def instrument_engine(target: Engine) -> None:
+    """Report every statement executed through ``target`` to ``webtoon.metrics``."""
+
+    if METRICS_ENABLED:
+        event.listen(target, "before_cursor_execute", _before_cursor_execute)
+        event.listen(target, "after_cursor_execute", _after_cursor_execute)
+
+
+def _create_engine(**kwargs: Any) -> Engine:
+    created = create_engine(
+        DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        **kwargs,
+    )
+    event.listen(created, "connect", _configure_sqlite_connection)
+    instrument_engine(created)
+    return created
+
+
+engine = _create_engine()
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
 
+# A pool with exactly one connection acts as the write queue: requests wait in
+# pool checkout until the current writer commits or rolls back.
+writer_engine = _create_engine(
+    pool_size=1,
+    max_overflow=0,
+    pool_timeout=WRITER_QUEUE_TIMEOUT,
+)
+event.listen(writer_engine, "connect", _disable_driver_transactions)
+event.listen(writer_engine, "begin", _begin_immediate)
+WriterSessionLocal = sessionmaker(
+    bind=writer_engine, autoflush=False, autocommit=False, future=True
+)
+
 
 def get_session() -> Generator[Session, None, None]:
     """Yield a database session that is cleaned up after the request."""
@@ -32,3 +111,23 @@ def get_session() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+
+def new_write_session() -> Session:
+    """Return a session for writes.
+
+    With ``WEBTOON_SERIALIZE_WRITES=1`` the session is bound to the dedicated
+    single-connection writer engine; otherwise it is a regular session.
+    """
+
+    return WriterSessionLocal() if SERIALIZE_WRITES else SessionLocal()
+
+
+def get_write_session() -> Generator[Session, None, None]:
+    """Yield a write session (see ``new_write_session``) for the request."""
+
+    db = new_write_session()
+    try:
+        yield db
+    finally:
+        db.close()
@@ -1,5 +1,6 @@
 """Dependency helpers exposed by the webtoon package."""
 
 from webtoon.dependencies.auth import get_anonymous_user_id
+from webtoon.dependencies.rate_limit import RateLimiter, review_like_limit, review_write_limit
 
-__all__ = ["get_anonymous_user_id"]
+__all__ = ["RateLimiter", "get_anonymous_user_id", "review_like_limit", "review_write_limit"]
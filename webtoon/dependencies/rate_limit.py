@@ -0,0 +1,280 @@
+"""Token-bucket rate limiting for the review write endpoints.
+
+Every limited route checks two buckets: one per client IP and one per
+``anon_id``. The IP bucket exists because a client that drops its cookie
+gets a fresh ``anon_id`` (and a fresh bucket) on every request.
+
+Buckets live either in this process (``memory``, an LRU of at most
+``WEBTOON_RATE_LIMIT_MAX_KEYS`` entries) or in a memory-mapped table shared
+by every worker on the host (``shared``). Either way a request costs one
+hash lookup and a few float operations per bucket.
+"""
+
+# No ``from __future__ import annotations`` here: FastAPI resolves the
+# parameters of ``RateLimiter.__call__`` at runtime and cannot see this
+# module's globals through an instance.
+
+import fcntl
+import hashlib
+import math
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Final, NamedTuple, Optional, Protocol
+
+from fastapi import Depends, HTTPException, Request, status
+
+from webtoon.dependencies.auth import get_anonymous_user_id
+from webtoon.metrics import RATE_LIMITED
+
+RATE_LIMIT_ENABLED: Final[bool] = os.getenv("WEBTOON_RATE_LIMIT", "1") == "1"
+RATE_LIMIT_BACKEND: Final[str] = os.getenv("WEBTOON_RATE_LIMIT_BACKEND", "memory")
+RATE_LIMIT_MAX_KEYS: Final[int] = int(os.getenv("WEBTOON_RATE_LIMIT_MAX_KEYS", "100000"))
+RATE_LIMIT_SHARED_PATH: Final[str] = os.getenv(
+    "WEBTOON_RATE_LIMIT_SHARED_PATH",
+    os.path.join("/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir(), "webtoon-rate-limit"),
+)
+# 프록시 뒤에서만 켠다. 켜면 X-Forwarded-For 의 마지막 주소를 클라이언트 IP 로 본다.
+RATE_LIMIT_TRUST_PROXY: Final[bool] = os.getenv("WEBTOON_RATE_LIMIT_TRUST_PROXY", "0") == "1"
+
+
+class RateLimit(NamedTuple):
+    """``capacity`` requests per ``period`` seconds, refilled continuously."""
+
+    capacity: float
+    period: float
+
+    @property
+    def rate(self) -> float:
+        return self.capacity / self.period
+
+
+def parse_limit(spec: str) -> Optional[RateLimit]:
+    """Parse ``"N/S"`` (N requests per S seconds); ``"0"`` or ``"off"`` disables the bucket."""
+
+    spec = spec.strip().lower()
+    if spec in ("", "0", "off"):
+        return None
+    count, _, seconds = spec.partition("/")
+    limit = RateLimit(float(count), float(seconds or 1))
+    if limit.capacity <= 0 or limit.period <= 0:
+        raise ValueError(f"invalid rate limit {spec!r}")
+    return limit
+
+
+def _limit_from_env(name: str, default: str) -> Optional[RateLimit]:
+    return parse_limit(os.getenv(name, default))
+
+
+class BucketBackend(Protocol):
+    def take(self, key: str, limit: RateLimit, now: float) -> float:
+        """Take one token; return 0 when allowed, else the seconds until one is available."""
+
+    def refund(self, key: str, limit: RateLimit) -> None:
+        """Give back a token taken by ``take`` for a request rejected by another bucket."""
+
+
+def _consume(tokens: float, updated: float, limit: RateLimit, now: float) -> tuple[float, float]:
+    """Refill a bucket up to ``now`` and try to take one token.
+
+    Returns the remaining tokens and the wait in seconds (0 when allowed).
+    """
+
+    tokens = min(limit.capacity, tokens + max(0.0, now - updated) * limit.rate)
+    if tokens >= 1:
+        return tokens - 1, 0.0
+    return tokens, (1 - tokens) / limit.rate
+
+
+class MemoryBuckets:
+    """Buckets of this process; the least recently used one is dropped past ``max_keys``."""
+
+    def __init__(self, max_keys: int = RATE_LIMIT_MAX_KEYS) -> None:
+        self._max_keys = max_keys
+        self._lock = threading.Lock()
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def take(self, key: str, limit: RateLimit, now: float) -> float:
+        with self._lock:
+            tokens, updated = self._buckets.get(key, (limit.capacity, now))
+            tokens, wait = _consume(tokens, updated, limit, now)
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+            if len(self._buckets) > self._max_keys:
+                self._buckets.popitem(last=False)
+            return wait
+
+    def refund(self, key: str, limit: RateLimit) -> None:
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                self._buckets[key] = (min(limit.capacity, bucket[0] + 1), bucket[1])
+
+
+class SharedBuckets:
+    """Buckets in a memory-mapped file shared by every worker process on the host.
+
+    The table is set-associative: a key hashes to one set of ``WAYS`` slots
+    and, when the set is full, replaces the slot that was used longest ago
+    (an idle bucket is full again anyway). Each set is guarded by a POSIX
+    record lock on its byte range, so workers only contend on the same set.
+    Timestamps are ``time.monotonic()``, which is system-wide on Linux.
+    """
+
+    WAYS: Final[int] = 8
+    _SLOT = struct.Struct("=16sdd")  # key digest, tokens, updated
+    _MAGIC: Final[bytes] = b"WTRL\x00v1\x00"
+    _HEADER = struct.Struct("=8sQ")  # magic, number of sets
+
+    def __init__(self, path: str = RATE_LIMIT_SHARED_PATH, max_keys: int = RATE_LIMIT_MAX_KEYS) -> None:
+        self._sets = max(1, math.ceil(max_keys / self.WAYS))
+        self._set_size = self._SLOT.size * self.WAYS
+        size = self._HEADER.size + self._sets * self._set_size
+        # Record locks are per process, so threads of this worker also share a lock.
+        self._lock = threading.Lock()
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        fcntl.lockf(self._fd, fcntl.LOCK_EX, self._HEADER.size, 0)
+        try:
+            header = os.pread(self._fd, self._HEADER.size, 0)
+            if os.fstat(self._fd).st_size != size or header != self._HEADER.pack(self._MAGIC, self._sets):
+                # A table laid out for another size is reset (every bucket starts full).
+                os.ftruncate(self._fd, 0)
+                os.ftruncate(self._fd, size)
+                os.pwrite(self._fd, self._HEADER.pack(self._MAGIC, self._sets), 0)
+        finally:
+            fcntl.lockf(self._fd, fcntl.LOCK_UN, self._HEADER.size, 0)
+        self._map = mmap.mmap(self._fd, size)
+
+    def take(self, key: str, limit: RateLimit, now: float) -> float:
+        digest, start = self._locate(key)
+        with self._lock:
+            fcntl.lockf(self._fd, fcntl.LOCK_EX, self._set_size, start)
+            try:
+                offset, tokens, updated = self._find_slot(digest, start)
+                if tokens is None:
+                    tokens, updated = limit.capacity, now
+                tokens, wait = _consume(tokens, updated, limit, now)
+                self._SLOT.pack_into(self._map, offset, digest, tokens, now)
+                return wait
+            finally:
+                fcntl.lockf(self._fd, fcntl.LOCK_UN, self._set_size, start)
+
+    def refund(self, key: str, limit: RateLimit) -> None:
+        digest, start = self._locate(key)
+        with self._lock:
+            fcntl.lockf(self._fd, fcntl.LOCK_EX, self._set_size, start)
+            try:
+                offset, tokens, updated = self._find_slot(digest, start)
+                # An evicted bucket is full again, so there is nothing to give back.
+                if tokens is not None:
+                    self._SLOT.pack_into(self._map, offset, digest, min(limit.capacity, tokens + 1), updated)
+            finally:
+                fcntl.lockf(self._fd, fcntl.LOCK_UN, self._set_size, start)
+
+    def _locate(self, key: str) -> tuple[bytes, int]:
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        return digest, self._HEADER.size + int.from_bytes(digest[:8], "little") % self._sets * self._set_size
+
+    def _find_slot(self, digest: bytes, start: int) -> tuple[int, Optional[float], float]:
+        victim, victim_updated = start, math.inf
+        for offset in range(start, start + self._set_size, self._SLOT.size):
+            slot_digest, tokens, updated = self._SLOT.unpack_from(self._map, offset)
+            if slot_digest == digest:
+                return offset, tokens, updated
+            if not any(slot_digest):
+                updated = -math.inf
+            if updated < victim_updated:
+                victim, victim_updated = offset, updated
+        return victim, None, 0.0
+
+
+_backend: Optional[BucketBackend] = None
+_backend_lock = threading.Lock()
+
+
+def rate_limit_backend() -> BucketBackend:
+    """Return the process-wide bucket store, creating it on first use."""
+
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                _backend = SharedBuckets() if RATE_LIMIT_BACKEND == "shared" else MemoryBuckets()
+    return _backend
+
+
+def client_ip(request: Request) -> str:
+    if RATE_LIMIT_TRUST_PROXY:
+        forwarded = request.headers.get("x-forwarded-for")
+        if forwarded:
+            return forwarded.rsplit(",", 1)[-1].strip()
+    return request.client.host if request.client else "unknown"
+
+
+class RateLimiter:
+    """FastAPI dependency enforcing the per-IP and per-``anon_id`` buckets of one route group.
+
+    Rejected requests get ``429`` with ``Retry-After`` (whole seconds) and
+    consume no token: an IP token taken before the ``anon_id`` bucket refused
+    the request is refunded. The check runs on the event loop: it never waits on anything slower than a
+    lock held for a few microseconds.
+    """
+
+    def __init__(
+        self,
+        scope: str,
+        *,
+        per_anon: Optional[RateLimit],
+        per_ip: Optional[RateLimit],
+        backend: Optional[BucketBackend] = None,
+    ) -> None:
+        self.scope = scope
+        self.per_anon = per_anon
+        self.per_ip = per_ip
+        self._backend = backend
+
+    async def __call__(
+        self,
+        request: Request,
+        anonymous_user_id: str = Depends(get_anonymous_user_id),
+    ) -> None:
+        if not RATE_LIMIT_ENABLED:
+            return
+        backend = self._backend or rate_limit_backend()
+        now = time.monotonic()
+        wait = 0.0
+        ip_key = f"{self.scope}:ip:{client_ip(request)}"
+        if self.per_ip is not None:
+            wait = backend.take(ip_key, self.per_ip, now)
+        if not wait and self.per_anon is not None:
+            wait = backend.take(f"{self.scope}:anon:{anonymous_user_id}", self.per_anon, now)
+            if wait and self.per_ip is not None:
+                # 한 anon_id 가 막혔다고 같은 IP 의 다른 사용자 몫까지 줄이지 않는다.
+                backend.refund(ip_key, self.per_ip)
+        if wait:
+            RATE_LIMITED.inc(self.scope)
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="요청이 너무 많습니다. 잠시 후 다시 시도해 주세요.",
+                headers={"Retry-After": str(max(1, math.ceil(wait)))},
+            )
+
+
+# 리뷰 작성/수정과 좋아요에 각각 적용되는 제한 (N/S: S초에 N회)
+review_write_limit = RateLimiter(
+    "review_write",
+    per_anon=_limit_from_env("WEBTOON_RATE_LIMIT_REVIEW_WRITE", "10/60"),
+    per_ip=_limit_from_env("WEBTOON_RATE_LIMIT_REVIEW_WRITE_IP", "60/60"),
+)
+review_like_limit = RateLimiter(
+    "review_like",
+    per_anon=_limit_from_env("WEBTOON_RATE_LIMIT_REVIEW_LIKE", "60/60"),
+    per_ip=_limit_from_env("WEBTOON_RATE_LIMIT_REVIEW_LIKE_IP", "600/60"),
+)
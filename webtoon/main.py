@@ -1,23 +1,119 @@
 # webtoon/main.py
+import time
+
+# 콜드 스타트 측정용: 이 모듈의 import 시작 시각
+_IMPORT_STARTED = time.perf_counter()
+
+import logging
+import os
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from webtoon.db import Base, engine
+from webtoon.database import read_pool
+from webtoon.db.async_session import dispose_async_engine
+from webtoon.db.session import SERIALIZE_WRITES
+from webtoon.metrics import METRICS_ENABLED
+from webtoon.middleware import CompressionMiddleware, RequestMetricsMiddleware
+from webtoon.middleware.compression import COMPRESSION_ENABLED
+from webtoon.responses import FastJSONResponse
 from webtoon.routers.auth import router as auth_router
+from webtoon.routers.health import router as health_router
+from webtoon.routers.metrics import router as metrics_router
 from webtoon.routers.reviews import router as reviews_router
 from webtoon.routers.search import router as search_router
 from webtoon.routers.webtoons import router as webtoons_router
+from webtoon.services.hot_scores import hot_score_refresher
+from webtoon.services.leaderboard import leaderboard
+from webtoon.services.like_buffer import LIKE_BUFFER_ENABLED, like_buffer
+from webtoon.startup import ensure_schema, start_prewarm, startup_state
+
+# "async" 이면 리뷰 API를 aiosqlite 기반 비동기 라우터로 처리한다.
+REVIEW_IO = os.getenv("WEBTOON_REVIEW_IO", "sync")
+
+logger = logging.getLogger("webtoon.startup")
+
+app = FastAPI(default_response_class=FastJSONResponse)
+startup_state.record("import", time.perf_counter() - _IMPORT_STARTED)
+
+
+@app.on_event("startup")
+def prepare_database() -> None:
+    """Apply the schema DDL unless the stored schema state shows it is current (WEBTOON_FAST_START)."""
+
+    ensure_schema()
+
+
+@app.on_event("startup")
+def start_prewarming() -> None:
+    """Load the catalog snapshot, its indexes and the DB pages in the background (WEBTOON_PREWARM)."""
+
+    start_prewarm()
+
+
+@app.on_event("startup")
+def start_like_buffer() -> None:
+    """Start the group-commit like buffer when WEBTOON_LIKE_BUFFER=1."""
+
+    if LIKE_BUFFER_ENABLED:
+        like_buffer.start()
+
+
+@app.on_event("startup")
+def start_leaderboard() -> None:
+    """Load the top-webtoon rankings and reconcile them periodically in the background."""
+
+    leaderboard.start()
+
+
+@app.on_event("shutdown")
+def stop_leaderboard() -> None:
+    leaderboard.stop()
+
+
+@app.on_event("startup")
+def start_hot_score_refresher() -> None:
+    """Re-decay review hot scores every WEBTOON_HOT_REFRESH_SECONDS in the background."""
+
+    hot_score_refresher.start()
 
-app = FastAPI()
+
+@app.on_event("shutdown")
+def stop_hot_score_refresher() -> None:
+    hot_score_refresher.stop()
 
 
 @app.on_event("startup")
-def ensure_tables_exist() -> None:
-    """Create ORM-managed tables if they don't already exist."""
+def report_startup() -> None:
+    """Log the startup breakdown; registered last so it runs after every other startup hook."""
+
+    startup_state.record("startup", time.perf_counter() - _IMPORT_STARTED)
+    logger.info(
+        "Startup finished (ddl %s): %s",
+        "skipped" if startup_state.ddl_skipped else "applied",
+        ", ".join(f"{phase}={ms:.1f}ms" for phase, ms in startup_state.phases.items()),
+    )
 
-    from webtoon import models  # noqa: F401  (import registers models with Base)
 
-    Base.metadata.create_all(bind=engine)
+@app.on_event("shutdown")
+def stop_like_buffer() -> None:
+    """Flush buffered likes before the process exits."""
+
+    like_buffer.stop()
+
+
+@app.on_event("shutdown")
+def close_read_connections() -> None:
+    """Close idle pooled read-only SQLite connections."""
+
+    read_pool.close_all()
+
+
+@app.on_event("shutdown")
+async def close_async_engine() -> None:
+    """Dispose the aiosqlite engine if the async review routes opened it."""
+
+    await dispose_async_engine()
 
 
 # CORS 미들웨어 설정
@@ -29,8 +125,30 @@ app.add_middleware(
     allow_headers=["*"],            # 모든 헤더 허용
 )
 
+# Accept-Encoding 에 맞춰 br/gzip 으로 응답을 압축한다 (WEBTOON_COMPRESSION=0 이면 비활성화).
+if COMPRESSION_ENABLED:
+    app.add_middleware(CompressionMiddleware)
+
+# 요청별 지연 시간과 SQL 사용량을 수집한다 (WEBTOON_METRICS=0 이면 비활성화).
+if METRICS_ENABLED:
+    app.add_middleware(RequestMetricsMiddleware)
+
 # 라우터 등록
 app.include_router(webtoons_router)
+# search 라우터의 /{webtoon_id} 보다 먼저 등록해야 한다.
+app.include_router(health_router)
+if METRICS_ENABLED:
+    # search 라우터의 /{webtoon_id} 보다 먼저 등록해야 한다.
+    app.include_router(metrics_router)
 app.include_router(search_router)
+if REVIEW_IO == "async":
+    from webtoon.routers.reviews_async import router as reviews_async_router
+    from webtoon.routers.reviews_async import write_router as reviews_async_write_router
+
+    # 같은 경로를 먼저 등록해 동기 라우터보다 우선 매칭되게 한다.
+    app.include_router(reviews_async_router)
+    # 단일 writer 연결로 쓰기를 직렬화하는 설정이면 쓰기는 동기 라우터(스레드풀)에 남긴다.
+    if not SERIALIZE_WRITES:
+        app.include_router(reviews_async_write_router)
 app.include_router(reviews_router)
 app.include_router(auth_router)
@@ -0,0 +1,240 @@
+"""In-process request/SQL metrics rendered in the Prometheus text format.
+
+Everything here is plain counters behind one lock per metric, so recording a
+sample costs a bisect and a few additions. Per-request SQL totals are kept
+in a context variable that the request middleware opens and closes; sync
+endpoints see the same object because Starlette copies the context into the
+threadpool.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+import threading
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Any, Final, Iterable, Optional, Sequence
+
+logger = logging.getLogger("webtoon.slow_query")
+
+METRICS_ENABLED: Final[bool] = os.getenv("WEBTOON_METRICS", "1") == "1"
+SLOW_QUERY_MS: Final[float] = float(os.getenv("WEBTOON_SLOW_QUERY_MS", "100"))
+
+LATENCY_BUCKETS: Final[tuple[float, ...]] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+SQL_LATENCY_BUCKETS: Final[tuple[float, ...]] = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0,
+)
+QUERY_COUNT_BUCKETS: Final[tuple[float, ...]] = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class Histogram:
+    """Cumulative-bucket histogram keyed by a fixed set of label names."""
+
+    def __init__(
+        self, name: str, documentation: str, labels: Sequence[str], buckets: Sequence[float]
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        # label values -> [per-bucket counts..., +Inf count, sum]
+        self._series: dict[tuple[str, ...], list[float]] = {}
+
+    def observe(self, value: float, *label_values: str) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[index] += 1
+            series[-1] += value
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} histogram"
+        with self._lock:
+            snapshot = {key: list(series) for key, series in self._series.items()}
+        for label_values, series in sorted(snapshot.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets, series):
+                cumulative += count
+                labels = _format_labels(self.labels, label_values, f'le="{bound:g}"')
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            cumulative += series[len(self.buckets)]
+            labels = _format_labels(self.labels, label_values, 'le="+Inf"')
+            yield f"{self.name}_bucket{labels} {cumulative}"
+            plain = _format_labels(self.labels, label_values)
+            yield f"{self.name}_sum{plain} {series[-1]:.6f}"
+            yield f"{self.name}_count{plain} {cumulative}"
+
+
+class Counter:
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self._lock = threading.Lock()
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, *label_values: str, amount: float = 1) -> None:
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} counter"
+        with self._lock:
+            snapshot = dict(self._values)
+        for label_values, value in sorted(snapshot.items()):
+            yield f"{self.name}{_format_labels(self.labels, label_values)} {value:g}"
+
+
+class Gauge(Counter):
+    def set(self, value: float, *label_values: str) -> None:
+        with self._lock:
+            self._values[label_values] = value
+
+    def render(self) -> Iterable[str]:
+        for line in super().render():
+            yield line.replace(" counter", " gauge", 1) if line.startswith("# TYPE") else line
+
+
+REQUEST_DURATION = Histogram(
+    "webtoon_http_request_duration_seconds",
+    "Time from receiving the request to sending the last body chunk.",
+    ("method", "route", "status"),
+    LATENCY_BUCKETS,
+)
+REQUEST_SQL_DURATION = Histogram(
+    "webtoon_http_request_sql_duration_seconds",
+    "Total time spent executing SQL per request.",
+    ("method", "route"),
+    LATENCY_BUCKETS,
+)
+REQUEST_SQL_QUERIES = Histogram(
+    "webtoon_http_request_sql_queries",
+    "Number of SQL statements executed per request.",
+    ("method", "route"),
+    QUERY_COUNT_BUCKETS,
+)
+REQUESTS_IN_PROGRESS = Gauge(
+    "webtoon_http_requests_in_progress",
+    "Requests currently being handled.",
+)
+SQL_DURATION = Histogram(
+    "webtoon_sql_query_duration_seconds",
+    "Duration of individual SQL statements.",
+    ("driver",),
+    SQL_LATENCY_BUCKETS,
+)
+SLOW_QUERIES = Counter(
+    "webtoon_sql_slow_queries_total",
+    "Statements slower than WEBTOON_SLOW_QUERY_MS.",
+    ("driver",),
+)
+RATE_LIMITED = Counter(
+    "webtoon_rate_limited_total",
+    "Requests rejected with 429 by a rate limiter.",
+    ("scope",),
+)
+STARTUP_PHASE = Gauge(
+    "webtoon_startup_phase_seconds",
+    "Duration of each startup phase of this worker (import, db_open, ddl, warmup, ...).",
+    ("phase",),
+)
+THREADPOOL = Gauge(
+    "webtoon_threadpool_threads",
+    "Default anyio threadpool usage (sync endpoints); waiting > 0 means queueing.",
+    ("state",),
+)
+
+_METRICS = (
+    REQUEST_DURATION,
+    REQUEST_SQL_DURATION,
+    REQUEST_SQL_QUERIES,
+    REQUESTS_IN_PROGRESS,
+    SQL_DURATION,
+    SLOW_QUERIES,
+    RATE_LIMITED,
+    STARTUP_PHASE,
+    THREADPOOL,
+)
+
+
+class RequestSQLStats:
+    __slots__ = ("queries", "seconds")
+
+    def __init__(self) -> None:
+        self.queries = 0
+        self.seconds = 0.0
+
+
+_request_sql: ContextVar[Optional[RequestSQLStats]] = ContextVar("request_sql", default=None)
+
+
+def start_request() -> tuple[RequestSQLStats, Any]:
+    stats = RequestSQLStats()
+    return stats, _request_sql.set(stats)
+
+
+def finish_request(token: Any) -> None:
+    _request_sql.reset(token)
+
+
+def redact_params(params: Any) -> str:
+    """Describe bound parameters by type only, never by value."""
+
+    if params is None:
+        return "[]"
+    if isinstance(params, dict):
+        return "{" + ", ".join(f"{key}: <{type(value).__name__}>" for key, value in params.items()) + "}"
+    if isinstance(params, (list, tuple)):
+        if params and isinstance(params[0], (list, tuple, dict)):
+            return f"<{len(params)} parameter sets>"
+        return "[" + ", ".join(f"<{type(value).__name__}>" for value in params) + "]"
+    return f"<{type(params).__name__}>"
+
+
+def record_query(driver: str, statement: str, params: Any, seconds: float) -> None:
+    """Account one executed statement to the histograms and the current request."""
+
+    SQL_DURATION.observe(seconds, driver)
+    stats = _request_sql.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.seconds += seconds
+    if seconds * 1000 >= SLOW_QUERY_MS:
+        SLOW_QUERIES.inc(driver)
+        logger.warning(
+            "Slow query (%s, %.1f ms): %s params=%s",
+            driver,
+            seconds * 1000,
+            _WHITESPACE.sub(" ", statement).strip(),
+            redact_params(params),
+        )
+
+
+def render_metrics() -> str:
+    lines: list[str] = []
+    for metric in _METRICS:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
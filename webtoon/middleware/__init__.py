@@ -0,0 +1,6 @@
+"""ASGI middleware for the webtoon backend."""
+
+from webtoon.middleware.compression import CompressionMiddleware
+from webtoon.middleware.request_metrics import RequestMetricsMiddleware
+
+__all__ = ["CompressionMiddleware", "RequestMetricsMiddleware"]
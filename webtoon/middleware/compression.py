@@ -0,0 +1,215 @@
+"""Negotiated gzip/brotli response compression."""
+
+from __future__ import annotations
+
+import gzip
+import os
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Final, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:  # brotli is optional; without it only gzip is offered.
+    import brotli
+except ImportError:  # pragma: no cover - depends on the environment
+    brotli = None
+
+COMPRESSION_ENABLED: Final[bool] = os.getenv("WEBTOON_COMPRESSION", "1") == "1"
+COMPRESS_MIN_BYTES: Final[int] = int(os.getenv("WEBTOON_COMPRESS_MIN_BYTES", "1024"))
+GZIP_LEVEL: Final[int] = int(os.getenv("WEBTOON_GZIP_LEVEL", "6"))
+BROTLI_QUALITY: Final[int] = int(os.getenv("WEBTOON_BROTLI_QUALITY", "5"))
+# Compressed bodies of ETag'd (memoized catalog) responses kept per encoding.
+COMPRESS_CACHE_SIZE: Final[int] = int(os.getenv("WEBTOON_COMPRESS_CACHE_SIZE", "256"))
+
+COMPRESSIBLE_TYPES: Final[tuple[str, ...]] = (
+    "application/json",
+    "application/x-ndjson",
+    "text/",
+)
+
+
+def supported_encodings() -> tuple[str, ...]:
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def negotiate(accept_encoding: str, offered: tuple[str, ...]) -> Optional[str]:
+    """Pick the first of ``offered`` (server preference) the client accepts with q > 0."""
+
+    accepted: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name] = quality
+
+    for encoding in offered:
+        quality = accepted.get(encoding, accepted.get("*", 0.0))
+        if quality > 0:
+            return encoding
+    return None
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+class _StreamCompressor:
+    """Incremental encoder that flushes after every chunk so streams stay live."""
+
+    def __init__(self, encoding: str) -> None:
+        self._encoding = encoding
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=BROTLI_QUALITY)
+        else:
+            self._zlib = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def chunk(self, data: bytes) -> bytes:
+        if self._encoding == "br":
+            return self._brotli.process(data) + self._brotli.flush()
+        return self._zlib.compress(data) + self._zlib.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        if self._encoding == "br":
+            return self._brotli.finish()
+        return self._zlib.flush()
+
+
+class _CompressedCache:
+    def __init__(self, max_size: int) -> None:
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self._items: OrderedDict[tuple[str, str], bytes] = OrderedDict()
+
+    def get(self, key: tuple[str, str]) -> Optional[bytes]:
+        with self._lock:
+            value = self._items.get(key)
+            if value is not None:
+                self._items.move_to_end(key)
+            return value
+
+    def put(self, key: tuple[str, str], value: bytes) -> None:
+        if self._max_size <= 0:
+            return
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self._max_size:
+                self._items.popitem(last=False)
+
+
+class CompressionMiddleware:
+    """Compress JSON/NDJSON/text responses for clients that accept br or gzip.
+
+    Whole bodies below ``minimum_size`` are sent as-is. Bodies carrying an
+    ``ETag`` (the memoized catalog responses) are compressed once per
+    ETag/encoding and served from an LRU afterwards; their ETag is weakened
+    because the bytes on the wire differ from the identity representation.
+    Streaming bodies are compressed chunk by chunk.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        minimum_size: int = COMPRESS_MIN_BYTES,
+        cache_size: int = COMPRESS_CACHE_SIZE,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self._offered = supported_encodings()
+        self._cache = _CompressedCache(cache_size)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding", ""), self._offered)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Optional[Message] = None
+        compressor: Optional[_StreamCompressor] = None
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start, compressor, passthrough
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                content_type = headers.get("content-type", "")
+                if (
+                    "content-encoding" in headers
+                    or message["status"] in (204, 304)
+                    or not content_type.startswith(COMPRESSIBLE_TYPES)
+                ):
+                    passthrough = True
+                    await send(message)
+                else:
+                    start = message
+                return
+
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body: bytes = message.get("body", b"")
+            more_body: bool = message.get("more_body", False)
+
+            if compressor is not None:
+                data = compressor.chunk(body) if body else b""
+                if not more_body:
+                    data += compressor.finish()
+                await send({"type": "http.response.body", "body": data, "more_body": more_body})
+                return
+
+            headers = MutableHeaders(raw=start["headers"])
+            headers.add_vary_header("Accept-Encoding")
+            if not more_body:
+                if len(body) < self.minimum_size:
+                    await send(start)
+                    await send(message)
+                    return
+                etag = headers.get("etag")
+                compressed = self._cached_compress(body, encoding, etag)
+                headers["content-encoding"] = encoding
+                headers["content-length"] = str(len(compressed))
+                if etag and not etag.startswith("W/"):
+                    headers["etag"] = f"W/{etag}"
+                await send(start)
+                await send({"type": "http.response.body", "body": compressed})
+                return
+
+            compressor = _StreamCompressor(encoding)
+            headers["content-encoding"] = encoding
+            if "content-length" in headers:
+                del headers["content-length"]
+            await send(start)
+            await send(
+                {"type": "http.response.body", "body": compressor.chunk(body), "more_body": True}
+            )
+
+        await self.app(scope, receive, send_wrapper)
+
+    def _cached_compress(self, body: bytes, encoding: str, etag: Optional[str]) -> bytes:
+        if not etag:
+            return compress(body, encoding)
+        key = (etag, encoding)
+        cached = self._cache.get(key)
+        if cached is None:
+            cached = compress(body, encoding)
+            self._cache.put(key, cached)
+        return cached
@@ -0,0 +1,68 @@
+"""Per-request latency and SQL accounting."""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from webtoon.metrics import (
+    REQUEST_DURATION,
+    REQUEST_SQL_DURATION,
+    REQUEST_SQL_QUERIES,
+    REQUESTS_IN_PROGRESS,
+    finish_request,
+    start_request,
+)
+
+# Requests that matched no route share one label so 404 scans can't blow up cardinality.
+UNMATCHED_ROUTE = "unmatched"
+
+
+class RequestMetricsMiddleware:
+    """Records latency, SQL time and statement count per route template.
+
+    Plain ASGI (not ``BaseHTTPMiddleware``) so streaming bodies are timed until
+    the last chunk and no extra task is spawned per request.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self._in_progress = 0
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        stats, token = start_request()
+        self._in_progress += 1
+        REQUESTS_IN_PROGRESS.set(self._in_progress)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            self._in_progress -= 1
+            REQUESTS_IN_PROGRESS.set(self._in_progress)
+            finish_request(token)
+
+            method = scope["method"]
+            route = _route_template(scope)
+            REQUEST_DURATION.observe(elapsed, method, route, str(status))
+            REQUEST_SQL_DURATION.observe(stats.seconds, method, route)
+            REQUEST_SQL_QUERIES.observe(stats.queries, method, route)
+
+
+def _route_template(scope: Scope) -> str:
+    route: Any = scope.get("route")
+    return getattr(route, "path", UNMATCHED_ROUTE)
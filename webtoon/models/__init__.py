@@ -2,6 +2,6 @@
 
 from webtoon.models.review import Review
 from webtoon.models.review_like import ReviewLike
-from webtoon.models.webtoon_rating_stats import WebtoonRatingStats
+from webtoon.models.webtoon_rating_stats import WebtoonRatingBucket, WebtoonRatingStats
 
-__all__ = ["Review", "ReviewLike", "WebtoonRatingStats"]
+__all__ = ["Review", "ReviewLike", "WebtoonRatingBucket", "WebtoonRatingStats"]
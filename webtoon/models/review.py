@@ -2,21 +2,56 @@
 
 from __future__ import annotations
 
-from sqlalchemy import Column, DateTime, Float, Integer, String, Text, func
+from sqlalchemy import Column, DateTime, Float, Index, Integer, String, Text, func, text
 
 from webtoon.db.session import Base
+from webtoon.sql_functions import INITIAL_HOT_SCORE
 
 
 class Review(Base):
     """Represents a user-submitted review for a specific webtoon."""
 
     __tablename__ = "reviews"
+    __table_args__ = (
+        # One review per anonymous user and webtoon; duplicates fail on insert.
+        Index(
+            "uq_reviews_webtoon_anonymous_user",
+            "webtoon_id",
+            "anonymous_user_id",
+            unique=True,
+        ),
+        # Matches the listing order, so pages are read without a sort step.
+        Index(
+            "ix_reviews_webtoon_created_desc_id",
+            "webtoon_id",
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
+        # Recent-window scans for the leaderboard and the hot-score refresher.
+        Index("ix_reviews_created_at", "created_at"),
+        # sort=likes / sort=hot listings, read in index order.
+        Index(
+            "ix_reviews_webtoon_likes_id",
+            "webtoon_id",
+            text("likes DESC"),
+            text("id DESC"),
+        ),
+        Index(
+            "ix_reviews_webtoon_hot_id",
+            "webtoon_id",
+            text("hot_score DESC"),
+            text("id DESC"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    webtoon_id = Column(String, nullable=False, index=True)
+    webtoon_id = Column(String, nullable=False)
     content = Column(Text, nullable=False)
     rating = Column(Float, nullable=False)
     likes = Column(Integer, nullable=False, default=0, server_default="0")
+    # Time-decayed popularity (see webtoon.sql_functions.hot_score), refreshed
+    # on every like and periodically by the hot-score refresher.
+    hot_score = Column(Float, nullable=False, default=INITIAL_HOT_SCORE, server_default="0")
     anonymous_user_id = Column(String(36), nullable=False)
     created_at = Column(
         DateTime(timezone=True),
@@ -1,22 +1,92 @@
-"""Stores aggregate rating stats per webtoon."""
+"""Stores aggregate rating stats and half-star rating histograms per webtoon."""
 
 from __future__ import annotations
 
-from sqlalchemy import Column, DateTime, Float, Integer, String, func
+from typing import Final
+
+from sqlalchemy import Column, DateTime, Float, Integer, String, case, cast, func
+from sqlalchemy.ext.hybrid import hybrid_property
 
 from webtoon.db.session import Base
 
+# Ratings are aggregated as integer hundredths of a star so sums never drift.
+RATING_SCALE: Final[int] = 100
+# Histogram buckets are half a star wide: 0.0, 0.5, ..., 5.0.
+RATING_BUCKET_POINTS: Final[int] = RATING_SCALE // 2
+RATING_BUCKETS: Final[int] = 5 * RATING_SCALE // RATING_BUCKET_POINTS + 1
+# Slack for binary float noise when checking a rating against RATING_SCALE (4.56 * 100 != 456).
+RATING_PRECISION_TOLERANCE: Final[float] = 1e-6
+
+
+def to_rating_points(rating: float) -> int:
+    """Convert a star rating into the integer units stored in ``rating_sum``."""
+
+    return int(round(rating * RATING_SCALE))
+
+
+def has_rating_precision(rating: float) -> bool:
+    """Whether ``rating`` is a whole number of ``rating_sum`` units (at most two decimals)."""
+
+    points = rating * RATING_SCALE
+    return abs(points - round(points)) <= RATING_PRECISION_TOLERANCE
+
+
+def to_rating_bucket(rating: float) -> int:
+    """Half-star histogram bucket of ``rating``, rounded to the nearest half (4.7 -> 4.5, 4.8 -> 5.0)."""
+
+    return (to_rating_points(rating) + RATING_BUCKET_POINTS // 2) // RATING_BUCKET_POINTS
+
+
+def bucket_rating(bucket: int) -> float:
+    """Star value a histogram bucket stands for."""
+
+    return bucket * RATING_BUCKET_POINTS / RATING_SCALE
+
 
 class WebtoonRatingStats(Base):
-    """Tracks review counts and average rating per webtoon."""
+    """Tracks review counts and the exact rating sum per webtoon."""
 
     __tablename__ = "webtoon_rating_stats"
 
     webtoon_id = Column(String, primary_key=True)
-    average_rating = Column(Float, nullable=False, default=0.0, server_default="0")
+    rating_sum = Column(Integer, nullable=False, default=0, server_default="0")
     review_count = Column(Integer, nullable=False, default=0, server_default="0")
     updated_at = Column(
         DateTime(timezone=True),
         server_default=func.current_timestamp(),
         onupdate=func.current_timestamp(),
     )
+
+    @hybrid_property
+    def average_rating(self) -> float:
+        """Average rating computed on read from the exact integer aggregates."""
+
+        if not self.review_count:
+            return 0.0
+        return self.rating_sum / RATING_SCALE / self.review_count
+
+    @average_rating.inplace.expression
+    @classmethod
+    def _average_rating_expression(cls):
+        return case(
+            (
+                cls.review_count > 0,
+                cast(cls.rating_sum, Float) / RATING_SCALE / cls.review_count,
+            ),
+            else_=0.0,
+        )
+
+
+class WebtoonRatingBucket(Base):
+    """Review count of one half-star rating bucket of a webtoon.
+
+    Maintained in the same transaction as ``WebtoonRatingStats``; a webtoon
+    has at most ``RATING_BUCKETS`` rows, so a histogram is one primary-key
+    range read.
+    """
+
+    __tablename__ = "webtoon_rating_buckets"
+
+    webtoon_id = Column(String, primary_key=True)
+    bucket = Column(Integer, primary_key=True, autoincrement=False)
+    review_count = Column(Integer, nullable=False, default=0, server_default="0")
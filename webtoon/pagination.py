@@ -0,0 +1,81 @@
+"""Opaque cursor helpers for keyset pagination."""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+import math
+from datetime import datetime
+from typing import Any, Final
+
+from fastapi import HTTPException, status
+
+# SQLite INTEGER 범위를 벗어난 값은 바인딩할 때 OverflowError 가 난다.
+SQLITE_INT_MIN: Final[int] = -(2**63)
+SQLITE_INT_MAX: Final[int] = 2**63 - 1
+
+
+def encode_cursor(*values: Any) -> str:
+    """Encode the sort key of the last returned row as an opaque token."""
+
+    raw = json.dumps(list(values), separators=(",", ":"), ensure_ascii=False)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(token: str, size: int) -> list[Any]:
+    """Decode a token produced by :func:`encode_cursor` holding ``size`` values."""
+
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError):
+        values = None
+
+    if not isinstance(values, list) or len(values) != size:
+        raise invalid_cursor()
+    return values
+
+
+def invalid_cursor() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="잘못된 페이지 커서입니다.",
+    )
+
+
+# Decoded cursor values come from the client; these check each one and turn
+# anything unexpected into a 400 instead of a failure further down.
+
+
+def cursor_str(value: Any) -> str:
+    if not isinstance(value, str):
+        raise invalid_cursor()
+    return value
+
+
+def cursor_int(value: Any) -> int:
+    # bool is a subclass of int, so true/false must be rejected explicitly.
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise invalid_cursor()
+    if not SQLITE_INT_MIN <= value <= SQLITE_INT_MAX:
+        raise invalid_cursor()
+    return value
+
+
+def cursor_float(value: Any) -> float:
+    if isinstance(value, int) and not isinstance(value, bool):
+        value = float(cursor_int(value))
+    if not isinstance(value, float) or not math.isfinite(value):
+        raise invalid_cursor()
+    return value
+
+
+def cursor_timestamp(value: Any) -> str:
+    """Return ``value`` unchanged if it is an ISO 8601 timestamp string."""
+
+    try:
+        datetime.fromisoformat(cursor_str(value))
+    except ValueError:
+        raise invalid_cursor() from None
+    return value
@@ -0,0 +1,133 @@
+"""JSON encoding and HTTP caching helpers shared by the routers."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Any, Final, Iterable, NamedTuple
+
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response
+
+try:  # orjson is optional; the stdlib encoder produces the same bytes, only slower.
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+JSON_MEDIA_TYPE: Final[str] = "application/json; charset=utf-8"
+CATALOG_CACHE_CONTROL: Final[str] = os.getenv(
+    "WEBTOON_CATALOG_CACHE_CONTROL",
+    "public, max-age=60, stale-while-revalidate=300",
+)
+
+
+class EncodedBody(NamedTuple):
+    """A pre-encoded response body together with its strong ETag."""
+
+    body: bytes
+    etag: str
+
+
+def _stdlib_dumps(content: Any) -> bytes:
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def _orjson_dumps(content: Any) -> bytes:
+    return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+# Compact UTF-8 JSON, the same output as ``JSONResponse`` (orjson writes NaN as null).
+dumps = _orjson_dumps if orjson is not None else _stdlib_dumps
+JSON_ENCODER: Final[str] = "orjson" if orjson is not None else "json"
+
+
+def loads(data: bytes | memoryview) -> Any:
+    """Decode JSON from ``bytes`` or a ``memoryview`` (e.g. a slice of an mmap)."""
+
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(bytes(data))
+
+
+class FastJSONResponse(JSONResponse):
+    """``JSONResponse`` rendered with :func:`dumps` (orjson when installed).
+
+    Installed as the app's ``default_response_class``, so handlers returning
+    Pydantic models or plain dicts use it as well.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def encode_with_fragments(
+    envelope: dict[str, Any],
+    key: str,
+    fragments: Iterable[bytes],
+) -> bytes:
+    """Encode ``envelope`` with ``key`` appended as a list of pre-encoded items."""
+
+    head = dumps(envelope)[:-1]
+    if envelope:
+        head += b","
+    return head + dumps(key) + b":[" + b",".join(fragments) + b"]}"
+
+
+def make_etag(body: bytes) -> str:
+    """Return a strong ETag derived from the body bytes."""
+
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    # If-None-Match uses weak comparison, so a W/ prefix is ignored.
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def _not_modified_since(if_modified_since: str, last_modified: float) -> bool:
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    return since is not None and int(last_modified) <= since.timestamp()
+
+
+def cached_json_response(
+    request: Request,
+    encoded: EncodedBody,
+    *,
+    last_modified: float,
+    cache_control: str = CATALOG_CACHE_CONTROL,
+) -> Response:
+    """Serve ``encoded`` with validators, answering conditional requests with 304."""
+
+    headers = {
+        "ETag": encoded.etag,
+        "Last-Modified": formatdate(last_modified, usegmt=True),
+        "Cache-Control": cache_control,
+    }
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        not_modified = _etag_matches(if_none_match, encoded.etag)
+    else:
+        if_modified_since = request.headers.get("if-modified-since")
+        not_modified = if_modified_since is not None and _not_modified_since(
+            if_modified_since, last_modified
+        )
+
+    if not_modified:
+        return Response(status_code=304, headers=headers)
+    return Response(content=encoded.body, media_type=JSON_MEDIA_TYPE, headers=headers)
@@ -0,0 +1,44 @@
+"""Liveness/readiness probes (e.g. Cloud Run startup and liveness checks)."""
+
+from __future__ import annotations
+
+import sqlite3
+
+from fastapi import APIRouter
+
+from webtoon.database import read_pool
+from webtoon.responses import FastJSONResponse
+from webtoon.startup import startup_state
+
+router = APIRouter(tags=["health"])
+
+NO_STORE = {"Cache-Control": "no-store"}
+
+
+@router.get("/healthz", include_in_schema=False)
+async def healthz() -> FastJSONResponse:
+    """프로세스가 요청을 받을 수 있으면 200 (DB 는 확인하지 않는다)."""
+
+    return FastJSONResponse({"status": "ok"}, headers=NO_STORE)
+
+
+@router.get("/readyz", include_in_schema=False)
+def readyz() -> FastJSONResponse:
+    """
+    스키마 확인과 사전 로딩이 끝나고 DB 를 읽을 수 있으면 200, 아니면 503
+    - 응답에 시작 단계별 소요 시간(ms)을 함께 담는다.
+    """
+    body = startup_state.as_dict()
+    if not startup_state.ready:
+        return FastJSONResponse({"status": "starting", **body}, status_code=503, headers=NO_STORE)
+
+    try:
+        with read_pool.connection() as conn:
+            conn.execute("SELECT 1").fetchone()
+    except sqlite3.Error as exc:
+        return FastJSONResponse(
+            {"status": "unavailable", "database": str(exc), **body},
+            status_code=503,
+            headers=NO_STORE,
+        )
+    return FastJSONResponse({"status": "ready", **body}, headers=NO_STORE)
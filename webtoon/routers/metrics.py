@@ -0,0 +1,25 @@
+"""Prometheus scrape endpoint."""
+
+from __future__ import annotations
+
+from anyio.to_thread import current_default_thread_limiter
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from webtoon.metrics import THREADPOOL, render_metrics
+
+router = APIRouter(tags=["metrics"])
+
+PROMETHEUS_MEDIA_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics() -> PlainTextResponse:
+    """Expose request/SQL metrics in the Prometheus text format."""
+
+    # Must run on the event loop: the limiter belongs to the running loop.
+    statistics = current_default_thread_limiter().statistics()
+    THREADPOOL.set(statistics.borrowed_tokens, "busy")
+    THREADPOOL.set(statistics.tasks_waiting, "waiting")
+    THREADPOOL.set(current_default_thread_limiter().total_tokens, "capacity")
+    return PlainTextResponse(render_metrics(), media_type=PROMETHEUS_MEDIA_TYPE)
@@ -2,28 +2,46 @@
 
 from __future__ import annotations
 
+from typing import Iterator, Optional
+
 from fastapi import APIRouter, Depends, Path, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
-from webtoon.db import get_session
+from webtoon.db import get_session, get_write_session
+from webtoon.db.session import SessionLocal
 from webtoon.dependencies.auth import get_anonymous_user_id
+from webtoon.dependencies.rate_limit import review_like_limit, review_write_limit
+from webtoon.models.webtoon_rating_stats import RATING_BUCKET_POINTS, RATING_SCALE, bucket_rating
 from webtoon.schemas.review import (
+    RatingHistogramBucket,
+    RatingHistogramResponse,
     ReviewCreate,
+    ReviewExportItem,
     ReviewLikeResponse,
     ReviewListResponse,
     ReviewResponse,
     ReviewUpdate,
 )
-from webtoon.services.review_service import ReviewService
+from webtoon.services.like_buffer import LIKE_BUFFER_ENABLED, like_buffer
+from webtoon.services.review_service import ReviewService, ReviewSort
 
 router = APIRouter(tags=["reviews"])
 
+MAX_REVIEW_PAGE_SIZE = 100
+EXPORT_BATCH_SIZE = 1000
+
 
-@router.post("/webtoons/review/", response_model=ReviewResponse, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "/webtoons/review/",
+    response_model=ReviewResponse,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(review_write_limit)],
+)
 def create_review(
     payload: ReviewCreate,
     webtoon_id: str = Query(..., min_length=1, description="리뷰를 작성할 웹툰 ID"),
-    db: Session = Depends(get_session),
+    db: Session = Depends(get_write_session),
     anonymous_user_id: str = Depends(get_anonymous_user_id),
 ) -> ReviewResponse:
     """Create a new review and update the corresponding rating stats."""
@@ -45,20 +63,83 @@ def create_review(
 def list_reviews(
     webtoon_id: str = Path(..., min_length=1, description="리뷰를 조회할 웹툰 ID"),
     page: int = Query(1, ge=1, description="조회할 페이지 번호"),
-    limit: int = Query(10, ge=1, description="한 페이지당 가져올 리뷰 개수"),
+    limit: int = Query(
+        10, ge=1, le=MAX_REVIEW_PAGE_SIZE, description="한 페이지당 가져올 리뷰 개수"
+    ),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (지정 시 page 무시)"),
+    sort: ReviewSort = Query(
+        "recent", description="정렬 기준: recent(최신순), likes(좋아요순), hot(시간 감쇠 인기순)"
+    ),
     db: Session = Depends(get_session),
 ) -> ReviewListResponse:
     """Return paginated reviews for a specific webtoon."""
 
     service = ReviewService(db)
-    stats, reviews = service.list_reviews(webtoon_id=webtoon_id, page=page, limit=limit)
+    stats, reviews, next_cursor = service.list_reviews(
+        webtoon_id=webtoon_id, page=page, limit=limit, cursor=cursor, sort=sort
+    )
     return ReviewListResponse(
         webtoon_id=stats.webtoon_id,
         average_rating=stats.average_rating,
         review_count=stats.review_count,
         page=page,
         limit=limit,
+        sort=sort,
         reviews=reviews,
+        next_cursor=next_cursor,
+    )
+
+
+@router.get("/webtoons/{webtoon_id}/reviews/export", status_code=status.HTTP_200_OK)
+def export_reviews(
+    webtoon_id: str = Path(..., min_length=1, description="리뷰를 내보낼 웹툰 ID"),
+) -> StreamingResponse:
+    """Stream every review of the webtoon as NDJSON in constant memory."""
+
+    def generate() -> Iterator[bytes]:
+        # 응답 스트리밍은 의존성 정리 이후에도 계속되므로 세션을 직접 관리한다.
+        db = SessionLocal()
+        try:
+            lines: list[str] = []
+            for row in ReviewService(db).iter_reviews(
+                webtoon_id=webtoon_id, batch_size=EXPORT_BATCH_SIZE
+            ):
+                lines.append(ReviewExportItem.model_validate(row).model_dump_json())
+                if len(lines) >= EXPORT_BATCH_SIZE:
+                    yield ("\n".join(lines) + "\n").encode("utf-8")
+                    lines.clear()
+            if lines:
+                yield ("\n".join(lines) + "\n").encode("utf-8")
+        finally:
+            db.close()
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
+@router.get(
+    "/webtoons/{webtoon_id}/ratings/histogram",
+    response_model=RatingHistogramResponse,
+    status_code=status.HTTP_200_OK,
+)
+def rating_histogram(
+    webtoon_id: str = Path(..., min_length=1, description="별점 분포를 조회할 웹툰 ID"),
+    db: Session = Depends(get_session),
+) -> RatingHistogramResponse:
+    """
+    웹툰 별점 분포 API
+    - 0.0 ~ 5.0 을 0.5 단위 11개 구간으로 나눠 구간별 리뷰 수를 반환한다 (가장 가까운 0.5 로 반올림).
+    - 리뷰가 없으면 모든 구간이 0 이다.
+    """
+    stats, counts = ReviewService(db).rating_histogram(webtoon_id=webtoon_id)
+    return RatingHistogramResponse(
+        webtoon_id=webtoon_id,
+        average_rating=stats.average_rating if stats else 0.0,
+        review_count=stats.review_count if stats else 0,
+        bucket_size=RATING_BUCKET_POINTS / RATING_SCALE,
+        buckets=[
+            RatingHistogramBucket(rating=bucket_rating(bucket), count=count)
+            for bucket, count in enumerate(counts)
+        ],
     )
 
 
@@ -66,11 +147,12 @@ def list_reviews(
     "/webtoons/{webtoon_id}/reviews",
     response_model=ReviewResponse,
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(review_write_limit)],
 )
 def update_review(
     payload: ReviewUpdate,
     webtoon_id: str = Path(..., min_length=1, description="수정할 리뷰의 웹툰 ID"),
-    db: Session = Depends(get_session),
+    db: Session = Depends(get_write_session),
     anonymous_user_id: str = Depends(get_anonymous_user_id),
 ) -> ReviewResponse:
     """Update the review authored by the anon user for the given webtoon."""
@@ -88,14 +170,19 @@ def update_review(
     "/reviews/{review_id}/like",
     response_model=ReviewLikeResponse,
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(review_like_limit)],
 )
 def like_review(
     review_id: int = Path(..., ge=1, description="좋아요를 누를 리뷰 ID"),
-    db: Session = Depends(get_session),
+    db: Session = Depends(get_write_session),
     anonymous_user_id: str = Depends(get_anonymous_user_id),
 ) -> ReviewLikeResponse:
     """Register a like for the given review on behalf of the anon user."""
 
-    service = ReviewService(db)
-    review = service.like_review(review_id=review_id, anonymous_user_id=anonymous_user_id)
-    return ReviewLikeResponse(review_id=review.id, likes=review.likes)
+    if LIKE_BUFFER_ENABLED:
+        likes = like_buffer.like(review_id=review_id, anonymous_user_id=anonymous_user_id)
+    else:
+        likes = ReviewService(db).like_review(
+            review_id=review_id, anonymous_user_id=anonymous_user_id
+        )
+    return ReviewLikeResponse(review_id=review_id, likes=likes)
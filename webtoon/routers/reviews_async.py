@@ -0,0 +1,138 @@
+"""Async (aiosqlite) variants of the review endpoints.
+
+Registered ahead of ``routers.reviews`` when ``WEBTOON_REVIEW_IO=async`` so the
+same paths are served on the event loop instead of the threadpool. The export
+stream keeps using the sync router.
+
+Create, update and like live on ``write_router``. With
+``WEBTOON_SERIALIZE_WRITES=1`` it is not registered, so those writes stay on
+the sync router and queue for the single writer connection like every other
+writer in the process.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Path, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from webtoon.db.async_session import get_async_session
+from webtoon.dependencies.auth import get_anonymous_user_id
+from webtoon.dependencies.rate_limit import review_like_limit, review_write_limit
+from webtoon.routers.reviews import MAX_REVIEW_PAGE_SIZE
+from webtoon.schemas.review import (
+    ReviewCreate,
+    ReviewLikeResponse,
+    ReviewListResponse,
+    ReviewResponse,
+    ReviewUpdate,
+)
+from webtoon.services.async_review_service import AsyncReviewService
+from webtoon.services.like_buffer import LIKE_BUFFER_ENABLED, like_buffer
+from webtoon.services.review_service import ReviewSort
+
+router = APIRouter(tags=["reviews"])
+write_router = APIRouter(tags=["reviews"])
+
+
+@write_router.post(
+    "/webtoons/review/",
+    response_model=ReviewResponse,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(review_write_limit)],
+)
+async def create_review_async(
+    payload: ReviewCreate,
+    webtoon_id: str = Query(..., min_length=1, description="리뷰를 작성할 웹툰 ID"),
+    db: AsyncSession = Depends(get_async_session),
+    anonymous_user_id: str = Depends(get_anonymous_user_id),
+) -> ReviewResponse:
+    """Create a new review and update the corresponding rating stats."""
+
+    review = await AsyncReviewService(db).create_review(
+        webtoon_id=webtoon_id,
+        payload=payload,
+        anonymous_user_id=anonymous_user_id,
+    )
+    return ReviewResponse.model_validate(review)
+
+
+@router.get(
+    "/webtoons/{webtoon_id}/reviews",
+    response_model=ReviewListResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def list_reviews_async(
+    webtoon_id: str = Path(..., min_length=1, description="리뷰를 조회할 웹툰 ID"),
+    page: int = Query(1, ge=1, description="조회할 페이지 번호"),
+    limit: int = Query(
+        10, ge=1, le=MAX_REVIEW_PAGE_SIZE, description="한 페이지당 가져올 리뷰 개수"
+    ),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (지정 시 page 무시)"),
+    sort: ReviewSort = Query(
+        "recent", description="정렬 기준: recent(최신순), likes(좋아요순), hot(시간 감쇠 인기순)"
+    ),
+    db: AsyncSession = Depends(get_async_session),
+) -> ReviewListResponse:
+    """Return paginated reviews for a specific webtoon."""
+
+    stats, reviews, next_cursor = await AsyncReviewService(db).list_reviews(
+        webtoon_id=webtoon_id, page=page, limit=limit, cursor=cursor, sort=sort
+    )
+    return ReviewListResponse(
+        webtoon_id=stats.webtoon_id,
+        average_rating=stats.average_rating,
+        review_count=stats.review_count,
+        page=page,
+        limit=limit,
+        sort=sort,
+        reviews=reviews,
+        next_cursor=next_cursor,
+    )
+
+
+@write_router.put(
+    "/webtoons/{webtoon_id}/reviews",
+    response_model=ReviewResponse,
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(review_write_limit)],
+)
+async def update_review_async(
+    payload: ReviewUpdate,
+    webtoon_id: str = Path(..., min_length=1, description="수정할 리뷰의 웹툰 ID"),
+    db: AsyncSession = Depends(get_async_session),
+    anonymous_user_id: str = Depends(get_anonymous_user_id),
+) -> ReviewResponse:
+    """Update the review authored by the anon user for the given webtoon."""
+
+    review = await AsyncReviewService(db).update_review(
+        webtoon_id=webtoon_id,
+        payload=payload,
+        anonymous_user_id=anonymous_user_id,
+    )
+    return ReviewResponse.model_validate(review)
+
+
+@write_router.post(
+    "/reviews/{review_id}/like",
+    response_model=ReviewLikeResponse,
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(review_like_limit)],
+)
+async def like_review_async(
+    review_id: int = Path(..., ge=1, description="좋아요를 누를 리뷰 ID"),
+    db: AsyncSession = Depends(get_async_session),
+    anonymous_user_id: str = Depends(get_anonymous_user_id),
+) -> ReviewLikeResponse:
+    """Register a like for the given review on behalf of the anon user."""
+
+    if LIKE_BUFFER_ENABLED:
+        likes = await like_buffer.like_async(
+            review_id=review_id, anonymous_user_id=anonymous_user_id
+        )
+    else:
+        likes = await AsyncReviewService(db).like_review(
+            review_id=review_id, anonymous_user_id=anonymous_user_id
+        )
+    return ReviewLikeResponse(review_id=review_id, likes=likes)
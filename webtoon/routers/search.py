@@ -1,97 +1,96 @@
 # webtoon/routers/search.py
-from fastapi import APIRouter, Query
-from fastapi.responses import JSONResponse
-from webtoon.database import get_db
+from sqlite3 import Cursor
+
+from fastapi import APIRouter, Depends, Query, Request
+from webtoon.database import get_read_db
+from webtoon.responses import FastJSONResponse, cached_json_response, dumps
+from webtoon.services.catalog import CATALOG_COLUMNS, CatalogSnapshot, get_catalog
+from webtoon.services.search_index import DEFAULT_SEARCH_MODE, SearchMode, search_catalog
 
 router = APIRouter(
     tags=["webtoons-search"]
 )
 
-conn, cursor = get_db()
-
 @router.get("/search")
 def search_webtoons(
     q: str = Query(..., min_length=1, description="검색어 (제목/작가/태그/시놉시스 검색)"),
-    day: str | None = Query(None, description="MON/TUE/WED/THR/FRI/SAT/SUN 중 선택 (선택)")
+    day: str | None = Query(None, description="MON/TUE/WED/THR/FRI/SAT/SUN 중 선택 (선택)"),
+    limit: int = Query(50, ge=1, le=200, description="가져올 최대 결과 개수"),
+    offset: int = Query(0, ge=0, description="건너뛸 결과 개수"),
+    mode: SearchMode = Query(DEFAULT_SEARCH_MODE, description="검색 방식 (fts: 전문 검색, like: 기존 LIKE 검색)"),
+    cursor: Cursor = Depends(get_read_db),
 ):
     """
     웹툰 검색 API
-    - q: 제목, 작가, 시놉시스, 태그 전체에서 부분 검색
+    - q: 제목, 작가, 시놉시스, 태그 전체에서 부분 검색 (fts 모드는 bm25 순으로 정렬)
     - day: 요일 값이 들어오면 요일 필터까지 적용
+    - limit/offset: 결과 페이지 지정 (기본 50개). 결과가 더 있으면 has_more 가 true
+    - mode: 3글자 미만 검색어나 FTS 인덱스가 없을 때는 like 방식으로 대체
     """
-    pattern = f"%{q}%" # 검색어 패턴
-
-    base_query = """
-        SELECT
-            id,
-            thumbnail,
-            title,
-            updateDays,
-            authors,
-            synopsis,
-            tags
-        FROM normalized_webtoon
-        WHERE (
-            id        LIKE ?
-            OR title    LIKE ?
-            OR authors  LIKE ?
-            OR synopsis LIKE ?
-            OR tags     LIKE ?
-        )
-    """
-
-    params: list[str] = [pattern, pattern, pattern, pattern, pattern]
-
-    # day가 넘어왔으면 요일 필터 추가
-    if day is not None:
-        base_query += " AND updateDays = ?"
-        params.append(day)
-
-    rows = cursor.execute(base_query, params).fetchall()
+    # 한 건을 더 읽어 다음 페이지가 있는지 판단한다.
+    used_mode, rows = search_catalog(
+        cursor, q=q, day=day, limit=limit + 1, offset=offset, mode=mode
+    )
+    has_more = len(rows) > limit
     data: list[dict] = []
-    for r in rows:
+    for r in rows[:limit]:
         item = dict(r)
         item["webtoon_id"] = item["id"]
         data.append(item)
 
-    return JSONResponse(
-        content={"count": len(data), "webtoons": data},
+    return FastJSONResponse(
+        content={"count": len(data), "has_more": has_more, "mode": used_mode, "webtoons": data},
         media_type="application/json; charset=utf-8"
     )
 
 
+SUGGEST_COLUMNS = ("id", "title", "authors", "thumbnail")
+
+
+@router.get("/search/suggest")
+def suggest_webtoons(
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=50, description="입력 중인 검색어 (초성 입력 지원, 예: ㄴㅎㅈ)"),
+    limit: int = Query(10, ge=1, le=50, description="가져올 최대 추천 개수"),
+    catalog: CatalogSnapshot = Depends(get_catalog),
+):
+    """
+    자동완성 API
+    - 제목 전체 접두사 > 제목 중간 단어 접두사 > 작가명 접두사 순으로 추천
+    - 공백과 대소문자는 무시하며, 한글 초성만 입력해도 매칭
+    - 카탈로그가 바뀌면 새 스냅샷과 함께 인덱스도 다시 만들어진다.
+    """
+
+    def build() -> bytes:
+        columns = [CATALOG_COLUMNS.index(column) for column in SUGGEST_COLUMNS]
+        suggestions = []
+        for position, matched in catalog.suggest_index().suggest(q, limit):
+            row = catalog.rows[position]
+            item = {column: row[index] for column, index in zip(SUGGEST_COLUMNS, columns)}
+            item["webtoon_id"] = item["id"]
+            item["matched"] = matched
+            suggestions.append(item)
+        return dumps({"q": q, "count": len(suggestions), "suggestions": suggestions})
+
+    encoded = catalog.encoded(("suggest", q, limit), build, free_text=True)
+    return cached_json_response(request, encoded, last_modified=catalog.loaded_at)
+
+
 @router.get("/{webtoon_id}")
-def get_webtoon_by_id(webtoon_id: str):
+def get_webtoon_by_id(
+    request: Request, webtoon_id: str, catalog: CatalogSnapshot = Depends(get_catalog)
+):
     """
     웹툰 단일 조회 API
     - webtoon_id: 웹툰 고유 ID
     """
-    row = cursor.execute(
-        """
-        SELECT
-            id,
-            thumbnail,
-            title,
-            updateDays,
-            authors,
-            synopsis,
-            tags
-        FROM normalized_webtoon WHERE id = ? 
-        """,
-        (webtoon_id,),
-    ).fetchone()
-
-    if row is None:
-        return JSONResponse(
+    fragment = catalog.full_fragment(webtoon_id)
+    if fragment is None:
+        return FastJSONResponse(
             status_code=404,
             content={"error": "Webtoon not found"},
             media_type="application/json; charset=utf-8",
         )
 
-    data = dict(row)
-    data["webtoon_id"] = data["id"]
-
-    return JSONResponse(
-        content=data,
-        media_type="application/json; charset=utf-8",
-    )
+    encoded = catalog.encoded(("webtoon", webtoon_id), lambda: bytes(fragment))
+    return cached_json_response(request, encoded, last_modified=catalog.loaded_at)
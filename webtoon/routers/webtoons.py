@@ -1,12 +1,35 @@
-from fastapi import APIRouter, Query
-from fastapi.responses import JSONResponse
-from webtoon.database import get_db
+import math
+from sqlite3 import Cursor
+
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import Response
+
+from webtoon.database import get_read_db
+from webtoon.pagination import cursor_str, decode_cursor, encode_cursor
+from webtoon.responses import (
+    JSON_MEDIA_TYPE,
+    FastJSONResponse,
+    cached_json_response,
+    dumps,
+    encode_with_fragments,
+)
+from webtoon.schemas.webtoon import WebtoonBatchRequest
+from webtoon.services.catalog import (
+    CATALOG_CHECK_INTERVAL,
+    SUMMARY_COLUMNS,
+    VALID_DAYS,
+    CatalogSnapshot,
+    get_catalog,
+)
+from webtoon.services.facets import FacetMatch, split_values
+from webtoon.services.leaderboard import RECENT_WINDOW_DAYS, Ranking, leaderboard
+from webtoon.services.similar import SIMILAR_TOP_K, similar_store
+from webtoon.services.webtoon_batch import lookup_webtoons
 
 router = APIRouter(
     tags=["webtoons"]
 )
 
-conn, cursor = get_db()
 PAGE_SIZE = 16
 
 # 라우터 정의
@@ -17,137 +40,252 @@ def say_hi():
 # 라우터 정의
 @router.get("/webtoons")
 def get_all_webtoons(
+    request: Request,
     webtoon_id: str | None = Query(
         None, min_length=1, description="특정 웹툰 ID로 필터 (예: kakao_1000)"
     ),
     page: int = Query(1, ge=1, description="조회할 페이지 번호 (1부터 시작)"),
+    cursor: str | None = Query(None, description="이전 응답의 next_cursor (지정 시 page 무시)"),
+    tags: str | None = Query(None, description="쉼표로 구분한 태그 필터 (예: 액션,로맨스)"),
+    days: str | None = Query(None, description="쉼표로 구분한 연재 요일 필터 (예: MON,SAT)"),
+    match: FacetMatch = Query("all", description="태그 조건 결합 방식: all(모두 포함), any(하나 이상)"),
+    day_match: FacetMatch = Query("any", description="요일 조건 결합 방식: any(하나 이상, 기본), all(모두 연재)"),
+    catalog: CatalogSnapshot = Depends(get_catalog),
 ):
-    where_clause = ""
-    params: list = []
-
-    if webtoon_id:
-        where_clause = " WHERE id = ?"
-        params.append(webtoon_id)
-
-    total_row = cursor.execute(
-        f"SELECT COUNT(*) AS cnt FROM normalized_webtoon{where_clause}",
-        params,
-    ).fetchone()
-    total = total_row["cnt"] if total_row is not None else 0
-
-    rows = cursor.execute(
-        f"""SELECT 
-            id,
-            thumbnail,
-            title,
-            updateDays,
-            authors,
-            tags
-        FROM normalized_webtoon{where_clause}
-        ORDER BY id
-        LIMIT ? OFFSET ?""",
-        (*params, PAGE_SIZE, (page - 1) * PAGE_SIZE),
-    ).fetchall()
-    data: list[dict] = []
-    for r in rows:
-        item = dict(r)
-        item["webtoon_id"] = item["id"]
-        data.append(item)
-    return JSONResponse(
-        content={
+    after_id = cursor_str(decode_cursor(cursor, 1)[0]) if cursor is not None else None
+    tag_values = tuple(sorted(split_values(tags)))
+    day_values = tuple(sorted(split_values(days)))
+    invalid_days = [day for day in day_values if day not in VALID_DAYS]
+    if invalid_days:
+        return FastJSONResponse(
+            content={"error": "Invalid days parameter. Use MON, TUE, WED, THR, FRI, SAT, SUN"},
+            status_code=400
+        )
+    faceted = bool(tag_values or day_values)
+
+    def build() -> bytes:
+        next_cursor = None
+        facets = None
+        if faceted:
+            facet_index = catalog.facet_index()
+            bits = facet_index.select(
+                tags=tag_values, days=day_values, tag_match=match, day_match=day_match
+            )
+            if webtoon_id:
+                rank = catalog.rank_of(webtoon_id)
+                bits &= 0 if rank is None else 1 << rank
+            total = bits.bit_count()
+            facets = facet_index.counts(bits)
+            if after_id is not None:
+                # 커서 이전 순번의 비트를 지워 keyset 페이지네이션과 같은 결과를 낸다.
+                bits &= ~((1 << catalog.offset_after(after_id)) - 1)
+                ranks = facet_index.ranks(bits, 0, PAGE_SIZE + 1)
+            else:
+                ranks = facet_index.ranks(bits, (page - 1) * PAGE_SIZE, PAGE_SIZE + 1)
+            if len(ranks) > PAGE_SIZE:
+                next_cursor = encode_cursor(catalog.sorted_ids[ranks[PAGE_SIZE - 1]])
+            data = catalog.summary_fragments_at(ranks[:PAGE_SIZE])
+        elif webtoon_id:
+            fragment = catalog.summary_fragment(webtoon_id)
+            matched = [fragment] if fragment is not None else []
+            total = len(matched)
+            data = matched[(page - 1) * PAGE_SIZE : page * PAGE_SIZE]
+        else:
+            total = len(catalog.sorted_ids)
+            offset = (
+                catalog.offset_after(after_id)
+                if after_id is not None
+                else (page - 1) * PAGE_SIZE
+            )
+            data = catalog.summary_page(offset, PAGE_SIZE)
+            if offset + PAGE_SIZE < total:
+                next_cursor = encode_cursor(catalog.sorted_ids[offset + PAGE_SIZE - 1])
+
+        envelope = {
             "page": page,
             "page_size": PAGE_SIZE,
             "total": total,
             "total_pages": (total + PAGE_SIZE - 1) // PAGE_SIZE,
-            "webtoons": data,
-        },
-        media_type="application/json; charset=utf-8"
+            "next_cursor": next_cursor,
+        }
+        if facets is not None:
+            envelope["facets"] = facets
+        return encode_with_fragments(envelope, "webtoons", data)
+
+    key = ("webtoons", webtoon_id, page, after_id)
+    if faceted:
+        key += (tag_values, day_values, match, day_match)
+    encoded = catalog.encoded(key, build)
+    return cached_json_response(request, encoded, last_modified=catalog.loaded_at)
+
+@router.get("/webtoons/top")
+def get_top_webtoons(
+    by: Ranking = Query(
+        "rating",
+        description="정렬 기준: rating(베이지안 보정 평점), reviews(리뷰 수), recent(최근 리뷰 수)",
+    ),
+    limit: int = Query(20, ge=1, le=100, description="가져올 웹툰 개수"),
+    offset: int = Query(0, ge=0, description="건너뛸 순위 개수"),
+    catalog: CatalogSnapshot = Depends(get_catalog),
+):
+    """
+    리뷰 작성/수정 시 갱신되는 메모리 랭킹에서 상위 웹툰을 조회한다.
+    """
+
+    webtoons = []
+    for entry in leaderboard.top(by, limit=limit, offset=offset):
+        item = catalog.get(entry.webtoon_id)
+        if item is None:
+            # 카탈로그에서 빠진 웹툰은 순위만 유지하고 응답에서는 제외한다.
+            continue
+        webtoons.append(
+            {
+                "rank": entry.rank,
+                **{column: item[column] for column in SUMMARY_COLUMNS},
+                "webtoon_id": entry.webtoon_id,
+                "average_rating": round(entry.average_rating, 4),
+                "bayesian_rating": round(entry.bayesian_rating, 4),
+                "review_count": entry.review_count,
+                "recent_review_count": entry.recent_review_count,
+            }
+        )
+    return {
+        "by": by,
+        "total": leaderboard.total(by),
+        "count": len(webtoons),
+        "recent_window_days": RECENT_WINDOW_DAYS,
+        "prior_mean": round(leaderboard.prior_mean, 4),
+        "webtoons": webtoons,
+    }
+
+@router.post("/webtoons/batch")
+def get_webtoons_batch(
+    payload: WebtoonBatchRequest,
+    catalog: CatalogSnapshot = Depends(get_catalog),
+    cursor: Cursor = Depends(get_read_db),
+):
+    """
+    여러 웹툰을 한 번에 조회한다 (카드 목록용).
+    - ids: 조회할 웹툰 ID 목록 (최대 500개, 중복은 한 번만 응답)
+    - 응답 순서는 요청 순서를 따르며, 각 항목에 average_rating/review_count가 포함된다.
+    - 카탈로그에 없는 ID는 missing에 요청 순서대로 담긴다.
+    """
+
+    result = lookup_webtoons(catalog, cursor, payload.ids)
+    body = encode_with_fragments(
+        {"count": len(result.fragments), "missing": result.missing},
+        "webtoons",
+        result.fragments,
     )
-    
+    return Response(content=body, media_type=JSON_MEDIA_TYPE)
+
 @router.get("/webtoons_title")
-def get_all_webtoons():
-    rows = cursor.execute("SELECT title FROM normalized_webtoon").fetchall()
-    data = [dict(r) for r in rows]
-    return JSONResponse(
-        content={"webtoons": data},
-        media_type="application/json; charset=utf-8"
+def get_all_webtoons(request: Request, catalog: CatalogSnapshot = Depends(get_catalog)):
+    encoded = catalog.encoded(
+        ("webtoons_title",),
+        lambda: encode_with_fragments({}, "webtoons", catalog.title_fragments()),
     )
+    return cached_json_response(request, encoded, last_modified=catalog.loaded_at)
 
 @router.get("/webtoons/day/{day}")
-def get_webtoons_by_day(day: str):
-    valid_days = ["MON", "TUE", "WED", "THR", "FRI", "SAT", "SUN"]
-    if day not in valid_days:
-        return JSONResponse(
+def get_webtoons_by_day(
+    request: Request, day: str, catalog: CatalogSnapshot = Depends(get_catalog)
+):
+    if day not in VALID_DAYS:
+        return FastJSONResponse(
             content={"error": "Invalid day parameter. Use one of: MON, TUE, WED, THR, FRI, SAT, SUN"},
             status_code=400
         )
-    query = """SELECT 
-            id,
-            thumbnail,
-            title,
-            updateDays,
-            authors,
-            synopsis,
-            tags FROM normalized_webtoon WHERE updateDays = ?"""
-    rows = cursor.execute(query, (day,)).fetchall()
-    data: list[dict] = []
-    for r in rows:
-        item = dict(r)
-        item["webtoon_id"] = item["id"]
-        data.append(item)
-
-    return JSONResponse(
-        content={"count": len(data), "webtoons": data},
-        media_type="application/json; charset=utf-8"
-    )
+
+    def build() -> bytes:
+        data = catalog.day_fragments(day)
+        return encode_with_fragments({"count": len(data)}, "webtoons", data)
+
+    encoded = catalog.encoded(("webtoons_day", day), build)
+    return cached_json_response(request, encoded, last_modified=catalog.loaded_at)
 
 
 @router.get("/webtoons/sample")
 def get_sample_webtoons(
-    limit: int = Query(5, ge=1, le=50, description="가져올 테스트용 웹툰 개수 (기본 5)")
+    request: Request,
+    limit: int = Query(5, ge=1, le=50, description="가져올 테스트용 웹툰 개수 (기본 5)"),
+    catalog: CatalogSnapshot = Depends(get_catalog),
 ):
     """
     테스트용으로 소량의 웹툰만 조회하는 엔드포인트.
     """
-    rows = cursor.execute(
-        """
-        SELECT
-            id,
-            thumbnail,
-            title,
-            updateDays,
-            authors,
-            tags
-        FROM normalized_webtoon
-        ORDER BY id
-        LIMIT ?
-        """,
-        (limit,),
-    ).fetchall()
-    data: list[dict] = []
-    for r in rows:
-        item = dict(r)
-        item["webtoon_id"] = item["id"]
-        data.append(item)
-    return JSONResponse(
-        content={"count": len(data), "webtoons": data},
-        media_type="application/json; charset=utf-8",
-    )
+
+    def build() -> bytes:
+        data = catalog.summary_page(0, limit)
+        return encode_with_fragments({"count": len(data)}, "webtoons", data)
+
+    encoded = catalog.encoded(("webtoons_sample", limit), build)
+    return cached_json_response(request, encoded, last_modified=catalog.loaded_at)
 
 @router.get("/webtoons_title/day/{day}")
-def get_webtoons_by_day(day: str):
-    valid_days = ["MON", "TUE", "WED", "THR", "FRI", "SAT", "SUN"]
-    if day not in valid_days:
-        return JSONResponse(
+def get_webtoons_by_day(
+    request: Request, day: str, catalog: CatalogSnapshot = Depends(get_catalog)
+):
+    if day not in VALID_DAYS:
+        return FastJSONResponse(
             content={"error": "Invalid day parameter. Use one of: MON, TUE, WED, THR, FRI, SAT, SUN"},
             status_code=400
         )
 
-    query = "SELECT title FROM normalized_webtoon WHERE updateDays = ?"
-    rows = cursor.execute(query, (day,)).fetchall()
-    data = [dict(r) for r in rows]
+    def build() -> bytes:
+        data = catalog.day_title_fragments(day)
+        return encode_with_fragments({"count": len(data)}, "webtoons", data)
 
-    return JSONResponse(
-        content={"count": len(data), "webtoons": data},
-        media_type="application/json; charset=utf-8"
-    )
+    encoded = catalog.encoded(("webtoons_title_day", day), build)
+    return cached_json_response(request, encoded, last_modified=catalog.loaded_at)
+
+@router.get("/webtoons/{webtoon_id}/similar")
+def get_similar_webtoons(
+    request: Request,
+    webtoon_id: str,
+    limit: int = Query(10, ge=1, le=SIMILAR_TOP_K, description="가져올 비슷한 웹툰 개수"),
+    catalog: CatalogSnapshot = Depends(get_catalog),
+):
+    """
+    비슷한 웹툰 추천 API ("이런 작품은 어때요?")
+    - 태그, 작가, 시놉시스(글자 n-gram) TF-IDF 유사도 순으로 미리 계산해 둔 이웃 목록을 조회한다.
+    - 각 항목에 0~1 사이의 score 가 포함된다.
+    - 카탈로그가 바뀐 직후에는 새 목록이 만들어질 때까지 이전 목록을 응답한다.
+    - 목록이 아직 한 번도 만들어지지 않았으면 503 (Retry-After) 을 응답한다.
+    """
+    if webtoon_id not in catalog:
+        return FastJSONResponse(
+            status_code=404,
+            content={"error": "Webtoon not found"},
+            media_type="application/json; charset=utf-8",
+        )
+
+    index = similar_store.get(catalog)
+    if index is None:
+        # 빈 결과를 200 으로 주면 캐시(메모, 프록시)에 남으므로 저장하지 않게 한다.
+        return FastJSONResponse(
+            status_code=503,
+            content={"error": "Similar webtoons are not ready yet"},
+            headers={
+                "Cache-Control": "no-store",
+                "Retry-After": str(max(1, math.ceil(CATALOG_CHECK_INTERVAL))),
+            },
+            media_type="application/json; charset=utf-8",
+        )
+
+    def build() -> bytes:
+        data = []
+        for neighbor_id, score in index.neighbors(webtoon_id, limit):
+            fragment = catalog.summary_fragment(neighbor_id)
+            if fragment is None:
+                # 이전 목록에 남아 있지만 카탈로그에서 빠진 웹툰
+                continue
+            extra = dumps({"score": score})
+            data.append(b"".join((fragment[:-1], b",", extra[1:])))
+        return encode_with_fragments(
+            {"webtoon_id": webtoon_id, "count": len(data)}, "webtoons", data
+        )
+
+    encoded = catalog.encoded(("similar", webtoon_id, limit, index.version, index.built_at), build)
+    last_modified = max(catalog.loaded_at, index.built_at)
+    return cached_json_response(request, encoded, last_modified=last_modified)
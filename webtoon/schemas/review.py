@@ -3,23 +3,36 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import List
+from typing import Annotated, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import AfterValidator, BaseModel, Field
+
+from webtoon.models.webtoon_rating_stats import has_rating_precision
+
+
+def _check_rating_precision(rating: float) -> float:
+    # rating_sum stores hundredths of a star; a finer rating would be rounded there
+    # but kept as-is on the review, so the aggregate and the rows would disagree.
+    if not has_rating_precision(rating):
+        raise ValueError("rating must have at most two decimal places")
+    return rating
+
+
+Rating = Annotated[float, Field(ge=0, le=5), AfterValidator(_check_rating_precision)]
 
 
 class ReviewCreate(BaseModel):
     """Payload used when clients submit a new review."""
 
     content: str = Field(..., min_length=1, max_length=2000)
-    rating: float = Field(..., ge=0, le=5)
+    rating: Rating
 
 
 class ReviewUpdate(BaseModel):
     """Payload used when clients modify an existing review."""
 
     content: str = Field(..., min_length=1, max_length=2000)
-    rating: float = Field(..., ge=0, le=5)
+    rating: Rating
 
 
 class ReviewResponse(BaseModel):
@@ -53,6 +66,13 @@ class ReviewListItem(BaseModel):
     }
 
 
+class ReviewExportItem(ReviewListItem):
+    """One line of the NDJSON export; never carries the author's ``anon_id``."""
+
+    webtoon_id: str
+    updated_at: datetime
+
+
 class ReviewListResponse(BaseModel):
     """Envelope returned by the review list endpoint."""
 
@@ -61,7 +81,9 @@ class ReviewListResponse(BaseModel):
     review_count: int
     page: int
     limit: int
+    sort: str = "recent"
     reviews: List[ReviewListItem]
+    next_cursor: Optional[str] = None
 
 
 class ReviewLikeResponse(BaseModel):
@@ -69,3 +91,20 @@ class ReviewLikeResponse(BaseModel):
 
     review_id: int
     likes: int
+
+
+class RatingHistogramBucket(BaseModel):
+    """Number of reviews whose rating rounds to ``rating`` (half-star steps)."""
+
+    rating: float
+    count: int
+
+
+class RatingHistogramResponse(BaseModel):
+    """Star distribution of a webtoon's reviews."""
+
+    webtoon_id: str
+    average_rating: float
+    review_count: int
+    bucket_size: float
+    buckets: List[RatingHistogramBucket]
@@ -0,0 +1,15 @@
+"""Request schemas for catalog endpoints."""
+
+from __future__ import annotations
+
+from typing import List
+
+from pydantic import BaseModel, Field
+
+from webtoon.services.webtoon_batch import MAX_BATCH_IDS
+
+
+class WebtoonBatchRequest(BaseModel):
+    """Ids to look up in a single ``POST /webtoons/batch`` call."""
+
+    ids: List[str] = Field(..., min_length=1, max_length=MAX_BATCH_IDS)
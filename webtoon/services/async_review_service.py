@@ -0,0 +1,158 @@
+"""Async counterpart of ReviewService for the aiosqlite-backed review endpoints."""
+
+from __future__ import annotations
+
+from typing import Optional, Tuple
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from webtoon.models import Review, WebtoonRatingStats
+from webtoon.schemas.review import ReviewCreate, ReviewUpdate
+from webtoon.services.leaderboard import leaderboard
+from webtoon.services.review_service import (
+    ReviewSort,
+    bucket_increment_statement,
+    is_duplicate_review,
+    like_increment_statement,
+    like_insert_statement,
+    not_review_owner,
+    own_review_statement,
+    review_already_exists,
+    review_already_liked,
+    review_not_found,
+    review_page_statement,
+    reviews_not_found,
+    split_review_page,
+    stats_increment_statement,
+    webtoon_exists_statement,
+    webtoon_not_found,
+)
+
+
+class AsyncReviewService:
+    """Same behaviour as ReviewService, awaiting the database instead of blocking a thread.
+
+    Statements and error responses come from ``review_service`` so both code
+    paths stay identical apart from how they are executed.
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        self._db = db
+
+    async def create_review(
+        self,
+        *,
+        webtoon_id: str,
+        payload: ReviewCreate,
+        anonymous_user_id: str,
+    ) -> Review:
+        await self._ensure_webtoon_exists(webtoon_id)
+
+        review = Review(
+            webtoon_id=webtoon_id,
+            content=payload.content,
+            rating=payload.rating,
+            anonymous_user_id=anonymous_user_id,
+        )
+        self._db.add(review)
+        try:
+            await self._db.flush()
+        except IntegrityError as exc:
+            await self._db.rollback()
+            if is_duplicate_review(exc):
+                raise review_already_exists() from None
+            raise
+
+        await self._db.execute(stats_increment_statement(webtoon_id, payload.rating))
+        await self._db.execute(bucket_increment_statement(webtoon_id, payload.rating))
+
+        try:
+            await self._db.commit()
+        except Exception:
+            await self._db.rollback()
+            raise
+
+        leaderboard.record_review(webtoon_id, payload.rating)
+        await self._db.refresh(review)
+        return review
+
+    async def list_reviews(
+        self,
+        *,
+        webtoon_id: str,
+        page: int,
+        limit: int,
+        cursor: Optional[str] = None,
+        sort: ReviewSort = "recent",
+    ) -> Tuple[WebtoonRatingStats, list[Review], Optional[str]]:
+        stats = await self._db.get(WebtoonRatingStats, webtoon_id)
+        if stats is None or stats.review_count == 0:
+            raise reviews_not_found()
+
+        rows = (
+            await self._db.scalars(
+                review_page_statement(
+                    webtoon_id=webtoon_id, page=page, limit=limit, cursor=cursor, sort=sort
+                )
+            )
+        ).all()
+        reviews, next_cursor = split_review_page(rows, limit, sort)
+        return stats, reviews, next_cursor
+
+    async def update_review(
+        self,
+        *,
+        webtoon_id: str,
+        payload: ReviewUpdate,
+        anonymous_user_id: str,
+    ) -> Review:
+        await self._ensure_webtoon_exists(webtoon_id)
+
+        review = (
+            await self._db.scalars(own_review_statement(webtoon_id, anonymous_user_id))
+        ).first()
+        if review is None:
+            raise not_review_owner()
+
+        # rating_sum and the histogram follow in the reviews_rating_au trigger,
+        # which reads the old rating inside the UPDATE; this copy only feeds
+        # the (periodically reconciled) leaderboard.
+        previous_rating = review.rating
+        review.content = payload.content
+        review.rating = payload.rating
+
+        try:
+            await self._db.commit()
+        except Exception:
+            await self._db.rollback()
+            raise
+
+        leaderboard.record_rating_change(webtoon_id, previous_rating, payload.rating)
+        await self._db.refresh(review)
+        return review
+
+    async def like_review(self, *, review_id: int, anonymous_user_id: str) -> int:
+        inserted = (
+            await self._db.execute(like_insert_statement(review_id, anonymous_user_id))
+        ).rowcount
+
+        if not inserted:
+            await self._db.rollback()
+            if await self._db.get(Review, review_id) is None:
+                raise review_not_found()
+            raise review_already_liked()
+
+        likes = (await self._db.execute(like_increment_statement(review_id))).scalar_one()
+
+        try:
+            await self._db.commit()
+        except Exception:
+            await self._db.rollback()
+            raise
+
+        return likes
+
+    async def _ensure_webtoon_exists(self, webtoon_id: str) -> None:
+        if not (await self._db.execute(webtoon_exists_statement(webtoon_id))).scalar():
+            raise webtoon_not_found()
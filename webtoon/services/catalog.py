@@ -0,0 +1,547 @@
+"""In-memory snapshot of the ``normalized_webtoon`` catalog."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from typing import Callable, Final, Hashable, Mapping, NamedTuple, Optional, Sequence
+
+from webtoon.database import DB_PATH, connect_readonly
+from webtoon.responses import EncodedBody, dumps, make_etag
+from webtoon.services.facets import FacetIndex, split_values
+from webtoon.services.suggest import SuggestIndex
+
+logger = logging.getLogger(__name__)
+
+CATALOG_COLUMNS: Final[tuple[str, ...]] = (
+    "id",
+    "thumbnail",
+    "title",
+    "updateDays",
+    "authors",
+    "synopsis",
+    "tags",
+)
+# 목록형 응답(/webtoons, /webtoons/sample)은 시놉시스를 제외한다.
+SUMMARY_COLUMNS: Final[tuple[str, ...]] = tuple(
+    column for column in CATALOG_COLUMNS if column != "synopsis"
+)
+VALID_DAYS: Final[tuple[str, ...]] = ("MON", "TUE", "WED", "THR", "FRI", "SAT", "SUN")
+# 임의의 쿼리 값으로 캐시가 무한히 커지지 않도록 응답 개수를 제한한다 (LRU).
+MAX_CACHED_RESPONSES: Final[int] = int(os.getenv("WEBTOON_CATALOG_CACHE_SIZE", "4096"))
+# 자유 입력(자동완성 q 등)으로 만든 응답은 별도의 작은 LRU 에 둬 고정 응답을 밀어내지 않게 한다.
+MAX_QUERY_RESPONSES: Final[int] = int(os.getenv("WEBTOON_QUERY_CACHE_SIZE", "256"))
+
+CATALOG_CHECK_INTERVAL: Final[float] = float(
+    os.getenv("WEBTOON_CATALOG_CHECK_INTERVAL", "1.0")
+)
+# 지정하면 워커들이 이 경로의 컴파일된 스냅샷 파일을 mmap 으로 공유한다.
+CATALOG_FILE_PATH: Final[str] = os.getenv("WEBTOON_CATALOG_FILE", "")
+
+_REVISION_TABLE_DDL: Final[str] = """
+    CREATE TABLE IF NOT EXISTS catalog_revision (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        revision INTEGER NOT NULL
+    )
+"""
+_REVISION_TRIGGERS: Final[dict[str, str]] = {
+    f"catalog_revision_{suffix}": f"""
+        CREATE TRIGGER catalog_revision_{suffix} AFTER {event} ON normalized_webtoon BEGIN
+            UPDATE catalog_revision SET revision = revision + 1 WHERE id = 1;
+        END
+    """
+    for suffix, event in (("ai", "INSERT"), ("au", "UPDATE"), ("ad", "DELETE"))
+}
+# Secondary indexes on the crawler-owned catalog table: the webtoon-exists
+# check of every review write and the day-filtered LIKE search rely on them.
+_CATALOG_INDEXES: Final[dict[str, str]] = {
+    "ix_normalized_webtoon_id": (
+        "CREATE INDEX IF NOT EXISTS ix_normalized_webtoon_id ON normalized_webtoon (id)"
+    ),
+    # (updateDays, id) also returns a day's titles in id order, so the
+    # day-filtered search needs neither a full scan nor a sort.
+    "ix_normalized_webtoon_update_days_id": (
+        "CREATE INDEX IF NOT EXISTS ix_normalized_webtoon_update_days_id "
+        "ON normalized_webtoon (updateDays, id)"
+    ),
+}
+# Earlier catalog indexes that a current one makes redundant.
+_SUPERSEDED_CATALOG_INDEXES: Final[tuple[str, ...]] = ("ix_normalized_webtoon_update_days",)
+
+
+class CatalogData(NamedTuple):
+    """Storage behind a :class:`CatalogSnapshot`.
+
+    Built as Python lists by :func:`build_catalog_data`, or as zero-copy views
+    over a memory-mapped snapshot file (``webtoon.services.catalog_file``).
+    Fragments are ``bytes`` or ``memoryview`` slices; both join into bodies.
+    """
+
+    version: str
+    rows: Sequence[tuple]
+    sorted_ids: Sequence[str]
+    sorted_positions: Sequence[int]
+    full_json: Sequence[bytes]
+    summary_json: Sequence[bytes]
+    title_json: Sequence[bytes]
+    by_day: Mapping[str, Sequence[int]]
+    position_of: Callable[[str], Optional[int]]
+
+
+def build_catalog_data(rows: list[tuple]) -> CatalogData:
+    """Encode every fragment and build the id/day indexes for ``rows`` (``rowid`` order)."""
+
+    index: dict[str, int] = {}
+    by_day: dict[str, list[int]] = {}
+    full_json: list[bytes] = []
+    summary_json: list[bytes] = []
+    title_json: list[bytes] = []
+    digest = hashlib.sha1()
+
+    for position, row in enumerate(rows):
+        item = dict(zip(CATALOG_COLUMNS, row))
+        webtoon_id = item["id"]
+        index.setdefault(webtoon_id, position)
+        # 여러 요일에 연재되는 작품("MON,SAT")은 각 요일 목록에 모두 들어간다.
+        for day in split_values(item["updateDays"]):
+            by_day.setdefault(day, []).append(position)
+
+        full = dumps({**item, "webtoon_id": webtoon_id})
+        full_json.append(full)
+        summary_json.append(
+            dumps(
+                {
+                    **{column: item[column] for column in SUMMARY_COLUMNS},
+                    "webtoon_id": webtoon_id,
+                }
+            )
+        )
+        title_json.append(dumps({"title": item["title"]}))
+        digest.update(full)
+
+    sorted_ids = sorted(index)
+    return CatalogData(
+        version=digest.hexdigest(),
+        rows=rows,
+        sorted_ids=sorted_ids,
+        sorted_positions=[index[webtoon_id] for webtoon_id in sorted_ids],
+        full_json=full_json,
+        summary_json=summary_json,
+        title_json=title_json,
+        by_day=by_day,
+        position_of=index.get,
+    )
+
+
+class ResponseCache:
+    """Thread-safe LRU of encoded response bodies."""
+
+    __slots__ = ("_max_size", "_lock", "_items")
+
+    def __init__(self, max_size: int) -> None:
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self._items: OrderedDict[Hashable, EncodedBody] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get_or_build(self, key: Hashable, build: Callable[[], bytes]) -> EncodedBody:
+        with self._lock:
+            cached = self._items.get(key)
+            if cached is not None:
+                self._items.move_to_end(key)
+                return cached
+        # Built outside the lock; two threads racing on one key build identical bodies.
+        body = build()
+        cached = EncodedBody(body, make_etag(body))
+        if self._max_size > 0:
+            with self._lock:
+                self._items[key] = cached
+                self._items.move_to_end(key)
+                while len(self._items) > self._max_size:
+                    self._items.popitem(last=False)
+        return cached
+
+
+class CatalogSnapshot:
+    """Immutable view of the catalog.
+
+    Rows are stored once in ``rowid`` order; every other structure refers to
+    them by position. JSON fragments are encoded ahead of time (at load time,
+    or when the snapshot file was built) so the read endpoints only ever join
+    bytes.
+    """
+
+    __slots__ = (
+        "version",
+        "loaded_at",
+        "storage",
+        "rows",
+        "sorted_ids",
+        "_position_of",
+        "_sorted_positions",
+        "_by_day",
+        "_full_json",
+        "_summary_json",
+        "_title_json",
+        "_responses",
+        "_query_responses",
+        "_suggest_index",
+        "_facet_index",
+        "_index_lock",
+    )
+
+    def __init__(self, data: CatalogData, *, loaded_at: float, storage: str = "memory") -> None:
+        self.version = data.version
+        self.loaded_at = loaded_at
+        self.storage = storage
+        self.rows = data.rows
+        self.sorted_ids = data.sorted_ids
+        self._position_of = data.position_of
+        self._sorted_positions = data.sorted_positions
+        self._by_day = data.by_day
+        self._full_json = data.full_json
+        self._summary_json = data.summary_json
+        self._title_json = data.title_json
+        self._responses = ResponseCache(MAX_CACHED_RESPONSES)
+        self._query_responses = ResponseCache(MAX_QUERY_RESPONSES)
+        self._suggest_index: Optional[SuggestIndex] = None
+        self._facet_index: Optional[FacetIndex] = None
+        self._index_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __contains__(self, webtoon_id: object) -> bool:
+        return isinstance(webtoon_id, str) and self._position_of(webtoon_id) is not None
+
+    def get(self, webtoon_id: str) -> Optional[dict]:
+        """Return the full catalog row (including ``webtoon_id``) or ``None``."""
+
+        position = self._position_of(webtoon_id)
+        if position is None:
+            return None
+        item = dict(zip(CATALOG_COLUMNS, self.rows[position]))
+        item["webtoon_id"] = item["id"]
+        return item
+
+    def full_fragment(self, webtoon_id: str) -> Optional[bytes]:
+        position = self._position_of(webtoon_id)
+        return None if position is None else self._full_json[position]
+
+    def summary_fragment(self, webtoon_id: str) -> Optional[bytes]:
+        position = self._position_of(webtoon_id)
+        return None if position is None else self._summary_json[position]
+
+    def summary_page(self, offset: int, limit: int) -> list[bytes]:
+        """Return summary fragments for ``limit`` ids in id order after ``offset``."""
+
+        positions = self._sorted_positions[offset : offset + limit]
+        return [self._summary_json[position] for position in positions]
+
+    def summary_fragments_at(self, ranks: list[int]) -> list[bytes]:
+        """Return summary fragments for positions in ``sorted_ids`` order."""
+
+        return [self._summary_json[self._sorted_positions[rank]] for rank in ranks]
+
+    def rank_of(self, webtoon_id: str) -> Optional[int]:
+        """Return the position of ``webtoon_id`` in ``sorted_ids`` or ``None``."""
+
+        if webtoon_id not in self:
+            return None
+        return bisect_left(self.sorted_ids, webtoon_id)
+
+    def offset_after(self, webtoon_id: str) -> int:
+        """Return the sorted-array position of the first id greater than ``webtoon_id``."""
+
+        return bisect_right(self.sorted_ids, webtoon_id)
+
+    def day_fragments(self, day: str) -> list[bytes]:
+        return [self._full_json[position] for position in self._by_day.get(day, ())]
+
+    def day_title_fragments(self, day: str) -> list[bytes]:
+        return [self._title_json[position] for position in self._by_day.get(day, ())]
+
+    def title_fragments(self) -> Sequence[bytes]:
+        return self._title_json
+
+    def sorted_rows(self) -> list[tuple]:
+        """Return one row per id, in ``sorted_ids`` order."""
+
+        return [self.rows[position] for position in self._sorted_positions]
+
+    def suggest_index(self) -> SuggestIndex:
+        """Return the typeahead index for this snapshot, building it on first use."""
+
+        index = self._suggest_index
+        if index is None:
+            with self._index_lock:
+                index = self._suggest_index
+                if index is None:
+                    title = CATALOG_COLUMNS.index("title")
+                    authors = CATALOG_COLUMNS.index("authors")
+                    index = self._suggest_index = SuggestIndex(
+                        [row[title] for row in self.rows], [row[authors] for row in self.rows]
+                    )
+        return index
+
+    def facet_index(self) -> FacetIndex:
+        """Return the tag/day bitmaps (in ``sorted_ids`` order), building them on first use."""
+
+        index = self._facet_index
+        if index is None:
+            with self._index_lock:
+                index = self._facet_index
+                if index is None:
+                    tags = CATALOG_COLUMNS.index("tags")
+                    days = CATALOG_COLUMNS.index("updateDays")
+                    rows = self.sorted_rows()
+                    index = self._facet_index = FacetIndex(
+                        [row[tags] for row in rows], [row[days] for row in rows]
+                    )
+        return index
+
+    def encoded(
+        self, key: Hashable, build: Callable[[], bytes], *, free_text: bool = False
+    ) -> EncodedBody:
+        """Return the memoized response body for ``key``, building it on first use.
+
+        The memo lives on the snapshot, so it is dropped together with the
+        snapshot whenever the catalog version changes. It keeps the
+        ``MAX_CACHED_RESPONSES`` most recently used bodies, so keys made up
+        from junk request input age out instead of filling it for good.
+        Keys holding free text (``free_text``) go to a separate, smaller LRU
+        so a stream of distinct queries cannot evict the other bodies.
+        """
+
+        cache = self._query_responses if free_text else self._responses
+        return cache.get_or_build(key, build)
+
+
+def read_catalog_rows(conn: sqlite3.Connection) -> list[tuple]:
+    return [
+        tuple(row)
+        for row in conn.execute(
+            f"SELECT {', '.join(CATALOG_COLUMNS)} FROM normalized_webtoon ORDER BY rowid"
+        )
+    ]
+
+
+def read_catalog_fingerprint(conn: sqlite3.Connection) -> tuple:
+    """Schema version plus the trigger-maintained revision (or count/max rowid without it)."""
+
+    schema_version = conn.execute("PRAGMA schema_version").fetchone()[0]
+    try:
+        row = conn.execute("SELECT revision FROM catalog_revision WHERE id = 1").fetchone()
+        return (schema_version, row[0] if row else None)
+    except sqlite3.OperationalError:
+        row = conn.execute("SELECT COUNT(*), MAX(rowid) FROM normalized_webtoon").fetchone()
+        return (schema_version, *row)
+
+
+class CatalogStore:
+    """Holds the current :class:`CatalogSnapshot` and reloads it on change.
+
+    Freshness is checked at most once per ``check_interval`` seconds using the
+    DB/WAL file mtimes and ``PRAGMA data_version``. Those also move on review
+    writes, so a change only triggers a reload when the catalog fingerprint
+    (schema version plus the trigger-maintained ``catalog_revision``) differs.
+
+    With ``file_path`` set, snapshots are memory-mapped from a compiled
+    snapshot file shared by every worker process instead of being built in
+    each one. A stale file is rebuilt by whichever worker notices first (the
+    others wait on a file lock and map the result), and a file replaced by
+    another process or the CLI is picked up on the next check.
+    """
+
+    def __init__(
+        self,
+        db_path: str = DB_PATH,
+        check_interval: float = CATALOG_CHECK_INTERVAL,
+        file_path: str = CATALOG_FILE_PATH,
+    ) -> None:
+        self._db_path = db_path
+        self._check_interval = check_interval
+        self._file_path = file_path
+        self._lock = threading.Lock()
+        self._snapshot: Optional[CatalogSnapshot] = None
+        self._conn: Optional[sqlite3.Connection] = None
+        self._checked_at = 0.0
+        self._change_token: Optional[tuple] = None
+        self._fingerprint: Optional[tuple] = None
+        self._file_key: Optional[tuple] = None
+
+    def snapshot(self) -> CatalogSnapshot:
+        """Return the current snapshot, reloading it first if the catalog moved."""
+
+        snapshot = self._snapshot
+        if snapshot is not None and time.monotonic() - self._checked_at < self._check_interval:
+            return snapshot
+
+        with self._lock:
+            if self._snapshot is None or time.monotonic() - self._checked_at >= self._check_interval:
+                self._refresh()
+            return self._snapshot
+
+    def reload(self) -> CatalogSnapshot:
+        """Force a reload regardless of the change detectors."""
+
+        with self._lock:
+            self._load(self._connection(), rebuild=True)
+            return self._snapshot
+
+    def _refresh(self) -> None:
+        conn = self._connection()
+        if self._snapshot is None:
+            self._load(conn)
+        else:
+            token = self._read_change_token(conn)
+            if token != self._change_token:
+                if read_catalog_fingerprint(conn) != self._fingerprint:
+                    self._load(conn)
+                else:
+                    self._change_token = token
+            elif self._file_path and self._read_file_key() != self._file_key:
+                self._load(conn)
+        self._checked_at = time.monotonic()
+
+    def _load(self, conn: sqlite3.Connection, *, rebuild: bool = False) -> None:
+        started = time.perf_counter()
+        # 지문을 먼저 읽어 두면 로딩 도중 변경이 생겨도 다음 확인 때 다시 로딩된다.
+        fingerprint = read_catalog_fingerprint(conn)
+        change_token = self._read_change_token(conn)
+        if self._file_path:
+            snapshot, fingerprint = self._map_file(conn, fingerprint, rebuild=rebuild)
+        else:
+            snapshot = CatalogSnapshot(
+                build_catalog_data(read_catalog_rows(conn)), loaded_at=time.time()
+            )
+        self._snapshot = snapshot
+        self._fingerprint = fingerprint
+        self._change_token = change_token
+        logger.info(
+            "Loaded catalog snapshot %s (%d rows, %s) in %.1f ms",
+            snapshot.version[:12],
+            len(snapshot),
+            snapshot.storage,
+            (time.perf_counter() - started) * 1000,
+        )
+
+    def _map_file(
+        self, conn: sqlite3.Connection, fingerprint: tuple, *, rebuild: bool
+    ) -> tuple[CatalogSnapshot, tuple]:
+        from webtoon.services import catalog_file
+
+        mapped = None if rebuild else catalog_file.open_if_current(self._file_path, fingerprint)
+        if mapped is None:
+            with catalog_file.build_lock(self._file_path):
+                # Another worker may have rebuilt it while this one waited for the lock.
+                mapped = None if rebuild else catalog_file.open_if_current(self._file_path, fingerprint)
+                if mapped is None:
+                    catalog_file.build_catalog_file(conn, self._file_path)
+                    mapped = catalog_file.open_catalog_file(self._file_path)
+        self._file_key = mapped.file_key
+        snapshot = CatalogSnapshot(mapped.data, loaded_at=mapped.built_at, storage="mmap")
+        return snapshot, mapped.fingerprint
+
+    def _read_file_key(self) -> Optional[tuple]:
+        from webtoon.services.catalog_file import file_key
+
+        return file_key(self._file_path)
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = connect_readonly(self._db_path)
+        return self._conn
+
+    def _read_change_token(self, conn: sqlite3.Connection) -> tuple:
+        mtimes = []
+        for path in (self._db_path, f"{self._db_path}-wal"):
+            try:
+                mtimes.append(os.stat(path).st_mtime_ns)
+            except FileNotFoundError:
+                mtimes.append(None)
+        data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+        return (*mtimes, data_version)
+
+
+def catalog_revision_ddl() -> list[str]:
+    """DDL owned by :func:`ensure_catalog_revision` (part of the startup schema fingerprint)."""
+
+    return [_REVISION_TABLE_DDL, *_REVISION_TRIGGERS.values()]
+
+
+def ensure_catalog_revision(conn: sqlite3.Connection) -> None:
+    """Create the ``catalog_revision`` counter and the triggers that bump it."""
+
+    has_catalog = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'normalized_webtoon'"
+    ).fetchone()
+    if not has_catalog:
+        return
+
+    conn.execute(_REVISION_TABLE_DDL)
+    conn.execute("INSERT OR IGNORE INTO catalog_revision (id, revision) VALUES (1, 0)")
+    existing = {
+        row[0]
+        for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'trigger' AND tbl_name = 'normalized_webtoon'"
+        )
+    }
+    for name, ddl in _REVISION_TRIGGERS.items():
+        if name not in existing:
+            conn.execute(ddl)
+    conn.commit()
+
+
+def catalog_index_ddl() -> list[str]:
+    """DDL owned by :func:`ensure_catalog_indexes` (part of the startup schema fingerprint)."""
+
+    return list(_CATALOG_INDEXES.values())
+
+
+def ensure_catalog_indexes(conn: sqlite3.Connection) -> None:
+    """Create the ``normalized_webtoon`` indexes that are missing.
+
+    A catalog import that replaces the table drops them together with it, so
+    they are re-ensured on every full startup like the revision triggers.
+    """
+
+    has_catalog = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'normalized_webtoon'"
+    ).fetchone()
+    if not has_catalog:
+        return
+
+    existing = {
+        row[0]
+        for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'normalized_webtoon'"
+        )
+    }
+    missing = [name for name in _CATALOG_INDEXES if name not in existing]
+    for name in missing:
+        conn.execute(_CATALOG_INDEXES[name])
+    for name in _SUPERSEDED_CATALOG_INDEXES:
+        if name in existing:
+            conn.execute(f"DROP INDEX {name}")
+    if missing:
+        # The replaced table lost its statistics too.
+        conn.execute("ANALYZE normalized_webtoon")
+    conn.commit()
+
+
+catalog_store = CatalogStore()
+
+
+def get_catalog() -> CatalogSnapshot:
+    """FastAPI dependency returning the current catalog snapshot."""
+
+    return catalog_store.snapshot()
@@ -0,0 +1,281 @@
+"""Compiled, memory-mapped catalog snapshot shared by worker processes.
+
+Layout (native byte order, recorded in the header)::
+
+    b"WTCAT\\0v1"                      magic
+    uint64                             header length
+    header JSON                        version, fingerprint, counts, section ranges
+    (padding to 8 bytes)
+    uint64[rows * FIELDS + 1]          offsets into the string table
+    uint32[ids]                        row position of every id, in id order
+    uint32[...] per day                row positions of each update day
+    string table                       per row: id, row JSON, full/summary/title fragments
+
+Every worker maps the file read-only, so the pages live once in the page
+cache however many workers there are. Lookups slice ``memoryview`` objects
+over the mapping without copying; id lookups binary-search the sorted id
+array. A new file is written next to the old one and moved into place with
+``os.replace``, so readers always see either the old or the new snapshot.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import json
+import logging
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Any, Final, Iterator, NamedTuple, Optional, Sequence
+
+from webtoon.responses import dumps, loads
+from webtoon.services.catalog import (
+    CATALOG_COLUMNS,
+    CatalogData,
+    build_catalog_data,
+    read_catalog_fingerprint,
+    read_catalog_rows,
+)
+
+logger = logging.getLogger(__name__)
+
+MAGIC: Final[bytes] = b"WTCAT\x00v1"
+FORMAT_VERSION: Final[int] = 1
+_HEADER_LENGTH = struct.Struct("<Q")
+_PREAMBLE_SIZE: Final[int] = len(MAGIC) + _HEADER_LENGTH.size
+
+# String table fields stored for every row, in this order.
+FIELDS: Final[tuple[str, ...]] = ("id", "row", "full", "summary", "title")
+_ID, _ROW, _FULL, _SUMMARY, _TITLE = range(len(FIELDS))
+_ID_COLUMN: Final[int] = CATALOG_COLUMNS.index("id")
+
+
+def _align(value: int) -> int:
+    return (value + 7) & ~7
+
+
+class _FieldView(Sequence[memoryview]):
+    """One string-table field of every row, as zero-copy slices."""
+
+    __slots__ = ("_blob", "_offsets", "_field", "_count")
+
+    def __init__(self, blob: memoryview, offsets: memoryview, field: int, count: int) -> None:
+        self._blob = blob
+        self._offsets = offsets
+        self._field = field
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        slot = index * len(FIELDS) + self._field
+        return self._blob[self._offsets[slot] : self._offsets[slot + 1]]
+
+
+class _RowView(Sequence[tuple]):
+    __slots__ = ("_rows",)
+
+    def __init__(self, rows: _FieldView) -> None:
+        self._rows = rows
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [tuple(loads(row)) for row in self._rows[index]]
+        return tuple(loads(self._rows[index]))
+
+
+class _SortedIdView(Sequence[str]):
+    """``sorted_ids`` decoded on access; supports ``bisect`` directly."""
+
+    __slots__ = ("_ids", "_positions")
+
+    def __init__(self, ids: _FieldView, positions: memoryview) -> None:
+        self._ids = ids
+        self._positions = positions
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __getitem__(self, rank: Any) -> Any:
+        if isinstance(rank, slice):
+            return [self[i] for i in range(*rank.indices(len(self)))]
+        return str(self._ids[self._positions[rank]], "utf-8")
+
+
+class MappedCatalog(NamedTuple):
+    data: CatalogData
+    fingerprint: tuple
+    built_at: float
+    file_key: Optional[tuple]
+
+
+def file_key(path: str) -> Optional[tuple]:
+    """Identity of the file currently at ``path`` (changes when it is replaced)."""
+
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+def write_catalog_file(path: str, data: CatalogData, fingerprint: tuple) -> dict[str, Any]:
+    """Serialize ``data`` to ``path`` atomically and return the header."""
+
+    offsets = array("Q", [0])
+    blob = bytearray()
+    for position, row in enumerate(data.rows):
+        for value in (
+            str(row[_ID_COLUMN]).encode("utf-8"),
+            dumps(list(row)),
+            data.full_json[position],
+            data.summary_json[position],
+            data.title_json[position],
+        ):
+            blob += value
+            offsets.append(len(blob))
+
+    sections: list[tuple[str, bytes]] = [
+        ("offsets", offsets.tobytes()),
+        ("sorted_positions", array("I", data.sorted_positions).tobytes()),
+    ]
+    sections += [(f"day:{day}", array("I", positions).tobytes()) for day, positions in data.by_day.items()]
+    sections.append(("strings", bytes(blob)))
+
+    ranges: dict[str, list[int]] = {}
+    cursor = 0
+    for name, payload in sections:
+        ranges[name] = [cursor, len(payload)]
+        cursor = _align(cursor + len(payload))
+
+    header = {
+        "format": FORMAT_VERSION,
+        "byteorder": sys.byteorder,
+        "version": data.version,
+        "fingerprint": list(fingerprint),
+        "built_at": time.time(),
+        "rows": len(data.rows),
+        "ids": len(data.sorted_positions),
+        "days": list(data.by_day),
+        "sections": ranges,
+    }
+    header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    base = _align(_PREAMBLE_SIZE + len(header_bytes))
+
+    directory = os.path.dirname(os.path.abspath(path))
+    tmp_path = os.path.join(directory, f".{os.path.basename(path)}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as fh:
+        fh.write(MAGIC + _HEADER_LENGTH.pack(len(header_bytes)) + header_bytes)
+        for name, payload in sections:
+            fh.seek(base + ranges[name][0])
+            fh.write(payload)
+        fh.flush()
+        os.fsync(fh.fileno())
+    os.replace(tmp_path, path)
+    return header
+
+
+def open_catalog_file(path: str) -> MappedCatalog:
+    """Map ``path`` read-only and expose it as :class:`CatalogData` views."""
+
+    with open(path, "rb") as fh:
+        mapping = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        stat = os.fstat(fh.fileno())
+
+    view = memoryview(mapping)
+    if bytes(view[: len(MAGIC)]) != MAGIC:
+        raise ValueError(f"{path} is not a catalog snapshot file")
+    (header_length,) = _HEADER_LENGTH.unpack_from(view, len(MAGIC))
+    header = json.loads(bytes(view[_PREAMBLE_SIZE : _PREAMBLE_SIZE + header_length]))
+    if header.get("format") != FORMAT_VERSION or header.get("byteorder") != sys.byteorder:
+        raise ValueError(f"{path} was written in an incompatible format")
+    base = _align(_PREAMBLE_SIZE + header_length)
+
+    def section(name: str, fmt: str) -> memoryview:
+        start, length = header["sections"][name]
+        return view[base + start : base + start + length].cast(fmt)
+
+    rows = header["rows"]
+    offsets = section("offsets", "Q")
+    strings = section("strings", "B")
+    sorted_positions = section("sorted_positions", "I")
+    fields = [_FieldView(strings, offsets, field, rows) for field in range(len(FIELDS))]
+    sorted_ids = _SortedIdView(fields[_ID], sorted_positions)
+
+    def position_of(webtoon_id: str) -> Optional[int]:
+        if not isinstance(webtoon_id, str):
+            return None
+        rank = bisect_left(sorted_ids, webtoon_id)
+        if rank < len(sorted_ids) and sorted_ids[rank] == webtoon_id:
+            return sorted_positions[rank]
+        return None
+
+    data = CatalogData(
+        version=header["version"],
+        rows=_RowView(fields[_ROW]),
+        sorted_ids=sorted_ids,
+        sorted_positions=sorted_positions,
+        full_json=fields[_FULL],
+        summary_json=fields[_SUMMARY],
+        title_json=fields[_TITLE],
+        by_day={day: section(f"day:{day}", "I") for day in header["days"]},
+        position_of=position_of,
+    )
+    key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    return MappedCatalog(data, tuple(header["fingerprint"]), header["built_at"], key)
+
+
+def open_if_current(path: str, fingerprint: tuple) -> Optional[MappedCatalog]:
+    """Map ``path`` if it exists and was built from the catalog state ``fingerprint``."""
+
+    if not os.path.exists(path):
+        return None
+    try:
+        mapped = open_catalog_file(path)
+    except (OSError, ValueError, KeyError) as exc:
+        logger.warning("Ignoring unreadable catalog snapshot file %s: %s", path, exc)
+        return None
+    return mapped if mapped.fingerprint == fingerprint else None
+
+
+@contextmanager
+def build_lock(path: str) -> Iterator[None]:
+    """Serialize rebuilds of ``path`` across worker processes."""
+
+    with open(f"{path}.lock", "a") as lock_file:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def build_catalog_file(conn: Any, path: str) -> dict[str, Any]:
+    """Compile ``normalized_webtoon`` into the snapshot file at ``path``."""
+
+    started = time.perf_counter()
+    fingerprint = read_catalog_fingerprint(conn)
+    header = write_catalog_file(path, build_catalog_data(read_catalog_rows(conn)), fingerprint)
+    logger.info(
+        "Built catalog snapshot file %s (%d rows, %.1f MiB) in %.1f ms",
+        path,
+        header["rows"],
+        os.path.getsize(path) / 2**20,
+        (time.perf_counter() - started) * 1000,
+    )
+    return header
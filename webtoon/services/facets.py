@@ -0,0 +1,126 @@
+"""Tag/day inverted index over a catalog snapshot, stored as integer bitmaps.
+
+Bit ``i`` of every bitmap stands for the ``i``-th id in ``sorted_ids`` order,
+so a filtered page is read straight off the lowest set bits and a keyset
+cursor is a mask. ``&``/``|``/``bit_count`` on Python ints run in C over
+machine words, which keeps any filter combination well under a millisecond
+at 100k titles.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Final, Iterable, Literal, Optional, Sequence
+
+FacetMatch = Literal["all", "any"]
+
+_SPLIT = re.compile(r"\s*,\s*")
+_NONZERO = re.compile(rb"[^\x00]")
+# Bytes per popcount step when skipping to a deep offset.
+_SKIP_CHUNK: Final[int] = 512
+_BYTE_BITS: Final[tuple[tuple[int, ...], ...]] = tuple(
+    tuple(bit for bit in range(8) if value >> bit & 1) for value in range(256)
+)
+
+
+def split_values(raw: Optional[str]) -> list[str]:
+    """Split a comma separated column or query value, dropping blanks and repeats."""
+
+    if not raw:
+        return []
+    return list(dict.fromkeys(value for value in _SPLIT.split(raw.strip()) if value))
+
+
+def _build_bitmaps(values_by_rank: Iterable[Iterable[str]], size: int) -> dict[str, int]:
+    buffers: dict[str, bytearray] = {}
+    nbytes = (size + 7) // 8
+    for rank, values in enumerate(values_by_rank):
+        for value in values:
+            buffer = buffers.get(value)
+            if buffer is None:
+                buffer = buffers[value] = bytearray(nbytes)
+            buffer[rank >> 3] |= 1 << (rank & 7)
+    return {value: int.from_bytes(buffer, "little") for value, buffer in buffers.items()}
+
+
+class FacetIndex:
+    """Tag and update-day bitmaps for one snapshot."""
+
+    __slots__ = ("size", "all_bits", "tags", "days")
+
+    def __init__(self, tags_by_rank: Sequence[str], days_by_rank: Sequence[str]) -> None:
+        self.size = len(tags_by_rank)
+        self.all_bits = (1 << self.size) - 1
+        self.tags = _build_bitmaps((split_values(raw) for raw in tags_by_rank), self.size)
+        self.days = _build_bitmaps((split_values(raw) for raw in days_by_rank), self.size)
+
+    def select(
+        self,
+        *,
+        tags: Sequence[str] = (),
+        days: Sequence[str] = (),
+        tag_match: FacetMatch = "all",
+        day_match: FacetMatch = "any",
+    ) -> int:
+        """Return the bitmap of titles matching both the tag and the day filter."""
+
+        bits = self.all_bits
+        if tags:
+            bits &= self._combine(self.tags, tags, tag_match)
+        if days:
+            bits &= self._combine(self.days, days, day_match)
+        return bits
+
+    def counts(self, bits: int) -> dict[str, dict[str, int]]:
+        """Facet counts of every tag and day within ``bits``, largest first."""
+
+        return {
+            "tags": self._count(self.tags, bits),
+            "days": self._count(self.days, bits),
+        }
+
+    @staticmethod
+    def _count(bitmaps: dict[str, int], bits: int) -> dict[str, int]:
+        counts = ((value, (bitmap & bits).bit_count()) for value, bitmap in bitmaps.items())
+        return dict(sorted(((v, c) for v, c in counts if c), key=lambda item: (-item[1], item[0])))
+
+    @staticmethod
+    def _combine(bitmaps: dict[str, int], values: Sequence[str], match: FacetMatch) -> int:
+        if match == "any":
+            combined = 0
+            for value in values:
+                combined |= bitmaps.get(value, 0)
+            return combined
+        combined = -1
+        for value in values:
+            combined &= bitmaps.get(value, 0)
+        return combined
+
+    def ranks(self, bits: int, offset: int, limit: int) -> list[int]:
+        """Return up to ``limit`` set bit positions of ``bits`` after skipping ``offset``."""
+
+        if limit <= 0 or not bits:
+            return []
+        data = bits.to_bytes((self.size + 7) // 8, "little")
+
+        start = 0
+        while offset:
+            chunk_count = int.from_bytes(data[start : start + _SKIP_CHUNK], "little").bit_count()
+            if chunk_count > offset or start + _SKIP_CHUNK >= len(data):
+                break
+            offset -= chunk_count
+            start += _SKIP_CHUNK
+
+        ranks: list[int] = []
+        for match in _NONZERO.finditer(data, start):
+            byte_index = match.start()
+            bits_in_byte = _BYTE_BITS[data[byte_index]]
+            if offset >= len(bits_in_byte):
+                offset -= len(bits_in_byte)
+                continue
+            for bit in bits_in_byte[offset:]:
+                ranks.append(byte_index * 8 + bit)
+                if len(ranks) == limit:
+                    return ranks
+            offset = 0
+        return ranks
@@ -0,0 +1,131 @@
+"""Background refresh of the time-decayed ``reviews.hot_score`` column."""
+
+from __future__ import annotations
+
+import fcntl
+import logging
+import os
+import threading
+import time
+from typing import Callable, Final, IO, Optional
+
+from sqlalchemy.orm import Session
+
+from webtoon.database import DB_PATH
+from webtoon.db.session import new_write_session
+from webtoon.services.review_service import ReviewService
+
+logger = logging.getLogger(__name__)
+
+HOT_REFRESH_INTERVAL: Final[float] = float(os.getenv("WEBTOON_HOT_REFRESH_SECONDS", "300"))
+HOT_REFRESH_BATCH: Final[int] = int(os.getenv("WEBTOON_HOT_REFRESH_BATCH", "2000"))
+# Older reviews keep the score they had when they left the window; by then it
+# is small enough that only their relative order among themselves is stale.
+HOT_WINDOW_DAYS: Final[float] = float(os.getenv("WEBTOON_HOT_WINDOW_DAYS", "30"))
+# 워커 중 이 파일의 잠금을 잡은 하나만 갱신한다.
+HOT_REFRESH_LOCK_PATH: Final[str] = os.getenv("WEBTOON_HOT_REFRESH_LOCK", f"{DB_PATH}.hot-scores.lock")
+
+_TIMESTAMP_FORMAT: Final[str] = "%Y-%m-%d %H:%M:%S"
+
+
+def window_start(now: float, days: float = HOT_WINDOW_DAYS) -> str:
+    return time.strftime(_TIMESTAMP_FORMAT, time.gmtime(now - days * 86400))
+
+
+class HotScoreRefresher:
+    """Periodically recomputes hot scores of reviews inside the decay window.
+
+    Each pass starts at the previous pass's window start, so reviews that aged
+    out since then get one last refresh before they are left alone.
+
+    Only one process refreshes: the first to take a non-blocking ``flock`` on
+    ``lock_path`` keeps it until it stops, and the others retry each interval
+    so a new one takes over if that worker exits.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = new_write_session,
+        *,
+        interval: float = HOT_REFRESH_INTERVAL,
+        batch_size: int = HOT_REFRESH_BATCH,
+        window_days: float = HOT_WINDOW_DAYS,
+        lock_path: str = HOT_REFRESH_LOCK_PATH,
+    ) -> None:
+        self._session_factory = session_factory
+        self._lock_path = lock_path
+        self._lock_file: Optional[IO[str]] = None
+        self._interval = interval
+        self._batch_size = batch_size
+        self._window_days = window_days
+        self._previous_start: Optional[str] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="hot-score-refresher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if not self.running:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self._release_leadership()
+
+    def is_leader(self) -> bool:
+        """Take the refresh lock if no other process holds it; ``True`` while held."""
+
+        if self._lock_file is None:
+            lock_file = open(self._lock_path, "a")
+            try:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                lock_file.close()
+                return False
+            self._lock_file = lock_file
+            logger.info("This worker refreshes hot scores (pid %d)", os.getpid())
+        return True
+
+    def _release_leadership(self) -> None:
+        if self._lock_file is not None:
+            fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_UN)
+            self._lock_file.close()
+            self._lock_file = None
+
+    def refresh(self) -> int:
+        now = time.time()
+        start = window_start(now, self._window_days)
+        since = min(start, self._previous_start) if self._previous_start else start
+        started = time.perf_counter()
+        db = self._session_factory()
+        try:
+            refreshed = ReviewService(db).refresh_hot_scores(
+                since=since, batch_size=self._batch_size, now=now
+            )
+        finally:
+            db.close()
+        self._previous_start = start
+        logger.info(
+            "Refreshed %d hot scores in %.1f ms", refreshed, (time.perf_counter() - started) * 1000
+        )
+        return refreshed
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            try:
+                if self.is_leader():
+                    self.refresh()
+            except Exception:
+                logger.exception("Hot score refresh failed")
+
+
+hot_score_refresher = HotScoreRefresher()
@@ -0,0 +1,315 @@
+"""In-memory "top webtoons" rankings maintained incrementally from review writes."""
+
+from __future__ import annotations
+
+import calendar
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left, insort
+from collections import deque
+from typing import Final, Literal, NamedTuple, Optional
+
+from webtoon.database import DB_PATH, connect_readonly
+from webtoon.models.webtoon_rating_stats import RATING_SCALE, to_rating_points
+
+logger = logging.getLogger(__name__)
+
+Ranking = Literal["rating", "reviews", "recent"]
+RANKINGS: Final[tuple[str, ...]] = ("rating", "reviews", "recent")
+
+# Bayesian prior: every title starts with this many virtual reviews at the global mean.
+PRIOR_WEIGHT: Final[float] = float(os.getenv("WEBTOON_TOP_PRIOR_WEIGHT", "10"))
+MIN_REVIEWS: Final[int] = int(os.getenv("WEBTOON_TOP_MIN_REVIEWS", "1"))
+RECENT_WINDOW_DAYS: Final[float] = float(os.getenv("WEBTOON_TOP_RECENT_DAYS", "7"))
+RECONCILE_INTERVAL: Final[float] = float(os.getenv("WEBTOON_TOP_RECONCILE_SECONDS", "60"))
+
+_TIMESTAMP_FORMAT: Final[str] = "%Y-%m-%d %H:%M:%S"
+RECENT_REVIEWS_QUERY: Final[str] = (
+    "SELECT webtoon_id, created_at FROM reviews WHERE created_at >= ? ORDER BY created_at"
+)
+
+
+class RankedIds:
+    """Ids kept sorted by descending score, ties broken by id.
+
+    Lookups are a bisect; an update is one ``list.pop`` plus one ``insort``,
+    i.e. a memmove of at most ``len(self)`` pointers.
+    """
+
+    __slots__ = ("_keys", "_scores")
+
+    def __init__(self) -> None:
+        self._keys: list[tuple[float, str]] = []
+        self._scores: dict[str, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def set(self, webtoon_id: str, score: float) -> None:
+        previous = self._scores.get(webtoon_id)
+        if previous == score:
+            return
+        if previous is not None:
+            self._keys.pop(bisect_left(self._keys, (-previous, webtoon_id)))
+        self._scores[webtoon_id] = score
+        insort(self._keys, (-score, webtoon_id))
+
+    def discard(self, webtoon_id: str) -> None:
+        previous = self._scores.pop(webtoon_id, None)
+        if previous is not None:
+            self._keys.pop(bisect_left(self._keys, (-previous, webtoon_id)))
+
+    def page(self, offset: int, limit: int) -> list[tuple[str, float]]:
+        return [(webtoon_id, -key) for key, webtoon_id in self._keys[offset : offset + limit]]
+
+    @classmethod
+    def from_scores(cls, scores: dict[str, float]) -> "RankedIds":
+        ranked = cls()
+        ranked._scores = dict(scores)
+        ranked._keys = sorted((-score, webtoon_id) for webtoon_id, score in scores.items())
+        return ranked
+
+
+class LeaderboardEntry(NamedTuple):
+    rank: int
+    webtoon_id: str
+    score: float
+    average_rating: float
+    bayesian_rating: float
+    review_count: int
+    recent_review_count: int
+
+
+class _TitleStats:
+    __slots__ = ("rating_sum", "review_count", "recent_count")
+
+    def __init__(self, rating_sum: int = 0, review_count: int = 0, recent_count: int = 0) -> None:
+        self.rating_sum = rating_sum
+        self.review_count = review_count
+        self.recent_count = recent_count
+
+
+def _parse_timestamp(value: str) -> float:
+    return float(calendar.timegm(time.strptime(value[:19], _TIMESTAMP_FORMAT)))
+
+
+class Leaderboard:
+    """Rankings by Bayesian rating, review count and reviews in the recent window.
+
+    ``ReviewService`` reports each committed create/update, which moves the
+    affected title in place. A background thread rebuilds everything from
+    ``webtoon_rating_stats`` and the recent ``reviews`` every
+    ``reconcile_interval`` seconds, which also picks up writes made by other
+    worker processes or the CLI and refreshes the prior mean used by the
+    Bayesian score (held fixed between reconciliations so ranks stay stable).
+    """
+
+    def __init__(
+        self,
+        db_path: str = DB_PATH,
+        *,
+        prior_weight: float = PRIOR_WEIGHT,
+        min_reviews: int = MIN_REVIEWS,
+        recent_window_days: float = RECENT_WINDOW_DAYS,
+        reconcile_interval: float = RECONCILE_INTERVAL,
+    ) -> None:
+        self._db_path = db_path
+        self._prior_weight = prior_weight
+        self._min_reviews = min_reviews
+        self._window = recent_window_days * 86400
+        self._reconcile_interval = reconcile_interval
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._loaded = False
+        self._stats: dict[str, _TitleStats] = {}
+        self._recent_events: deque[tuple[float, str]] = deque()
+        self._prior_mean = 0.0
+        self._rankings: dict[str, RankedIds] = {name: RankedIds() for name in RANKINGS}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def prior_mean(self) -> float:
+        return self._prior_mean
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="leaderboard", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if not self.running:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self) -> None:
+        while True:
+            try:
+                with self._load_lock:
+                    self.reconcile()
+            except Exception:
+                logger.exception("Leaderboard reconciliation failed")
+            if self._stop.wait(self._reconcile_interval):
+                return
+
+    def reconcile(self) -> None:
+        """Rebuild every ranking from the database and swap it in."""
+
+        started = time.perf_counter()
+        now = time.time()
+        cutoff = time.strftime(_TIMESTAMP_FORMAT, time.gmtime(now - self._window))
+        conn = connect_readonly(self._db_path)
+        try:
+            stats = {
+                webtoon_id: _TitleStats(rating_sum, review_count)
+                for webtoon_id, rating_sum, review_count in conn.execute(
+                    "SELECT webtoon_id, rating_sum, review_count FROM webtoon_rating_stats "
+                    "WHERE review_count > 0"
+                )
+            }
+            events: deque[tuple[float, str]] = deque()
+            for webtoon_id, created_at in conn.execute(RECENT_REVIEWS_QUERY, (cutoff,)):
+                events.append((_parse_timestamp(created_at), webtoon_id))
+                entry = stats.setdefault(webtoon_id, _TitleStats())
+                entry.recent_count += 1
+        finally:
+            conn.close()
+
+        total_points = sum(entry.rating_sum for entry in stats.values())
+        total_reviews = sum(entry.review_count for entry in stats.values())
+        prior_mean = total_points / RATING_SCALE / total_reviews if total_reviews else 0.0
+
+        with self._lock:
+            self._stats = stats
+            self._recent_events = events
+            self._prior_mean = prior_mean
+            self._rankings = {
+                "rating": RankedIds.from_scores(
+                    {
+                        webtoon_id: self._bayesian(entry)
+                        for webtoon_id, entry in stats.items()
+                        if entry.review_count >= self._min_reviews
+                    }
+                ),
+                "reviews": RankedIds.from_scores(
+                    {
+                        webtoon_id: entry.review_count
+                        for webtoon_id, entry in stats.items()
+                        if entry.review_count
+                    }
+                ),
+                "recent": RankedIds.from_scores(
+                    {
+                        webtoon_id: entry.recent_count
+                        for webtoon_id, entry in stats.items()
+                        if entry.recent_count
+                    }
+                ),
+            }
+            self._loaded = True
+        logger.info(
+            "Reconciled leaderboard (%d titles, %d recent reviews) in %.1f ms",
+            len(stats),
+            len(events),
+            (time.perf_counter() - started) * 1000,
+        )
+
+    def record_review(self, webtoon_id: str, rating: float, created_at: Optional[float] = None) -> None:
+        """Account a newly committed review."""
+
+        if not self._loaded:
+            return
+        with self._lock:
+            entry = self._stats.setdefault(webtoon_id, _TitleStats())
+            entry.rating_sum += to_rating_points(rating)
+            entry.review_count += 1
+            entry.recent_count += 1
+            self._recent_events.append((time.time() if created_at is None else created_at, webtoon_id))
+            self._reposition(webtoon_id, entry)
+
+    def record_rating_change(self, webtoon_id: str, previous_rating: float, new_rating: float) -> None:
+        """Account an edited rating (review count and recency are unchanged)."""
+
+        if not self._loaded:
+            return
+        with self._lock:
+            entry = self._stats.get(webtoon_id)
+            if entry is None:
+                return
+            entry.rating_sum += to_rating_points(new_rating) - to_rating_points(previous_rating)
+            self._reposition(webtoon_id, entry)
+
+    def top(self, ranking: Ranking, *, limit: int, offset: int = 0) -> list[LeaderboardEntry]:
+        self._ensure_loaded()
+        with self._lock:
+            self._expire(time.time())
+            entries = []
+            for position, (webtoon_id, score) in enumerate(
+                self._rankings[ranking].page(offset, limit), start=offset + 1
+            ):
+                entry = self._stats[webtoon_id]
+                entries.append(
+                    LeaderboardEntry(
+                        rank=position,
+                        webtoon_id=webtoon_id,
+                        score=score,
+                        average_rating=entry.rating_sum / RATING_SCALE / entry.review_count
+                        if entry.review_count
+                        else 0.0,
+                        bayesian_rating=self._bayesian(entry),
+                        review_count=entry.review_count,
+                        recent_review_count=entry.recent_count,
+                    )
+                )
+            return entries
+
+    def total(self, ranking: Ranking) -> int:
+        self._ensure_loaded()
+        with self._lock:
+            return len(self._rankings[ranking])
+
+    def _ensure_loaded(self) -> None:
+        if not self._loaded:
+            with self._load_lock:
+                if not self._loaded:
+                    self.reconcile()
+
+    def _bayesian(self, entry: _TitleStats) -> float:
+        return (
+            self._prior_weight * self._prior_mean + entry.rating_sum / RATING_SCALE
+        ) / (self._prior_weight + entry.review_count)
+
+    def _reposition(self, webtoon_id: str, entry: _TitleStats) -> None:
+        if entry.review_count >= self._min_reviews:
+            self._rankings["rating"].set(webtoon_id, self._bayesian(entry))
+        else:
+            self._rankings["rating"].discard(webtoon_id)
+        if entry.review_count:
+            self._rankings["reviews"].set(webtoon_id, entry.review_count)
+        if entry.recent_count:
+            self._rankings["recent"].set(webtoon_id, entry.recent_count)
+        else:
+            self._rankings["recent"].discard(webtoon_id)
+
+    def _expire(self, now: float) -> None:
+        cutoff = now - self._window
+        events = self._recent_events
+        while events and events[0][0] < cutoff:
+            _, webtoon_id = events.popleft()
+            entry = self._stats.get(webtoon_id)
+            if entry is not None and entry.recent_count:
+                entry.recent_count -= 1
+                self._reposition(webtoon_id, entry)
+
+
+leaderboard = Leaderboard()
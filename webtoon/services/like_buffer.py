@@ -0,0 +1,219 @@
+"""Optional group-commit buffer for review likes."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future, InvalidStateError, TimeoutError as FutureTimeoutError
+from typing import Callable, Final, Optional, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy.orm import Session
+
+from webtoon.db.session import new_write_session
+from webtoon.services.review_service import ReviewService
+
+logger = logging.getLogger(__name__)
+
+LIKE_BUFFER_ENABLED: Final[bool] = os.getenv("WEBTOON_LIKE_BUFFER", "0") == "1"
+LIKE_FLUSH_INTERVAL_MS: Final[float] = float(os.getenv("WEBTOON_LIKE_FLUSH_MS", "20"))
+LIKE_FLUSH_MAX_EVENTS: Final[int] = int(os.getenv("WEBTOON_LIKE_FLUSH_MAX", "500"))
+LIKE_RESULT_TIMEOUT: Final[float] = float(os.getenv("WEBTOON_LIKE_RESULT_TIMEOUT", "10"))
+
+
+def like_result_timeout(timeout: float = LIKE_RESULT_TIMEOUT) -> HTTPException:
+    """503 for a like whose batch did not commit within ``timeout``; it may still be applied."""
+
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="좋아요 처리가 지연되고 있습니다. 잠시 후 다시 시도해 주세요.",
+        headers={"Retry-After": str(max(1, math.ceil(timeout)))},
+    )
+
+
+_LikeEvent = Tuple[Tuple[int, str], "Future[int]"]
+_STOP: Final = object()
+
+
+class LikeBuffer:
+    """Coalesces like events and flushes them in a single transaction.
+
+    Callers block on a future until the batch containing their like has been
+    committed, so responses (including 400/404 outcomes) stay exact while the
+    write lock is taken once per ``flush_interval_ms`` or ``max_events`` likes
+    instead of once per like.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = new_write_session,
+        *,
+        flush_interval_ms: float = LIKE_FLUSH_INTERVAL_MS,
+        max_events: int = LIKE_FLUSH_MAX_EVENTS,
+    ) -> None:
+        self._session_factory = session_factory
+        self._flush_interval = flush_interval_ms / 1000
+        self._max_events = max_events
+        self._queue: "queue.Queue[object]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._thread = threading.Thread(target=self._run, name="like-buffer", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Flush pending likes and stop the background thread."""
+
+        if not self.running:
+            return
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._thread = None
+
+    def like(
+        self,
+        *,
+        review_id: int,
+        anonymous_user_id: str,
+        timeout: float = LIKE_RESULT_TIMEOUT,
+    ) -> int:
+        """Queue a like and wait for the flush that applies it.
+
+        Raises ``503`` with ``Retry-After`` when the flusher falls more than
+        ``timeout`` seconds behind.
+        """
+
+        future = self.submit(review_id=review_id, anonymous_user_id=anonymous_user_id)
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            raise like_result_timeout(timeout) from None
+
+    async def like_async(
+        self,
+        *,
+        review_id: int,
+        anonymous_user_id: str,
+        timeout: float = LIKE_RESULT_TIMEOUT,
+    ) -> int:
+        """Awaitable :meth:`like` for handlers running on the event loop.
+
+        The flush result is handed to the loop with ``call_soon_threadsafe``,
+        so a waiter cancelled by the timeout is only ever touched on the loop
+        thread and the flusher never sees a cancelled future.
+        """
+
+        loop = asyncio.get_running_loop()
+        waiter: "asyncio.Future[int]" = loop.create_future()
+
+        def hand_over(done: "Future[int]") -> None:
+            try:
+                loop.call_soon_threadsafe(_copy_outcome, done, waiter)
+            except RuntimeError:  # the loop closed after the caller gave up
+                pass
+
+        self.submit(review_id=review_id, anonymous_user_id=anonymous_user_id).add_done_callback(hand_over)
+        try:
+            return await asyncio.wait_for(waiter, timeout)
+        except asyncio.TimeoutError:
+            raise like_result_timeout(timeout) from None
+
+    def submit(self, *, review_id: int, anonymous_user_id: str) -> "Future[int]":
+        """Queue a like and return the future resolved by its flush."""
+
+        if not self.running:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="좋아요 처리기가 실행 중이 아닙니다.",
+            )
+        future: "Future[int]" = Future()
+        self._queue.put(((review_id, anonymous_user_id), future))
+        return future
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            first = self._queue.get()
+            if first is _STOP:
+                break
+
+            batch: list[_LikeEvent] = [first]
+            deadline = time.monotonic() + self._flush_interval
+            while len(batch) < self._max_events:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    event = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if event is _STOP:
+                    stopping = True
+                    break
+                batch.append(event)
+
+            self._flush(batch)
+
+        # Drain whatever arrived before stop() so no caller is left waiting.
+        leftovers: list[_LikeEvent] = []
+        while True:
+            try:
+                event = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if event is not _STOP:
+                leftovers.append(event)
+        if leftovers:
+            self._flush(leftovers)
+
+    def _flush(self, batch: list[_LikeEvent]) -> None:
+        db = self._session_factory()
+        try:
+            results = ReviewService(db).like_reviews_batch([pair for pair, _ in batch])
+        except Exception as exc:
+            logger.exception("Failed to flush %d buffered likes", len(batch))
+            for _, future in batch:
+                _resolve(future, exc)
+            return
+        finally:
+            db.close()
+
+        for (_, future), result in zip(batch, results):
+            _resolve(future, result)
+
+
+def _resolve(future: "Future[int]", result: object) -> None:
+    # A caller may have cancelled its future; setting it would raise and strand
+    # the rest of the batch. set_* checks the state under the future's own lock.
+    try:
+        if isinstance(result, BaseException):
+            future.set_exception(result)
+        else:
+            future.set_result(result)
+    except InvalidStateError:
+        pass
+
+
+def _copy_outcome(source: "Future[int]", waiter: "asyncio.Future[int]") -> None:
+    # Runs on the event loop thread, where wait_for may already have cancelled the waiter.
+    if waiter.done():
+        return
+    exc = source.exception()
+    if exc is not None:
+        waiter.set_exception(exc)
+    else:
+        waiter.set_result(source.result())
+
+
+like_buffer = LikeBuffer()
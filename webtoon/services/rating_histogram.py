@@ -0,0 +1,55 @@
+"""Vectorized half-star histogram rebuild (NumPy).
+
+Imported lazily by ``ReviewService.rebuild_rating_histograms`` so the API
+process never pays for importing NumPy.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Sequence
+
+import numpy as np
+
+from webtoon.models.webtoon_rating_stats import RATING_BUCKET_POINTS, RATING_BUCKETS, RATING_SCALE
+
+
+def count_buckets(partitions: Iterable[Sequence[tuple[str, float]]]) -> tuple[list[str], np.ndarray]:
+    """Count ``(webtoon_id, rating)`` rows per webtoon and bucket in one pass.
+
+    Returns the distinct webtoon ids (sorted) and a ``len(ids) x RATING_BUCKETS``
+    count matrix. Buckets round to the nearest half star like
+    ``to_rating_bucket`` (``np.rint`` rounds half to even, as ``round`` does).
+    """
+
+    id_parts: list[np.ndarray] = []
+    rating_parts: list[np.ndarray] = []
+    for rows in partitions:
+        if not rows:
+            continue
+        ids, ratings = zip(*rows)
+        id_parts.append(np.array(ids))
+        rating_parts.append(np.fromiter(ratings, dtype=np.float64, count=len(ratings)))
+    if not id_parts:
+        return [], np.zeros((0, RATING_BUCKETS), dtype=np.int64)
+
+    webtoons, inverse = np.unique(np.concatenate(id_parts), return_inverse=True)
+    points = np.rint(np.concatenate(rating_parts) * RATING_SCALE).astype(np.int64)
+    buckets = np.clip(
+        (points + RATING_BUCKET_POINTS // 2) // RATING_BUCKET_POINTS, 0, RATING_BUCKETS - 1
+    )
+    counts = np.bincount(
+        inverse.ravel() * RATING_BUCKETS + buckets, minlength=len(webtoons) * RATING_BUCKETS
+    )
+    return webtoons.tolist(), counts.reshape(len(webtoons), RATING_BUCKETS)
+
+
+def bucket_rows(webtoons: Sequence[str], counts: np.ndarray) -> list[dict]:
+    """Insert parameters for every non-empty cell of a ``count_buckets`` matrix."""
+
+    rows, buckets = np.nonzero(counts)
+    return [
+        {"webtoon_id": webtoons[row], "bucket": bucket, "review_count": count}
+        for row, bucket, count in zip(
+            rows.tolist(), buckets.tolist(), counts[rows, buckets].tolist()
+        )
+    ]
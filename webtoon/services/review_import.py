@@ -0,0 +1,247 @@
+"""Bulk review ingestion from CSV/NDJSON files (legacy migrations, seeding)."""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Final, Iterator, Literal, Optional
+
+import pandas as pd
+from sqlalchemy import bindparam, text
+from sqlalchemy.orm import Session
+
+from webtoon.models.webtoon_rating_stats import RATING_PRECISION_TOLERANCE, RATING_SCALE
+from webtoon.services.review_service import ReviewService
+
+logger = logging.getLogger(__name__)
+
+ImportFormat = Literal["csv", "ndjson"]
+
+REQUIRED_COLUMNS: Final[tuple[str, ...]] = (
+    "webtoon_id",
+    "anonymous_user_id",
+    "content",
+    "rating",
+)
+DEFAULT_CHUNK_SIZE: Final[int] = 5000
+# Keeps each (webtoon_id, anonymous_user_id) lookup under SQLite's variable limit.
+_PAIR_LOOKUP_BATCH: Final[int] = 400
+
+# Plain-text INSERT so timestamps keep the CURRENT_TIMESTAMP text format and the
+# driver runs a single executemany per chunk.
+_INSERT_REVIEW = text(
+    """
+    INSERT INTO reviews (
+        webtoon_id, anonymous_user_id, content, rating, likes, hot_score, created_at, updated_at
+    ) VALUES (
+        :webtoon_id, :anonymous_user_id, :content, :rating, :likes,
+        hot_score(:likes, :created_at, :now), :created_at, :updated_at
+    )
+    """
+)
+
+
+@dataclass
+class ImportReport:
+    """Counts collected while importing a file."""
+
+    read: int = 0
+    inserted: int = 0
+    invalid: int = 0
+    unknown_webtoon: int = 0
+    duplicate: int = 0
+    affected_webtoons: set[str] = field(default_factory=set)
+
+    def as_dict(self) -> dict[str, int]:
+        return {
+            "read": self.read,
+            "inserted": self.inserted,
+            "invalid": self.invalid,
+            "unknown_webtoon": self.unknown_webtoon,
+            "duplicate": self.duplicate,
+            "affected_webtoons": len(self.affected_webtoons),
+        }
+
+
+def _has_rating_precision(ratings: pd.Series) -> pd.Series:
+    """Vectorized ``has_rating_precision``: at most two decimals, as the API accepts."""
+
+    points = ratings * RATING_SCALE
+    return (points - points.round()).abs() <= RATING_PRECISION_TOLERANCE
+
+
+def detect_format(path: str) -> ImportFormat:
+    extension = os.path.splitext(path)[1].lower()
+    return "ndjson" if extension in (".ndjson", ".jsonl", ".json") else "csv"
+
+
+def read_chunks(path: str, fmt: ImportFormat, chunk_size: int) -> Iterator[pd.DataFrame]:
+    """Yield the input file as DataFrames of at most ``chunk_size`` rows."""
+
+    if fmt == "csv":
+        yield from pd.read_csv(
+            path,
+            chunksize=chunk_size,
+            dtype=str,
+            keep_default_na=False,
+        )
+    else:
+        yield from pd.read_json(path, lines=True, chunksize=chunk_size, dtype=False)
+
+
+class ReviewImporter:
+    """Validates and inserts reviews in chunks, then rebuilds affected stats.
+
+    Optional ``created_at``/``likes`` columns default to "now" and ``0`` when
+    blank; a value that does not parse makes the row invalid.
+
+    Each chunk is validated with vectorized pandas operations, checked against
+    the catalog with a single ``IN`` query, de-duplicated on
+    ``(webtoon_id, anonymous_user_id)`` (within the file and against existing
+    rows), and written with one ``executemany`` inside its own transaction.
+    """
+
+    def __init__(self, db: Session, *, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        self._db = db
+        self._chunk_size = chunk_size
+        self._seen_pairs: set[tuple[str, str]] = set()
+
+    def import_file(
+        self,
+        path: str,
+        fmt: Optional[ImportFormat] = None,
+        *,
+        dry_run: bool = False,
+    ) -> ImportReport:
+        report = ImportReport()
+        for chunk in read_chunks(path, fmt or detect_format(path), self._chunk_size):
+            self._import_chunk(chunk, report, dry_run=dry_run)
+            logger.info("Imported %d/%d rows so far", report.inserted, report.read)
+
+        if report.affected_webtoons and not dry_run:
+            service = ReviewService(self._db)
+            service.rebuild_rating_stats(report.affected_webtoons)
+            service.rebuild_rating_histograms(report.affected_webtoons)
+        return report
+
+    def _import_chunk(self, chunk: pd.DataFrame, report: ImportReport, *, dry_run: bool) -> None:
+        missing = [column for column in REQUIRED_COLUMNS if column not in chunk.columns]
+        if missing:
+            raise ValueError(f"Missing required columns: {', '.join(missing)}")
+
+        report.read += len(chunk)
+        frame = self._validate(chunk)
+        report.invalid += len(chunk) - len(frame)
+
+        known = self._existing_webtoon_ids(frame["webtoon_id"].unique().tolist())
+        in_catalog = frame["webtoon_id"].isin(known)
+        report.unknown_webtoon += int((~in_catalog).sum())
+        frame = frame[in_catalog]
+
+        before = len(frame)
+        frame = frame.drop_duplicates(subset=["webtoon_id", "anonymous_user_id"], keep="first")
+        pairs = list(zip(frame["webtoon_id"], frame["anonymous_user_id"]))
+        taken = self._seen_pairs.union(self._existing_pairs(pairs))
+        keep = [pair not in taken for pair in pairs]
+        frame = frame[keep]
+        report.duplicate += before - len(frame)
+
+        if frame.empty:
+            return
+
+        rows = frame.to_dict("records")
+        now = time.time()
+        for row in rows:
+            row["now"] = now
+        if not dry_run:
+            try:
+                self._db.execute(_INSERT_REVIEW, rows)
+                self._db.commit()
+            except Exception:
+                self._db.rollback()
+                raise
+
+        self._seen_pairs.update(zip(frame["webtoon_id"], frame["anonymous_user_id"]))
+        report.inserted += len(rows)
+        report.affected_webtoons.update(frame["webtoon_id"].unique().tolist())
+
+    @staticmethod
+    def _validate(chunk: pd.DataFrame) -> pd.DataFrame:
+        frame = pd.DataFrame(
+            {
+                "webtoon_id": chunk["webtoon_id"].astype(str).str.strip(),
+                "anonymous_user_id": chunk["anonymous_user_id"].astype(str).str.strip(),
+                "content": chunk["content"].astype(str),
+                "rating": pd.to_numeric(chunk["rating"], errors="coerce"),
+            }
+        )
+        present = chunk[list(REQUIRED_COLUMNS)].notna().all(axis=1)
+
+        if "likes" in chunk.columns:
+            raw_likes = chunk["likes"]
+            blank = raw_likes.isna() | (raw_likes.astype(str).str.strip() == "")
+            likes = pd.to_numeric(raw_likes, errors="coerce").mask(blank, 0)
+        else:
+            likes = pd.Series(0, index=chunk.index)
+        frame["likes"] = likes
+
+        now = pd.Timestamp.now(tz="UTC").tz_localize(None)
+        if "created_at" in chunk.columns:
+            raw_created = chunk["created_at"]
+            blank = raw_created.isna() | (raw_created.astype(str).str.strip() == "")
+            created = pd.to_datetime(raw_created.mask(blank), errors="coerce", utc=True, format="mixed")
+            created = created.dt.tz_localize(None)
+            # Only a missing timestamp means "now"; one that does not parse is a bad row.
+            parsed = blank | created.notna()
+            created = created.fillna(now)
+        else:
+            created = pd.Series(now, index=chunk.index)
+            parsed = pd.Series(True, index=chunk.index)
+        # Same text format as CURRENT_TIMESTAMP so keyset cursors compare correctly.
+        frame["created_at"] = created.dt.strftime("%Y-%m-%d %H:%M:%S")
+        frame["updated_at"] = frame["created_at"]
+
+        valid = (
+            present
+            & parsed
+            & (frame["webtoon_id"].str.len() > 0)
+            & frame["anonymous_user_id"].str.len().between(1, 36)
+            & frame["content"].str.len().between(1, 2000)
+            & frame["rating"].between(0, 5)
+            & _has_rating_precision(frame["rating"])
+            & frame["likes"].notna()
+            & (frame["likes"] >= 0)
+        )
+        frame = frame[valid].copy()
+        frame["likes"] = frame["likes"].astype(int)
+        frame["rating"] = frame["rating"].astype(float)
+        return frame
+
+    def _existing_webtoon_ids(self, webtoon_ids: list[str]) -> set[str]:
+        if not webtoon_ids:
+            return set()
+        stmt = text("SELECT id FROM normalized_webtoon WHERE id IN :ids").bindparams(
+            bindparam("ids", expanding=True)
+        )
+        return set(self._db.execute(stmt, {"ids": webtoon_ids}).scalars())
+
+    def _existing_pairs(self, pairs: list[tuple[str, str]]) -> set[tuple[str, str]]:
+        found: set[tuple[str, str]] = set()
+        for start in range(0, len(pairs), _PAIR_LOOKUP_BATCH):
+            batch = pairs[start : start + _PAIR_LOOKUP_BATCH]
+            values = ", ".join(f"(:w{i}, :u{i})" for i in range(len(batch)))
+            params: dict[str, str] = {}
+            for i, (webtoon_id, user_id) in enumerate(batch):
+                params[f"w{i}"] = webtoon_id
+                params[f"u{i}"] = user_id
+            rows = self._db.execute(
+                text(
+                    "SELECT webtoon_id, anonymous_user_id FROM reviews "
+                    f"WHERE (webtoon_id, anonymous_user_id) IN (VALUES {values})"
+                ),
+                params,
+            )
+            found.update((row[0], row[1]) for row in rows)
+        return found
@@ -2,23 +2,259 @@
 
 from __future__ import annotations
 
-from typing import Final, Tuple
+from collections import Counter
+import time
+from typing import Final, Iterable, Iterator, Literal, Optional, Sequence, Tuple, Union
 
 from fastapi import HTTPException, status
-from sqlalchemy import text
-from sqlalchemy.orm import Session
-
-from webtoon.models import Review, ReviewLike, WebtoonRatingStats
+from sqlalchemy import (
+    Insert,
+    Row,
+    Select,
+    String,
+    TextClause,
+    Update,
+    bindparam,
+    delete,
+    exists,
+    func,
+    literal,
+    select,
+    text,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import InstrumentedAttribute, Session
+
+from webtoon.models import Review, ReviewLike, WebtoonRatingBucket, WebtoonRatingStats
+from webtoon.models.webtoon_rating_stats import (
+    RATING_BUCKETS,
+    RATING_SCALE,
+    to_rating_bucket,
+    to_rating_points,
+)
+from webtoon.pagination import (
+    cursor_float,
+    cursor_int,
+    cursor_timestamp,
+    decode_cursor,
+    encode_cursor,
+    invalid_cursor,
+)
 from webtoon.schemas.review import ReviewCreate, ReviewUpdate
+from webtoon.services.leaderboard import leaderboard
 
 
-class ReviewService:
-    """Coordinates review persistence and rating aggregation."""
+ReviewSort = Literal["recent", "likes", "hot"]
+
+_SORT_KEYS: Final[dict[str, InstrumentedAttribute]] = {
+    "recent": Review.created_at,
+    "likes": Review.likes,
+    "hot": Review.hot_score,
+}
+
+HISTOGRAM_REBUILD_BATCH: Final[int] = 50_000
+
+_WEBTOON_EXISTS_QUERY: Final[str] = (
+    "SELECT 1 FROM normalized_webtoon WHERE id = :webtoon_id LIMIT 1"
+)
+
+
+_HOT_BATCH_QUERY = text(
+    """
+    SELECT created_at, id FROM reviews
+    WHERE created_at >= :since AND (created_at, id) > (:after_created_at, :after_id)
+    ORDER BY created_at, id
+    LIMIT :limit
+    """
+)
+_HOT_REFRESH_UPDATE = text(
+    "UPDATE reviews SET hot_score = hot_score(likes, created_at, :now) WHERE id IN :ids"
+).bindparams(bindparam("ids", expanding=True))
 
-    _WEBTOON_EXISTS_QUERY: Final[str] = (
-        "SELECT 1 FROM normalized_webtoon WHERE id = :webtoon_id LIMIT 1"
+
+# Statement builders and errors shared by ReviewService and AsyncReviewService.
+
+
+def webtoon_exists_statement(webtoon_id: str) -> TextClause:
+    return text(_WEBTOON_EXISTS_QUERY).bindparams(webtoon_id=webtoon_id)
+
+
+def own_review_statement(webtoon_id: str, anonymous_user_id: str) -> Select:
+    # At most one row thanks to the unique (webtoon_id, anonymous_user_id) index.
+    return select(Review).where(
+        Review.webtoon_id == webtoon_id,
+        Review.anonymous_user_id == anonymous_user_id,
     )
 
+
+def is_duplicate_review(exc: IntegrityError) -> bool:
+    """Whether ``exc`` comes from the unique (webtoon_id, anonymous_user_id) index."""
+
+    message = str(exc.orig)
+    return "UNIQUE" in message and "reviews.anonymous_user_id" in message
+
+
+def review_page_statement(
+    *,
+    webtoon_id: str,
+    page: int,
+    limit: int,
+    cursor: Optional[str],
+    sort: ReviewSort = "recent",
+) -> Select:
+    """Select ``limit + 1`` reviews so the caller can tell whether a next page exists.
+
+    Every sort has a matching ``(webtoon_id, <key> DESC, id DESC)`` index, so
+    pages are read in index order without a sort step.
+    """
+
+    key = _SORT_KEYS[sort]
+    stmt = (
+        select(Review)
+        .where(Review.webtoon_id == webtoon_id)
+        .order_by(key.desc(), Review.id.desc())
+    )
+    if cursor is not None:
+        if sort == "recent":
+            created_at, review_id = decode_cursor(cursor, 2)
+            # created_at is compared as the raw stored text so the seek can use
+            # the (webtoon_id, created_at, id) index.
+            value = literal(cursor_timestamp(created_at), String())
+        else:
+            cursor_sort, value, review_id = decode_cursor(cursor, 3)
+            if cursor_sort != sort:
+                raise invalid_cursor()
+            value = cursor_int(value) if sort == "likes" else cursor_float(value)
+        stmt = stmt.where(tuple_(key, Review.id) < tuple_(value, literal(cursor_int(review_id))))
+    else:
+        stmt = stmt.offset((page - 1) * limit)
+    return stmt.limit(limit + 1)
+
+
+def split_review_page(
+    rows: Sequence[Review], limit: int, sort: ReviewSort = "recent"
+) -> Tuple[list[Review], Optional[str]]:
+    """Trim the look-ahead row and build the cursor for the next page."""
+
+    reviews = list(rows[:limit])
+    next_cursor = None
+    if len(rows) > limit:
+        last = reviews[-1]
+        if sort == "recent":
+            next_cursor = encode_cursor(str(last.created_at), last.id)
+        else:
+            next_cursor = encode_cursor(sort, getattr(last, _SORT_KEYS[sort].key), last.id)
+    return reviews, next_cursor
+
+
+def stats_increment_statement(webtoon_id: str, rating: float) -> Insert:
+    points = to_rating_points(rating)
+    return (
+        sqlite_insert(WebtoonRatingStats)
+        .values(webtoon_id=webtoon_id, rating_sum=points, review_count=1)
+        .on_conflict_do_update(
+            index_elements=[WebtoonRatingStats.webtoon_id],
+            set_={
+                "rating_sum": WebtoonRatingStats.rating_sum + points,
+                "review_count": WebtoonRatingStats.review_count + 1,
+                "updated_at": func.current_timestamp(),
+            },
+        )
+    )
+
+
+def bucket_increment_statement(webtoon_id: str, rating: float) -> Insert:
+    return (
+        sqlite_insert(WebtoonRatingBucket)
+        .values(webtoon_id=webtoon_id, bucket=to_rating_bucket(rating), review_count=1)
+        .on_conflict_do_update(
+            index_elements=[WebtoonRatingBucket.webtoon_id, WebtoonRatingBucket.bucket],
+            set_={"review_count": WebtoonRatingBucket.review_count + 1},
+        )
+    )
+
+
+def histogram_statement(webtoon_id: str) -> Select:
+    return select(WebtoonRatingBucket.bucket, WebtoonRatingBucket.review_count).where(
+        WebtoonRatingBucket.webtoon_id == webtoon_id
+    )
+
+
+def like_insert_statement(review_id: int, anonymous_user_id: str) -> Insert:
+    """Insert the like only if the review exists and it was not liked before."""
+
+    return (
+        sqlite_insert(ReviewLike)
+        .from_select(
+            ["review_id", "anonymous_user_id"],
+            select(literal(review_id), literal(anonymous_user_id)).where(
+                exists().where(Review.id == review_id)
+            ),
+        )
+        .on_conflict_do_nothing()
+    )
+
+
+def like_increment_statement(review_id: int) -> Update:
+    return (
+        update(Review)
+        .where(Review.id == review_id)
+        .values(
+            likes=Review.likes + 1,
+            hot_score=func.hot_score(Review.likes + 1, Review.created_at, time.time()),
+        )
+        .returning(Review.likes)
+    )
+
+
+def webtoon_not_found() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="해당 웹툰을 찾을 수 없습니다.",
+    )
+
+
+def reviews_not_found() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="해당 웹툰에 대한 리뷰가 존재하지 않습니다.",
+    )
+
+
+def review_already_exists() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail="이미 해당 웹툰에 대한 리뷰를 작성했습니다.",
+    )
+
+
+def not_review_owner() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail="You can only update your own review",
+    )
+
+
+def review_not_found() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="존재하지 않는 리뷰입니다.",
+    )
+
+
+def review_already_liked() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="이미 좋아요를 누른 사용자입니다.",
+    )
+
+
+class ReviewService:
+    """Coordinates review persistence and rating aggregation."""
+
     def __init__(self, db: Session) -> None:
         self._db = db
 
@@ -31,20 +267,6 @@ class ReviewService:
     ) -> Review:
         self._ensure_webtoon_exists(webtoon_id)
 
-        has_existing = (
-            self._db.query(Review.id)
-            .filter(
-                Review.webtoon_id == webtoon_id,
-                Review.anonymous_user_id == anonymous_user_id,
-            )
-            .first()
-        )
-        if has_existing:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="이미 해당 웹툰에 대한 리뷰를 작성했습니다.",
-            )
-
         review = Review(
             webtoon_id=webtoon_id,
             content=payload.content,
@@ -52,9 +274,16 @@ class ReviewService:
             anonymous_user_id=anonymous_user_id,
         )
         self._db.add(review)
-        self._db.flush()
+        try:
+            self._db.flush()
+        except IntegrityError as exc:
+            self._db.rollback()
+            if is_duplicate_review(exc):
+                raise review_already_exists() from None
+            raise
 
-        self._update_rating_stats(webtoon_id, payload.rating)
+        self._db.execute(stats_increment_statement(webtoon_id, payload.rating))
+        self._db.execute(bucket_increment_statement(webtoon_id, payload.rating))
 
         try:
             self._db.commit()
@@ -62,6 +291,7 @@ class ReviewService:
             self._db.rollback()
             raise
 
+        leaderboard.record_review(webtoon_id, payload.rating)
         self._db.refresh(review)
         return review
 
@@ -71,24 +301,54 @@ class ReviewService:
         webtoon_id: str,
         page: int,
         limit: int,
-    ) -> Tuple[WebtoonRatingStats, list[Review]]:
+        cursor: Optional[str] = None,
+        sort: ReviewSort = "recent",
+    ) -> Tuple[WebtoonRatingStats, list[Review], Optional[str]]:
+        """Return a page of reviews and the cursor for the next one.
+
+        ``sort`` orders by ``created_at`` (newest first), ``likes`` or the
+        time-decayed ``hot_score``, ties broken by id. When ``cursor`` is given
+        the page is located with a keyset seek on ``(<sort key>, id)`` and
+        ``page`` is ignored.
+        """
+
         stats = self._db.get(WebtoonRatingStats, webtoon_id)
         if stats is None or stats.review_count == 0:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="해당 웹툰에 대한 리뷰가 존재하지 않습니다.",
-            )
+            raise reviews_not_found()
 
-        offset = (page - 1) * limit
-        reviews = (
-            self._db.query(Review)
-            .filter(Review.webtoon_id == webtoon_id)
-            .order_by(Review.created_at.desc())
-            .offset(offset)
-            .limit(limit)
-            .all()
+        rows = self._db.scalars(
+            review_page_statement(
+                webtoon_id=webtoon_id, page=page, limit=limit, cursor=cursor, sort=sort
+            )
+        ).all()
+        reviews, next_cursor = split_review_page(rows, limit, sort)
+        return stats, reviews, next_cursor
+
+    def iter_reviews(self, *, webtoon_id: str, batch_size: int = 1000) -> Iterator[Row]:
+        """Yield every review of a webtoon as plain rows, ``batch_size`` at a time.
+
+        Rows are fetched incrementally through ``yield_per`` without building ORM
+        objects, so memory stays flat regardless of the review count. The
+        author's ``anonymous_user_id`` is not selected: it is the cookie that
+        authorizes editing the review.
+        """
+
+        result = self._db.execute(
+            select(
+                Review.id,
+                Review.webtoon_id,
+                Review.content,
+                Review.rating,
+                Review.likes,
+                Review.created_at,
+                Review.updated_at,
+            )
+            .where(Review.webtoon_id == webtoon_id)
+            .order_by(Review.id)
+            .execution_options(yield_per=batch_size)
         )
-        return stats, reviews
+        for partition in result.partitions():
+            yield from partition
 
     def update_review(
         self,
@@ -99,103 +359,271 @@ class ReviewService:
     ) -> Review:
         self._ensure_webtoon_exists(webtoon_id)
 
-        review = (
-            self._db.query(Review)
-            .filter(
-                Review.webtoon_id == webtoon_id,
-                Review.anonymous_user_id == anonymous_user_id,
-            )
-            .order_by(Review.created_at.desc())
-            .first()
-        )
+        review = self._db.scalars(
+            own_review_statement(webtoon_id, anonymous_user_id)
+        ).first()
         if review is None:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="You can only update your own review",
-            )
+            raise not_review_owner()
 
+        # rating_sum and the histogram follow in the reviews_rating_au trigger,
+        # which reads the old rating inside the UPDATE; this copy only feeds
+        # the (periodically reconciled) leaderboard.
         previous_rating = review.rating
         review.content = payload.content
         review.rating = payload.rating
 
-        self._recalculate_rating_stats(webtoon_id, previous_rating, payload.rating)
-
         try:
             self._db.commit()
         except Exception:
             self._db.rollback()
             raise
 
+        leaderboard.record_rating_change(webtoon_id, previous_rating, payload.rating)
         self._db.refresh(review)
         return review
 
-    def _ensure_webtoon_exists(self, webtoon_id: str) -> None:
-        exists = self._db.execute(
-            text(self._WEBTOON_EXISTS_QUERY), {"webtoon_id": webtoon_id}
-        ).scalar()
-        if not exists:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="해당 웹툰을 찾을 수 없습니다.",
-            )
+    def rating_histogram(
+        self, *, webtoon_id: str
+    ) -> Tuple[Optional[WebtoonRatingStats], list[int]]:
+        """Return the rating stats (``None`` without reviews) and per-bucket review counts."""
 
-    def _update_rating_stats(self, webtoon_id: str, new_rating: float) -> None:
         stats = self._db.get(WebtoonRatingStats, webtoon_id)
-
         if stats is None:
-            stats = WebtoonRatingStats(
-                webtoon_id=webtoon_id,
-                average_rating=new_rating,
-                review_count=1,
-            )
-            self._db.add(stats)
-            return
+            self._ensure_webtoon_exists(webtoon_id)
+        counts = [0] * RATING_BUCKETS
+        for bucket, review_count in self._db.execute(histogram_statement(webtoon_id)):
+            counts[bucket] = review_count
+        return stats, counts
 
-        total = stats.average_rating * stats.review_count + new_rating
-        stats.review_count += 1
-        stats.average_rating = total / stats.review_count
+    def _ensure_webtoon_exists(self, webtoon_id: str) -> None:
+        if not self._db.execute(webtoon_exists_statement(webtoon_id)).scalar():
+            raise webtoon_not_found()
+
+    def rebuild_rating_stats(self, webtoon_ids: Optional[Iterable[str]] = None) -> int:
+        """Recompute stats from ``reviews`` in one GROUP BY pass and commit.
+
+        Restricted to ``webtoon_ids`` when given; webtoons left without reviews
+        are reset to zero. Returns the number of webtoons that have reviews.
+        """
+
+        ids = None if webtoon_ids is None else sorted(set(webtoon_ids))
+        if ids is not None and not ids:
+            return 0
+        scope = "" if ids is None else "AND webtoon_id IN :webtoon_ids"
+        params = {} if ids is None else {"webtoon_ids": ids}
+
+        def statement(sql: str):
+            stmt = text(sql.format(scope=scope))
+            if ids is not None:
+                stmt = stmt.bindparams(bindparam("webtoon_ids", expanding=True))
+            return stmt
+
+        rebuilt = self._db.execute(
+            statement(
+                f"""
+                INSERT INTO webtoon_rating_stats (webtoon_id, rating_sum, review_count, updated_at)
+                SELECT
+                    webtoon_id,
+                    SUM(CAST(ROUND(rating * {RATING_SCALE}) AS INTEGER)),
+                    COUNT(*),
+                    CURRENT_TIMESTAMP
+                FROM reviews
+                WHERE 1 = 1 {{scope}}
+                GROUP BY webtoon_id
+                ON CONFLICT (webtoon_id) DO UPDATE SET
+                    rating_sum = excluded.rating_sum,
+                    review_count = excluded.review_count,
+                    updated_at = excluded.updated_at
+                """
+            ),
+            params,
+        ).rowcount
+        self._db.execute(
+            statement(
+                """
+                UPDATE webtoon_rating_stats
+                SET rating_sum = 0, review_count = 0, updated_at = CURRENT_TIMESTAMP
+                WHERE review_count > 0
+                  AND webtoon_id NOT IN (SELECT DISTINCT webtoon_id FROM reviews)
+                  {scope}
+                """
+            ),
+            params,
+        )
 
-    def _recalculate_rating_stats(
+        try:
+            self._db.commit()
+        except Exception:
+            self._db.rollback()
+            raise
+        return rebuilt
+
+    def rebuild_rating_histograms(
         self,
-        webtoon_id: str,
-        previous_rating: float,
-        new_rating: float,
-    ) -> None:
-        stats = self._db.get(WebtoonRatingStats, webtoon_id)
-        if stats is None or stats.review_count == 0:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="해당 웹툰에 대한 리뷰가 존재하지 않습니다.",
-            )
+        webtoon_ids: Optional[Iterable[str]] = None,
+        *,
+        batch_size: int = HISTOGRAM_REBUILD_BATCH,
+    ) -> int:
+        """Recompute ``webtoon_rating_buckets`` from ``reviews`` in one pass and commit.
+
+        Ratings are streamed ``batch_size`` rows at a time and bucketed with
+        NumPy (``np.unique`` + ``np.bincount``), then written with one
+        ``executemany``. Restricted to ``webtoon_ids`` when given. Returns the
+        number of webtoons that have reviews.
+        """
+
+        # NumPy is only needed by this maintenance job.
+        from webtoon.services.rating_histogram import bucket_rows, count_buckets
+
+        ids = None if webtoon_ids is None else sorted(set(webtoon_ids))
+        if ids is not None and not ids:
+            return 0
+
+        query = select(Review.webtoon_id, Review.rating)
+        clear = delete(WebtoonRatingBucket)
+        if ids is not None:
+            query = query.where(Review.webtoon_id.in_(ids))
+            clear = clear.where(WebtoonRatingBucket.webtoon_id.in_(ids))
+        result = self._db.execute(query.execution_options(yield_per=batch_size))
+        webtoons, counts = count_buckets(result.partitions())
+
+        self._db.execute(clear)
+        rows = bucket_rows(webtoons, counts)
+        if rows:
+            self._db.execute(sqlite_insert(WebtoonRatingBucket), rows)
 
-        total = stats.average_rating * stats.review_count - previous_rating + new_rating
-        stats.average_rating = total / stats.review_count
+        try:
+            self._db.commit()
+        except Exception:
+            self._db.rollback()
+            raise
+        return len(webtoons)
 
-    def like_review(self, *, review_id: int, anonymous_user_id: str) -> Review:
-        review = self._db.get(Review, review_id)
-        if review is None:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="존재하지 않는 리뷰입니다.",
-            )
+    def refresh_hot_scores(
+        self,
+        *,
+        since: Optional[str] = None,
+        batch_size: int = 2000,
+        now: Optional[float] = None,
+    ) -> int:
+        """Recompute ``hot_score`` for reviews created at or after ``since`` (all if ``None``).
+
+        Rows are walked in ``(created_at, id)`` keyset batches over
+        ``ix_reviews_created_at`` and each batch commits on its own, so the
+        write lock is only held for one batch at a time. Returns the number of
+        rows refreshed.
+        """
+
+        now = time.time() if now is None else now
+        after: Tuple[str, int] = ("", 0)
+        refreshed = 0
+        while True:
+            keys = self._db.execute(
+                _HOT_BATCH_QUERY,
+                {
+                    "since": since or "",
+                    "after_created_at": after[0],
+                    "after_id": after[1],
+                    "limit": batch_size,
+                },
+            ).all()
+            if not keys:
+                return refreshed
+            try:
+                self._db.execute(_HOT_REFRESH_UPDATE, {"now": now, "ids": [key.id for key in keys]})
+                self._db.commit()
+            except Exception:
+                self._db.rollback()
+                raise
+            refreshed += len(keys)
+            after = (keys[-1].created_at, keys[-1].id)
+
+    def like_review(self, *, review_id: int, anonymous_user_id: str) -> int:
+        """Record a like and return the review's new like count.
+
+        The happy path is two statements: an ``INSERT ... ON CONFLICT DO
+        NOTHING`` guarded by the review's existence, and an in-SQL increment.
+        """
+
+        inserted = self._db.execute(
+            like_insert_statement(review_id, anonymous_user_id)
+        ).rowcount
+
+        if not inserted:
+            self._db.rollback()
+            if self._db.get(Review, review_id) is None:
+                raise review_not_found()
+            raise review_already_liked()
 
-        already_liked = (
-            self._db.query(ReviewLike)
-            .filter(
-                ReviewLike.review_id == review_id,
-                ReviewLike.anonymous_user_id == anonymous_user_id,
-            )
-            .first()
+        likes = self._db.execute(like_increment_statement(review_id)).scalar_one()
+
+        try:
+            self._db.commit()
+        except Exception:
+            self._db.rollback()
+            raise
+
+        return likes
+
+    def like_reviews_batch(
+        self, likes: Sequence[Tuple[int, str]]
+    ) -> list[Union[int, HTTPException]]:
+        """Apply many likes in one transaction.
+
+        Returns, per input pair, either the review's like count after the batch
+        or the ``HTTPException`` the single-like path would have raised.
+        """
+
+        review_ids = {review_id for review_id, _ in likes}
+        existing = set(
+            self._db.scalars(select(Review.id).where(Review.id.in_(review_ids)))
         )
-        if already_liked:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="이미 좋아요를 누른 사용자입니다.",
-            )
 
-        like = ReviewLike(review_id=review_id, anonymous_user_id=anonymous_user_id)
-        self._db.add(like)
-        review.likes += 1
+        candidates = list(
+            dict.fromkeys(pair for pair in likes if pair[0] in existing)
+        )
+        inserted: set[Tuple[int, str]] = set()
+        if candidates:
+            inserted = {
+                (row.review_id, row.anonymous_user_id)
+                for row in self._db.execute(
+                    sqlite_insert(ReviewLike)
+                    .values(
+                        [
+                            {"review_id": review_id, "anonymous_user_id": user_id}
+                            for review_id, user_id in candidates
+                        ]
+                    )
+                    .on_conflict_do_nothing()
+                    .returning(ReviewLike.review_id, ReviewLike.anonymous_user_id)
+                )
+            }
+
+        increments = Counter(review_id for review_id, _ in inserted)
+        counts: dict[int, int] = {}
+        if increments:
+            reviews = Review.__table__
+            self._db.execute(
+                update(reviews)
+                .where(reviews.c.id == bindparam("target_id"))
+                .values(
+                    likes=reviews.c.likes + bindparam("delta"),
+                    hot_score=func.hot_score(
+                        reviews.c.likes + bindparam("delta"),
+                        reviews.c.created_at,
+                        time.time(),
+                    ),
+                ),
+                [
+                    {"target_id": review_id, "delta": delta}
+                    for review_id, delta in increments.items()
+                ],
+            )
+            counts = dict(
+                self._db.execute(
+                    select(Review.id, Review.likes).where(Review.id.in_(increments))
+                ).all()
+            )
 
         try:
             self._db.commit()
@@ -203,5 +631,14 @@ class ReviewService:
             self._db.rollback()
             raise
 
-        self._db.refresh(review)
-        return review
+        results: list[Union[int, HTTPException]] = []
+        for pair in likes:
+            if pair[0] not in existing:
+                results.append(review_not_found())
+            elif pair in inserted:
+                # The first occurrence of a pair succeeds; repeats are duplicates.
+                inserted.discard(pair)
+                results.append(counts[pair[0]])
+            else:
+                results.append(review_already_liked())
+        return results
@@ -0,0 +1,241 @@
+"""SQLite FTS5 index that backs the /search endpoint."""
+
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+from typing import Final, Literal
+
+logger = logging.getLogger(__name__)
+
+SearchMode = Literal["fts", "like"]
+
+FTS_TABLE: Final[str] = "normalized_webtoon_fts"
+# The trigram tokenizer cannot match terms shorter than three characters.
+MIN_FTS_QUERY_LENGTH: Final[int] = 3
+DEFAULT_SEARCH_MODE: SearchMode = (
+    "like" if os.getenv("WEBTOON_SEARCH_MODE", "fts").lower() == "like" else "fts"
+)
+
+# 색인 컬럼과 각 컬럼의 bm25 가중치 (id 는 "kakao_100" 같은 ID 검색용)
+FTS_COLUMNS: Final[tuple[str, ...]] = ("id", "title", "authors", "synopsis", "tags")
+_BM25_WEIGHTS: Final[str] = "1.0, 10.0, 5.0, 1.0, 3.0"
+
+_SELECT_COLUMNS: Final[str] = """
+    w.id,
+    w.thumbnail,
+    w.title,
+    w.updateDays,
+    w.authors,
+    w.synopsis,
+    w.tags
+"""
+
+_FTS_DDL: Final[str] = f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        {", ".join(FTS_COLUMNS)},
+        content='normalized_webtoon',
+        content_rowid='rowid',
+        tokenize='trigram'
+    )
+"""
+
+_COLUMNS: Final[str] = ", ".join(FTS_COLUMNS)
+_NEW_VALUES: Final[str] = ", ".join(f"new.{column}" for column in FTS_COLUMNS)
+_OLD_VALUES: Final[str] = ", ".join(f"old.{column}" for column in FTS_COLUMNS)
+
+_TRIGGERS: Final[dict[str, str]] = {
+    f"{FTS_TABLE}_ai": f"""
+        CREATE TRIGGER {FTS_TABLE}_ai AFTER INSERT ON normalized_webtoon BEGIN
+            INSERT INTO {FTS_TABLE}(rowid, {_COLUMNS})
+            VALUES (new.rowid, {_NEW_VALUES});
+        END
+    """,
+    f"{FTS_TABLE}_ad": f"""
+        CREATE TRIGGER {FTS_TABLE}_ad AFTER DELETE ON normalized_webtoon BEGIN
+            INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {_COLUMNS})
+            VALUES ('delete', old.rowid, {_OLD_VALUES});
+        END
+    """,
+    f"{FTS_TABLE}_au": f"""
+        CREATE TRIGGER {FTS_TABLE}_au AFTER UPDATE ON normalized_webtoon BEGIN
+            INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {_COLUMNS})
+            VALUES ('delete', old.rowid, {_OLD_VALUES});
+            INSERT INTO {FTS_TABLE}(rowid, {_COLUMNS})
+            VALUES (new.rowid, {_NEW_VALUES});
+        END
+    """,
+}
+
+
+def search_index_ddl() -> list[str]:
+    """DDL owned by :func:`ensure_search_index` (part of the startup schema fingerprint)."""
+
+    return [_FTS_DDL, *_TRIGGERS.values()]
+
+
+def ensure_search_index(conn: sqlite3.Connection) -> None:
+    """Create the FTS table and sync triggers, rebuilding the index when needed.
+
+    ``normalized_webtoon`` is sometimes replaced wholesale by the catalog import,
+    which drops our triggers with it; in that case the index is rebuilt from
+    scratch so it matches the new table. The index is also rebuilt when its
+    column list changed or its rowids no longer match the catalog's.
+    """
+
+    has_catalog = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'normalized_webtoon'"
+    ).fetchone()
+    if not has_catalog:
+        logger.warning("normalized_webtoon is missing; skipping search index setup")
+        return
+
+    columns = [row[0] for row in conn.execute(f"SELECT name FROM pragma_table_info('{FTS_TABLE}')")]
+    if columns and tuple(columns) != FTS_COLUMNS:
+        # An index built with another column list is dropped together with its triggers.
+        for name in _TRIGGERS:
+            conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+        conn.execute(f"DROP TABLE {FTS_TABLE}")
+    conn.execute(_FTS_DDL)
+
+    existing = {
+        row[0]
+        for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'trigger' AND tbl_name = 'normalized_webtoon'"
+        )
+    }
+    missing = [name for name in _TRIGGERS if name not in existing]
+    for name in missing:
+        conn.execute(_TRIGGERS[name])
+
+    if missing or not search_index_matches_content(conn):
+        rebuild_search_index(conn)
+    conn.commit()
+
+
+def search_index_matches_content(conn: sqlite3.Connection) -> bool:
+    """Whether every index entry still points at the ``normalized_webtoon`` row it was built from.
+
+    The index is keyed on the catalog's implicit ``rowid`` (the table has no
+    ``INTEGER PRIMARY KEY``), which ``VACUUM`` may renumber. ``VACUUM`` also
+    moves the schema cookie, so the next startup takes the full path and this
+    check runs.
+    """
+
+    try:
+        conn.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rank) VALUES ('integrity-check', 1)")
+    except sqlite3.DatabaseError as exc:
+        logger.warning("Search index does not match normalized_webtoon (%s); rebuilding", exc)
+        return False
+    return True
+
+
+def rebuild_search_index(conn: sqlite3.Connection) -> None:
+    """Repopulate the FTS index from the current ``normalized_webtoon`` rows."""
+
+    conn.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+    conn.commit()
+
+
+def to_match_expression(q: str) -> str:
+    """Quote the raw query as a single FTS5 phrase (substring match for trigram)."""
+
+    return '"' + q.replace('"', '""') + '"'
+
+
+def fts_query(
+    *, q: str, day: str | None, limit: int, offset: int
+) -> tuple[str, list]:
+    """Build the bm25-ranked FTS statement and its parameters.
+
+    ``CROSS JOIN`` pins the FTS match as the outer loop: with statistics from
+    a smaller catalog the planner would otherwise scan ``normalized_webtoon``
+    and probe the index once per title.
+    """
+
+    query = f"""
+        SELECT {_SELECT_COLUMNS}
+        FROM {FTS_TABLE} AS f
+        CROSS JOIN normalized_webtoon AS w ON w.rowid = f.rowid
+        WHERE {FTS_TABLE} MATCH ?
+    """
+    params: list = [to_match_expression(q)]
+    if day is not None:
+        query += " AND w.updateDays = ?"
+        params.append(day)
+    query += f" ORDER BY bm25({FTS_TABLE}, {_BM25_WEIGHTS}) LIMIT ? OFFSET ?"
+    params.extend((limit, offset))
+    return query, params
+
+
+def search_fts(
+    cursor: sqlite3.Cursor,
+    *,
+    q: str,
+    day: str | None,
+    limit: int,
+    offset: int,
+) -> list[sqlite3.Row]:
+    """Return catalog rows matching ``q`` ranked by bm25."""
+
+    return cursor.execute(*fts_query(q=q, day=day, limit=limit, offset=offset)).fetchall()
+
+
+def like_query(
+    *, q: str, day: str | None, limit: int, offset: int
+) -> tuple[str, list]:
+    """Build the original five-column LIKE statement and its parameters."""
+
+    pattern = f"%{q}%"
+    query = f"""
+        SELECT {_SELECT_COLUMNS}
+        FROM normalized_webtoon AS w
+        WHERE (
+            w.id          LIKE ?
+            OR w.title    LIKE ?
+            OR w.authors  LIKE ?
+            OR w.synopsis LIKE ?
+            OR w.tags     LIKE ?
+        )
+    """
+    params: list = [pattern, pattern, pattern, pattern, pattern]
+    if day is not None:
+        query += " AND w.updateDays = ?"
+        params.append(day)
+    query += " ORDER BY w.id LIMIT ? OFFSET ?"
+    params.extend((limit, offset))
+    return query, params
+
+
+def search_like(
+    cursor: sqlite3.Cursor,
+    *,
+    q: str,
+    day: str | None,
+    limit: int,
+    offset: int,
+) -> list[sqlite3.Row]:
+    """Return catalog rows matching ``q`` with the original five-column LIKE scan."""
+
+    return cursor.execute(*like_query(q=q, day=day, limit=limit, offset=offset)).fetchall()
+
+
+def search_catalog(
+    cursor: sqlite3.Cursor,
+    *,
+    q: str,
+    day: str | None,
+    limit: int,
+    offset: int,
+    mode: SearchMode = DEFAULT_SEARCH_MODE,
+) -> tuple[SearchMode, list[sqlite3.Row]]:
+    """Search the catalog, falling back to LIKE when FTS cannot serve the query."""
+
+    if mode == "fts" and len(q) >= MIN_FTS_QUERY_LENGTH:
+        try:
+            return "fts", search_fts(cursor, q=q, day=day, limit=limit, offset=offset)
+        except sqlite3.OperationalError as exc:
+            logger.warning("FTS search failed (%s); falling back to LIKE scan", exc)
+
+    return "like", search_like(cursor, q=q, day=day, limit=limit, offset=offset)
@@ -0,0 +1,231 @@
+"""Precomputed "similar webtoons" lists and the artifact they are stored in.
+
+The neighbours of every title are computed ahead of time by
+``webtoon.services.similar_vectors`` and saved as an ``.npz`` artifact:
+
+    version     catalog snapshot version the lists were built from
+    ids         every webtoon id, in ``sorted_ids`` order
+    neighbors   int32[ids, k]    row numbers into ``ids``, best first, -1 padded
+    scores      float16[ids, k]  similarity of each neighbour in [0, 1]
+
+A request is one ``bisect`` over ``ids`` plus reading ``k`` entries. When
+the catalog version moves, the first worker to notice rebuilds the
+artifact in a background thread (other workers wait on a file lock and load
+the result) and the previous lists keep being served until then.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Final, Optional
+
+from webtoon.database import DB_PATH
+from webtoon.services.catalog import (
+    CATALOG_CHECK_INTERVAL,
+    CATALOG_COLUMNS,
+    CatalogSnapshot,
+    build_catalog_data,
+    read_catalog_rows,
+)
+from webtoon.services.catalog_file import build_lock, file_key
+
+logger = logging.getLogger(__name__)
+
+SIMILAR_FILE_PATH: Final[str] = os.getenv("WEBTOON_SIMILAR_FILE", f"{DB_PATH}.similar.npz")
+SIMILAR_TOP_K: Final[int] = int(os.getenv("WEBTOON_SIMILAR_TOP_K", "20"))
+SIMILAR_CHUNK_SIZE: Final[int] = int(os.getenv("WEBTOON_SIMILAR_CHUNK_SIZE", "256"))
+# 줄거리 n-gram 어휘 상한 (문서 빈도가 높은 순으로 남긴다). 0 이면 제한 없음.
+SIMILAR_MAX_NGRAMS: Final[int] = int(os.getenv("WEBTOON_SIMILAR_MAX_NGRAMS", "8192"))
+# 카탈로그가 바뀌면 워커가 백그라운드에서 이웃 목록을 다시 만든다.
+SIMILAR_AUTO_BUILD: Final[bool] = os.getenv("WEBTOON_SIMILAR_AUTO_BUILD", "1") == "1"
+
+
+class SimilarIndex:
+    """Neighbour lists of one artifact."""
+
+    __slots__ = ("version", "built_at", "file_key", "ids", "_neighbors", "_scores")
+
+    def __init__(
+        self, version: str, built_at: float, file_key: Optional[tuple], ids: list[str], neighbors: Any, scores: Any
+    ) -> None:
+        self.version = version
+        self.built_at = built_at
+        self.file_key = file_key
+        self.ids = ids
+        self._neighbors = neighbors
+        self._scores = scores
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def neighbors(self, webtoon_id: str, limit: int) -> list[tuple[str, float]]:
+        """Return up to ``limit`` ``(webtoon_id, score)`` pairs, most similar first."""
+
+        rank = bisect_left(self.ids, webtoon_id)
+        if rank == len(self.ids) or self.ids[rank] != webtoon_id:
+            return []
+        result = []
+        for position, score in zip(self._neighbors[rank, :limit].tolist(), self._scores[rank, :limit].tolist()):
+            if position < 0:
+                break
+            result.append((self.ids[position], round(score, 3)))
+        return result
+
+
+def build_similar_file(
+    path: str,
+    catalog: CatalogSnapshot,
+    *,
+    top_k: int = SIMILAR_TOP_K,
+    chunk_size: int = SIMILAR_CHUNK_SIZE,
+    max_ngrams: int = SIMILAR_MAX_NGRAMS,
+) -> int:
+    """Compute the neighbour lists of ``catalog`` and write them to ``path`` atomically.
+
+    Returns the number of titles.
+    """
+
+    import numpy as np
+
+    from webtoon.services.similar_vectors import term_matrix, top_k_neighbors
+
+    started = time.perf_counter()
+    rows = catalog.sorted_rows()
+    tags, authors, synopsis = (CATALOG_COLUMNS.index(column) for column in ("tags", "authors", "synopsis"))
+    matrix = term_matrix(
+        [row[tags] for row in rows],
+        [row[authors] for row in rows],
+        [row[synopsis] for row in rows],
+        max_ngrams=max_ngrams,
+    )
+    result = top_k_neighbors(matrix, top_k, chunk_size=chunk_size)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    tmp_path = os.path.join(directory, f".{os.path.basename(path)}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as fh:
+        np.savez(
+            fh,
+            version=np.array(catalog.version),
+            built_at=np.array(time.time()),
+            ids=np.array(list(catalog.sorted_ids), dtype=str),
+            neighbors=result.neighbors,
+            scores=result.scores.astype(np.float16),
+        )
+        fh.flush()
+        os.fsync(fh.fileno())
+    os.replace(tmp_path, path)
+    logger.info(
+        "Built similar webtoons %s (%d titles, %d terms, k=%d) in %.1f ms",
+        catalog.version[:12],
+        len(rows),
+        matrix.width,
+        result.neighbors.shape[1],
+        (time.perf_counter() - started) * 1000,
+    )
+    return len(rows)
+
+
+def load_similar_index(path: str) -> SimilarIndex:
+    import numpy as np
+
+    key = file_key(path)
+    with np.load(path) as artifact:
+        return SimilarIndex(
+            str(artifact["version"]),
+            float(artifact["built_at"]),
+            key,
+            artifact["ids"].tolist(),
+            artifact["neighbors"],
+            artifact["scores"],
+        )
+
+
+def _read_index(path: str) -> Optional[SimilarIndex]:
+    if not os.path.exists(path):
+        return None
+    try:
+        return load_similar_index(path)
+    except Exception as exc:  # a truncated or foreign file is rebuilt like a stale one
+        logger.warning("Ignoring unreadable similar webtoons file %s: %s", path, exc)
+        return None
+
+
+def build_similar_from_db(conn: Any, path: str, **options: Any) -> int:
+    """Build the artifact straight from ``normalized_webtoon`` (for the CLI)."""
+
+    catalog = CatalogSnapshot(build_catalog_data(read_catalog_rows(conn)), loaded_at=time.time())
+    return build_similar_file(path, catalog, **options)
+
+
+class SimilarStore:
+    """Holds the loaded :class:`SimilarIndex` and keeps it in step with the catalog.
+
+    While the artifact is missing or older than the catalog, the file is
+    checked at most once per ``check_interval`` seconds and one background
+    build per catalog version is started (with ``auto_build``).
+    """
+
+    def __init__(
+        self,
+        path: str = SIMILAR_FILE_PATH,
+        *,
+        auto_build: bool = SIMILAR_AUTO_BUILD,
+        check_interval: float = CATALOG_CHECK_INTERVAL,
+    ) -> None:
+        self._path = path
+        self._auto_build = auto_build
+        self._check_interval = check_interval
+        self._lock = threading.Lock()
+        self._index: Optional[SimilarIndex] = None
+        self._checked_at = 0.0
+        self._build_started_for: Optional[str] = None
+
+    def get(self, catalog: CatalogSnapshot) -> Optional[SimilarIndex]:
+        """Return the lists for ``catalog``, or the latest older ones while a build runs."""
+
+        index = self._index
+        if index is not None and index.version == catalog.version:
+            return index
+        if time.monotonic() - self._checked_at < self._check_interval:
+            return index
+
+        with self._lock:
+            if time.monotonic() - self._checked_at >= self._check_interval:
+                self._refresh(catalog)
+                self._checked_at = time.monotonic()
+            return self._index
+
+    def _refresh(self, catalog: CatalogSnapshot) -> None:
+        index = self._index
+        if index is None or index.version != catalog.version:
+            key = file_key(self._path)
+            if key is not None and key != (index.file_key if index else None):
+                loaded = _read_index(self._path)
+                if loaded is not None:
+                    self._index = index = loaded
+        if (index is None or index.version != catalog.version) and self._auto_build:
+            if self._build_started_for != catalog.version:
+                self._build_started_for = catalog.version
+                threading.Thread(
+                    target=self._build, args=(catalog,), name="similar-build", daemon=True
+                ).start()
+
+    def _build(self, catalog: CatalogSnapshot) -> None:
+        try:
+            with build_lock(self._path):
+                # Another worker may have built it while this one waited for the lock.
+                current = _read_index(self._path)
+                if current is None or current.version != catalog.version:
+                    build_similar_file(self._path, catalog)
+        except Exception:
+            logger.exception("Building similar webtoons failed")
+        finally:
+            # 다음 get() 에서 새 파일을 바로 읽는다.
+            self._checked_at = 0.0
+
+
+similar_store = SimilarStore()
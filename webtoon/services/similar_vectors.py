@@ -0,0 +1,239 @@
+"""TF-IDF vectors and precomputed top-k neighbours for the catalog (NumPy).
+
+Every title becomes one sparse vector with three blocks: its tags, its
+authors and the character n-grams of its synopsis. Character n-grams (2-3
+syllables, within a word) match Korean inflections and compounds without a
+morphological analyzer: "레벨업" and "레벨업한" share "레벨" and "벨업".
+Each block is TF-IDF weighted and L2-normalized separately, then scaled by
+the square root of its weight in ``FIELD_WEIGHTS``. The dot product of two
+vectors is therefore the weighted sum of the per-field cosine similarities,
+in ``[0, 1]``.
+
+Neighbours are found with dense float32 matrix products over tiles of
+``chunk_size`` query rows and ``block_size`` candidate rows, so memory stays
+bounded by the tile sizes. A full query row is kept only for the current
+chunk and cut down to its top ``k`` with ``argpartition``.
+
+Imported lazily by ``webtoon.services.similar`` so API workers only load
+NumPy when they read or build the neighbour artifact.
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+from typing import Final, Iterable, NamedTuple, Sequence
+
+import numpy as np
+
+from webtoon.services.facets import split_values
+
+# 태그가 가장 강한 신호이고, 같은 작가와 줄거리 n-gram 이 그 뒤를 잇는다.
+FIELD_WEIGHTS: Final[dict[str, float]] = {"tags": 0.5, "authors": 0.2, "synopsis": 0.3}
+NGRAM_SIZES: Final[tuple[int, ...]] = (2, 3)
+
+_WORD = re.compile(r"\w+")
+_AUTHOR_SPLIT = re.compile(r"\s*[,/·]\s*")
+# Code points fit in 21 bits, so an n-gram of up to three characters packs into one uint64.
+_CODE_BITS: Final[int] = 21
+_SPACE: Final[int] = ord(" ")
+
+
+class TermMatrix(NamedTuple):
+    """Row-normalized CSR matrix; only columns shared by two or more rows are kept."""
+
+    indptr: np.ndarray
+    indices: np.ndarray
+    data: np.ndarray
+    width: int
+
+    @property
+    def rows(self) -> int:
+        return len(self.indptr) - 1
+
+
+class Neighbors(NamedTuple):
+    """``neighbors[i]`` lists row numbers most similar to row ``i``, best first (``-1`` pads)."""
+
+    neighbors: np.ndarray
+    scores: np.ndarray
+
+
+def _normalize(value: str) -> str:
+    return unicodedata.normalize("NFC", value).casefold()
+
+
+def _token_pairs(values: Sequence[Iterable[str]]) -> tuple[np.ndarray, np.ndarray, int]:
+    """``(row, term)`` pairs of whole-token values such as tags and author names."""
+
+    vocabulary: dict[str, int] = {}
+    rows: list[int] = []
+    terms: list[int] = []
+    for row, tokens in enumerate(values):
+        for token in tokens:
+            rows.append(row)
+            terms.append(vocabulary.setdefault(token, len(vocabulary)))
+    return np.array(rows, dtype=np.int64), np.array(terms, dtype=np.int64), len(vocabulary)
+
+
+def _ngram_pairs(texts: Sequence[str], sizes: Sequence[int] = NGRAM_SIZES) -> tuple[np.ndarray, np.ndarray, int]:
+    """``(row, term)`` pairs of the character n-grams of every word in ``texts``.
+
+    Words are padded with a space on both sides (" 나 혼자 ") and an n-gram
+    may start or end on that space but never spans two words. All texts are
+    laid out in one code point array separated by ``\\0``, so the n-grams of
+    the whole catalog are packed and counted without a Python loop.
+    """
+
+    padded = [" " + " ".join(_WORD.findall(_normalize(text or ""))) + " " for text in texts]
+    codes = np.frombuffer("\0".join(padded).encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+    row_of = np.cumsum(codes == 0)
+
+    rows: list[np.ndarray] = []
+    keys: list[np.ndarray] = []
+    for size in sizes:
+        count = len(codes) - size + 1
+        if count <= 0:
+            continue
+        window = [codes[offset : offset + count] for offset in range(size)]
+        valid = np.ones(count, dtype=bool)
+        for part in window:
+            valid &= part != 0
+        for part in window[1:-1]:
+            valid &= part != _SPACE
+        # 공백만으로 된 n-gram(빈 줄거리)은 버린다.
+        valid &= np.logical_or.reduce([part != _SPACE for part in window])
+        key = np.zeros(count, dtype=np.uint64)
+        for part in window:
+            key = (key << np.uint64(_CODE_BITS)) | part
+        # A trigram's first code point is never 0, so trigram keys never collide with bigram keys.
+        rows.append(row_of[:count][valid])
+        keys.append(key[valid])
+    if not keys:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), 0
+
+    vocabulary, terms = np.unique(np.concatenate(keys), return_inverse=True)
+    return np.concatenate(rows).astype(np.int64), terms.ravel().astype(np.int64), len(vocabulary)
+
+
+def _tfidf(
+    rows: np.ndarray, terms: np.ndarray, n_rows: int, n_terms: int, weight: float, max_terms: int = 0
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Sublinear TF-IDF of one field, L2-normalized per row and scaled by ``sqrt(weight)``.
+
+    Returns ``(row, term, value)`` for the terms that appear in at least two
+    rows (others cannot add to any similarity); with ``max_terms`` only that
+    many of the most frequent ones are kept. Norms include every term.
+    """
+
+    if not n_terms:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty, np.zeros(0, dtype=np.float64)
+    pairs, counts = np.unique(rows * n_terms + terms, return_counts=True)
+    rows, terms = np.divmod(pairs, n_terms)
+    df = np.bincount(terms, minlength=n_terms)
+    idf = np.log((1 + n_rows) / (1 + df)) + 1
+    values = (1 + np.log(counts)) * idf[terms]
+    norms = np.sqrt(np.bincount(rows, weights=values * values, minlength=n_rows))
+    values *= np.sqrt(weight) / norms[rows]
+
+    shared = df >= 2
+    if max_terms and shared.sum() > max_terms:
+        ranked = np.argsort(-df, kind="stable")[:max_terms]
+        shared = np.zeros(n_terms, dtype=bool)
+        shared[ranked] = True
+    keep = shared[terms]
+    return rows[keep], terms[keep], values[keep]
+
+
+def term_matrix(
+    tags: Sequence[str],
+    authors: Sequence[str],
+    synopses: Sequence[str],
+    *,
+    max_ngrams: int = 0,
+) -> TermMatrix:
+    """Build the weighted TF-IDF matrix of the catalog columns (one row per title)."""
+
+    n_rows = len(tags)
+    fields = {
+        "tags": _token_pairs([[_normalize(tag) for tag in split_values(raw)] for raw in tags]),
+        "authors": _token_pairs(
+            [
+                [_normalize(name) for name in _AUTHOR_SPLIT.split((raw or "").strip()) if name]
+                for raw in authors
+            ]
+        ),
+        "synopsis": _ngram_pairs(synopses),
+    }
+
+    rows: list[np.ndarray] = []
+    columns: list[np.ndarray] = []
+    values: list[np.ndarray] = []
+    offset = 0
+    for name, (field_rows, field_terms, n_terms) in fields.items():
+        limit = max_ngrams if name == "synopsis" else 0
+        field_rows, field_terms, field_values = _tfidf(
+            field_rows, field_terms, n_rows, n_terms, FIELD_WEIGHTS[name], limit
+        )
+        rows.append(field_rows)
+        columns.append(field_terms + offset)
+        values.append(field_values)
+        offset += n_terms
+
+    row = np.concatenate(rows)
+    # Renumber the kept columns densely so tiles are only as wide as the shared vocabulary.
+    kept, column = np.unique(np.concatenate(columns), return_inverse=True)
+    order = np.argsort(row, kind="stable")
+    indptr = np.zeros(n_rows + 1, dtype=np.int64)
+    np.cumsum(np.bincount(row, minlength=n_rows), out=indptr[1:])
+    return TermMatrix(
+        indptr,
+        column.ravel()[order].astype(np.int64),
+        np.concatenate(values)[order].astype(np.float32),
+        len(kept),
+    )
+
+
+def _dense(matrix: TermMatrix, start: int, stop: int) -> np.ndarray:
+    tile = np.zeros((stop - start, matrix.width), dtype=np.float32)
+    lo, hi = matrix.indptr[start], matrix.indptr[stop]
+    local_rows = np.repeat(np.arange(stop - start), np.diff(matrix.indptr[start : stop + 1]))
+    tile[local_rows, matrix.indices[lo:hi]] = matrix.data[lo:hi]
+    return tile
+
+
+def top_k_neighbors(matrix: TermMatrix, k: int, *, chunk_size: int = 256, block_size: int = 2048) -> Neighbors:
+    """Return the ``k`` most similar other rows of every row, best first.
+
+    Ties are broken by row number. Rows sharing no term with a row are never
+    listed, so short lists are padded with ``-1`` and a score of 0.
+    """
+
+    n_rows = matrix.rows
+    k = max(0, min(k, n_rows - 1))
+    neighbors = np.full((n_rows, k), -1, dtype=np.int32)
+    scores = np.zeros((n_rows, k), dtype=np.float32)
+    if not k or not matrix.width:
+        return Neighbors(neighbors, scores)
+
+    for start in range(0, n_rows, chunk_size):
+        stop = min(n_rows, start + chunk_size)
+        query = _dense(matrix, start, stop)
+        similarity = np.empty((stop - start, n_rows), dtype=np.float32)
+        for block in range(0, n_rows, block_size):
+            block_stop = min(n_rows, block + block_size)
+            np.matmul(query, _dense(matrix, block, block_stop).T, out=similarity[:, block:block_stop])
+        local = np.arange(stop - start)
+        # 자기 자신은 이웃에서 제외한다.
+        similarity[local, local + start] = -1
+
+        candidates = np.argpartition(-similarity, k - 1, axis=1)[:, :k]
+        candidate_scores = np.take_along_axis(similarity, candidates, axis=1)
+        order = np.lexsort((candidates, -candidate_scores), axis=1)
+        best = np.take_along_axis(candidates, order, axis=1)
+        best_scores = np.take_along_axis(candidate_scores, order, axis=1)
+        matched = best_scores > 1e-6
+        neighbors[start:stop] = np.where(matched, best, -1)
+        scores[start:stop] = np.where(matched, best_scores, 0)
+    return Neighbors(neighbors, scores)
@@ -0,0 +1,130 @@
+"""Typeahead index over catalog titles and authors.
+
+Keys are kept in sorted arrays, so a prefix lookup is one ``bisect`` plus a
+scan over the matching run. Every key is also indexed by its Hangul
+choseong (initial consonants), so "ㄴㅎㅈ" finds "나 혼자만 레벨업".
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+from bisect import bisect_left
+from typing import Final, Iterable, Iterator, Literal, NamedTuple, Sequence
+
+MatchField = Literal["title", "author"]
+
+CHOSEONG: Final[str] = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_CHOSEONG_SET: Final[frozenset[str]] = frozenset(CHOSEONG)
+_HANGUL_FIRST: Final[int] = 0xAC00
+_HANGUL_LAST: Final[int] = 0xD7A3
+# 초성 하나에 딸린 (중성 21 x 종성 28) 음절 수
+_SYLLABLES_PER_CHOSEONG: Final[int] = 588
+
+_WORD_SPLIT = re.compile(r"\s+")
+_AUTHOR_SPLIT = re.compile(r"\s*[,/·]\s*")
+
+# Title prefixes rank above prefixes of later title words, which rank above authors.
+_TITLE_PREFIX, _TITLE_WORD, _AUTHOR = 0, 1, 2
+_KIND_FIELDS: Final[tuple[MatchField, ...]] = ("title", "title", "author")
+
+
+def normalize(value: str) -> str:
+    """Case-fold and drop whitespace so "나 혼자" and "나혼자" match alike."""
+
+    return "".join(unicodedata.normalize("NFC", value).casefold().split())
+
+
+def to_choseong(value: str) -> str:
+    """Replace every precomposed Hangul syllable with its initial consonant."""
+
+    chars = []
+    for char in value:
+        code = ord(char)
+        if _HANGUL_FIRST <= code <= _HANGUL_LAST:
+            chars.append(CHOSEONG[(code - _HANGUL_FIRST) // _SYLLABLES_PER_CHOSEONG])
+        else:
+            chars.append(char)
+    return "".join(chars)
+
+
+def is_choseong_query(value: str) -> bool:
+    """True when the query contains a bare initial consonant (e.g. "ㄴㅎ", "나ㅎ")."""
+
+    return any(char in _CHOSEONG_SET for char in value)
+
+
+class Suggestion(NamedTuple):
+    position: int
+    matched: MatchField
+
+
+class _PrefixArray:
+    __slots__ = ("_keys", "_positions")
+
+    def __init__(self, entries: Iterable[tuple[str, int]]) -> None:
+        pairs = sorted(set(entries))
+        self._keys = [key for key, _ in pairs]
+        self._positions = [position for _, position in pairs]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def matches(self, prefix: str) -> Iterator[int]:
+        keys = self._keys
+        index = bisect_left(keys, prefix)
+        while index < len(keys) and keys[index].startswith(prefix):
+            yield self._positions[index]
+            index += 1
+
+
+class SuggestIndex:
+    """Prefix index over titles, title words and authors of a catalog snapshot."""
+
+    __slots__ = ("_text", "_choseong")
+
+    def __init__(self, titles: Sequence[str], authors: Sequence[str]) -> None:
+        entries: list[list[tuple[str, int]]] = [[], [], []]
+        for position, title in enumerate(titles):
+            words = [normalize(word) for word in _WORD_SPLIT.split(title or "") if word]
+            for start in range(len(words)):
+                key = "".join(words[start:])
+                if key:
+                    entries[_TITLE_PREFIX if start == 0 else _TITLE_WORD].append((key, position))
+        for position, value in enumerate(authors):
+            for author in _AUTHOR_SPLIT.split(value or ""):
+                key = normalize(author)
+                if key:
+                    entries[_AUTHOR].append((key, position))
+
+        self._text = tuple(_PrefixArray(kind) for kind in entries)
+        self._choseong = tuple(
+            _PrefixArray((to_choseong(key), position) for key, position in kind)
+            for kind in entries
+        )
+
+    def __len__(self) -> int:
+        return sum(len(array) for array in self._text)
+
+    def suggest(self, query: str, limit: int) -> list[Suggestion]:
+        """Return up to ``limit`` catalog positions whose keys start with ``query``."""
+
+        prefix = normalize(query)
+        if not prefix or limit <= 0:
+            return []
+        arrays = self._text
+        if is_choseong_query(prefix):
+            prefix = to_choseong(prefix)
+            arrays = self._choseong
+
+        seen: set[int] = set()
+        results: list[Suggestion] = []
+        for kind, array in enumerate(arrays):
+            for position in array.matches(prefix):
+                if position in seen:
+                    continue
+                seen.add(position)
+                results.append(Suggestion(position, _KIND_FIELDS[kind]))
+                if len(results) == limit:
+                    return results
+        return results
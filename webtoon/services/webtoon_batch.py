@@ -0,0 +1,61 @@
+"""Multi-id catalog lookups joined with per-title rating stats."""
+
+from __future__ import annotations
+
+import sqlite3
+from typing import Final, Iterable, NamedTuple, Sequence
+
+from webtoon.models.webtoon_rating_stats import RATING_SCALE
+from webtoon.responses import dumps
+from webtoon.services.catalog import CatalogSnapshot
+
+# SQLite 변수 개수 제한(기본 32766)보다 충분히 작게 유지한다.
+MAX_BATCH_IDS: Final[int] = 500
+
+
+class BatchLookup(NamedTuple):
+    fragments: list[bytes]
+    missing: list[str]
+
+
+def rating_stats_query(webtoon_ids: Sequence[str]) -> tuple[str, list[str]]:
+    """Build the single primary-key ``IN`` lookup for ``webtoon_ids``."""
+
+    placeholders = ", ".join("?" for _ in webtoon_ids)
+    sql = (
+        "SELECT webtoon_id, rating_sum, review_count FROM webtoon_rating_stats "
+        f"WHERE webtoon_id IN ({placeholders})"
+    )
+    return sql, list(webtoon_ids)
+
+
+def _with_stats(fragment: bytes, rating_sum: int, review_count: int) -> bytes:
+    average = round(rating_sum / RATING_SCALE / review_count, 4) if review_count else 0.0
+    # The summary fragment is a JSON object, so the stats are spliced in before its "}".
+    extra = dumps({"average_rating": average, "review_count": review_count})
+    return b"".join((fragment[:-1], b",", extra[1:]))
+
+
+def lookup_webtoons(
+    catalog: CatalogSnapshot, cursor: sqlite3.Cursor, webtoon_ids: Iterable[str]
+) -> BatchLookup:
+    """Return summary fragments with rating stats in request order.
+
+    Repeated ids are answered once. Catalog rows come from the in-memory
+    snapshot; the stats of every found id are read with one query.
+    """
+
+    requested = list(dict.fromkeys(webtoon_ids))
+    found = [webtoon_id for webtoon_id in requested if webtoon_id in catalog]
+    missing = [webtoon_id for webtoon_id in requested if webtoon_id not in catalog]
+
+    stats: dict[str, tuple[int, int]] = {}
+    if found:
+        for webtoon_id, rating_sum, review_count in cursor.execute(*rating_stats_query(found)):
+            stats[webtoon_id] = (rating_sum, review_count)
+
+    fragments = [
+        _with_stats(catalog.summary_fragment(webtoon_id), *stats.get(webtoon_id, (0, 0)))
+        for webtoon_id in found
+    ]
+    return BatchLookup(fragments, missing)
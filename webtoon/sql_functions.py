@@ -0,0 +1,29 @@
+"""Application SQL functions registered on every SQLAlchemy SQLite connection."""
+
+from __future__ import annotations
+
+import calendar
+import os
+import time
+from typing import Any, Final, Optional
+
+# Hacker News style decay: (likes + 1) / (age_hours + 2) ** gravity.
+HOT_GRAVITY: Final[float] = float(os.getenv("WEBTOON_HOT_GRAVITY", "1.8"))
+# Score of a brand-new review (no likes, zero age); used as the column default.
+INITIAL_HOT_SCORE: Final[float] = 1 / 2**HOT_GRAVITY
+
+_TIMESTAMP_FORMAT: Final[str] = "%Y-%m-%d %H:%M:%S"
+
+
+def hot_score(likes: Optional[int], created_at: Optional[str], now: float) -> float:
+    """Return the decayed hot score of a review created at ``created_at`` (UTC text)."""
+
+    if created_at is None:
+        return 0.0
+    created = calendar.timegm(time.strptime(str(created_at)[:19], _TIMESTAMP_FORMAT))
+    age_hours = max(float(now) - created, 0) / 3600
+    return ((likes or 0) + 1) / (age_hours + 2) ** HOT_GRAVITY
+
+
+def register_functions(dbapi_connection: Any) -> None:
+    dbapi_connection.create_function("hot_score", 3, hot_score, deterministic=True)
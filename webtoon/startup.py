@@ -0,0 +1,215 @@
+"""Worker startup: schema check, background prewarm and readiness state.
+
+A cold start used to run ``create_all``, every migration check and the FTS /
+revision trigger checks on each boot. The schema is now fingerprinted (ORM
+DDL, migration version and the raw-SQL DDL of the catalog services) and
+stored in ``schema_state`` together with SQLite's schema cookie, so a boot
+against an unchanged database reads one row instead. Any DDL made by
+someone else (a catalog import replacing ``normalized_webtoon``, a manual
+index) moves the cookie and forces the full path on the next start.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Final, Iterator, Optional
+
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from webtoon.database import DB_PATH, get_db
+from webtoon.db import Base, engine, init_db
+from webtoon.db.migrations import SCHEMA_VERSION
+from webtoon.metrics import STARTUP_PHASE
+from webtoon.services.catalog import (
+    CATALOG_FILE_PATH,
+    catalog_index_ddl,
+    catalog_revision_ddl,
+    catalog_store,
+    ensure_catalog_indexes,
+    ensure_catalog_revision,
+)
+from webtoon.services.search_index import ensure_search_index, search_index_ddl
+from webtoon.services.similar import similar_store
+
+logger = logging.getLogger(__name__)
+
+# 저장된 스키마 상태가 현재 코드와 일치하면 DDL 을 건너뛴다.
+FAST_START: Final[bool] = os.getenv("WEBTOON_FAST_START", "1") == "1"
+PREWARM: Final[bool] = os.getenv("WEBTOON_PREWARM", "1") == "1"
+PREWARM_PAGE_CACHE_MB: Final[int] = int(os.getenv("WEBTOON_PREWARM_PAGE_CACHE_MB", "256"))
+
+_SCHEMA_STATE_DDL: Final[str] = """
+    CREATE TABLE IF NOT EXISTS schema_state (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        version INTEGER NOT NULL,
+        fingerprint TEXT NOT NULL,
+        schema_cookie INTEGER NOT NULL,
+        updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+
+
+class StartupState:
+    """Phase timings and readiness of this worker, reported by ``/readyz``."""
+
+    def __init__(self) -> None:
+        self.phases: dict[str, float] = {}
+        self.ddl_skipped: Optional[bool] = None
+        self.warmup_error: Optional[str] = None
+        self.schema_ready = threading.Event()
+        self.warm = threading.Event()
+
+    @property
+    def ready(self) -> bool:
+        return self.schema_ready.is_set() and self.warm.is_set()
+
+    def record(self, phase: str, seconds: float) -> None:
+        self.phases[phase] = round(seconds * 1000, 2)
+        STARTUP_PHASE.set(seconds, phase)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "ready": self.ready,
+            "ddl_skipped": self.ddl_skipped,
+            "warmup_error": self.warmup_error,
+            "phases_ms": dict(self.phases),
+        }
+
+
+startup_state = StartupState()
+
+
+def schema_fingerprint() -> str:
+    """Hash of every DDL statement the app would apply to an empty database."""
+
+    # Import models so they are registered with SQLAlchemy's metadata.
+    from webtoon import models  # noqa: F401
+
+    digest = hashlib.sha1(f"migrations:{SCHEMA_VERSION}".encode())
+    for table in Base.metadata.sorted_tables:
+        digest.update(str(CreateTable(table).compile(dialect=engine.dialect)).encode())
+        for index in sorted(table.indexes, key=lambda index: index.name or ""):
+            digest.update(str(CreateIndex(index).compile(dialect=engine.dialect)).encode())
+    for ddl in (*search_index_ddl(), *catalog_revision_ddl(), *catalog_index_ddl(), _SCHEMA_STATE_DDL):
+        digest.update(ddl.encode())
+    return digest.hexdigest()
+
+
+def _schema_cookie(conn: sqlite3.Connection) -> int:
+    return conn.execute("PRAGMA schema_version").fetchone()[0]
+
+
+def _stored_schema_state(conn: sqlite3.Connection) -> Optional[tuple]:
+    try:
+        row = conn.execute(
+            "SELECT version, fingerprint, schema_cookie FROM schema_state WHERE id = 1"
+        ).fetchone()
+    except sqlite3.OperationalError:
+        return None
+    return tuple(row) if row else None
+
+
+def ensure_schema(*, fast: bool = FAST_START) -> bool:
+    """Apply tables, migrations and catalog DDL; return ``False`` if they were skipped.
+
+    With ``fast`` the DDL is skipped when ``schema_state`` records this
+    code's fingerprint and the database's schema cookie has not moved since.
+    """
+
+    with startup_state.phase("db_open"):
+        conn, _ = get_db()
+        fingerprint = schema_fingerprint()
+        current = _stored_schema_state(conn) == (SCHEMA_VERSION, fingerprint, _schema_cookie(conn))
+    try:
+        with startup_state.phase("ddl"):
+            skipped = fast and current
+            if not skipped:
+                init_db()
+                ensure_search_index(conn)
+                ensure_catalog_revision(conn)
+                ensure_catalog_indexes(conn)
+                conn.execute(_SCHEMA_STATE_DDL)
+                # The cookie is read after every DDL above, so it names the resulting schema.
+                conn.execute(
+                    """
+                    INSERT INTO schema_state (id, version, fingerprint, schema_cookie)
+                    VALUES (1, ?, ?, ?)
+                    ON CONFLICT(id) DO UPDATE SET
+                        version = excluded.version,
+                        fingerprint = excluded.fingerprint,
+                        schema_cookie = excluded.schema_cookie,
+                        updated_at = CURRENT_TIMESTAMP
+                    """,
+                    (SCHEMA_VERSION, fingerprint, _schema_cookie(conn)),
+                )
+                conn.commit()
+    finally:
+        conn.close()
+    startup_state.ddl_skipped = skipped
+    startup_state.schema_ready.set()
+    return not skipped
+
+
+def prefetch_file(path: str, max_bytes: int) -> None:
+    """Ask the kernel to read the first ``max_bytes`` of ``path`` into the page cache."""
+
+    if not path or max_bytes <= 0 or not os.path.exists(path):
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        length = min(os.fstat(fd).st_size, max_bytes)
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, length, os.POSIX_FADV_WILLNEED)
+            return
+        while length > 0:
+            chunk = os.read(fd, min(length, 1 << 20))
+            if not chunk:
+                break
+            length -= len(chunk)
+    finally:
+        os.close(fd)
+
+
+def _prewarm() -> None:
+    try:
+        with startup_state.phase("warmup"):
+            with startup_state.phase("warmup_page_cache"):
+                for path in (DB_PATH, CATALOG_FILE_PATH):
+                    prefetch_file(path, PREWARM_PAGE_CACHE_MB * 2**20)
+            with startup_state.phase("warmup_catalog"):
+                snapshot = catalog_store.snapshot()
+            with startup_state.phase("warmup_indexes"):
+                snapshot.suggest_index()
+                snapshot.facet_index()
+                # Loads the neighbour lists (and NumPy) here rather than on the first request.
+                similar_store.get(snapshot)
+    except Exception as exc:
+        # Everything warmed here is also built lazily on first use.
+        logger.exception("Prewarm failed")
+        startup_state.warmup_error = repr(exc)
+    finally:
+        startup_state.warm.set()
+    logger.info("Prewarm finished: %s", {k: v for k, v in startup_state.phases.items() if k.startswith("warmup")})
+
+
+def start_prewarm(*, enabled: bool = PREWARM) -> None:
+    """Load the catalog, its indexes and the DB pages in a background thread."""
+
+    if not enabled:
+        startup_state.warm.set()
+        return
+    threading.Thread(target=_prewarm, name="prewarm", daemon=True).start()